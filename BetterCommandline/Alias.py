@@ -1,9 +1,18 @@
 
-from typing import Optional, Union, Tuple, TypeVar
-from .Colors import ANSI, Colors, Colored
+from typing import Dict, Optional, Union, Tuple, TypeVar
+from .Colors import ANSI, Buffer, Colors, Colored, _into
+from .Style import Style
+from .Terminal import Terminal
+from .Width import Width
 
 chr = TypeVar('chr', bound=str)
 
+
+def _inner_width(banner_width:Optional[int]) -> int:
+    # Width between the brackets: `banner_width` includes them, and `None` leaves the text unpadded.
+    return banner_width-2 if banner_width is not None else 0
+
+
 class Alias:
 
     """
@@ -11,10 +20,11 @@ class Alias:
 
     `Parameters`:
     - `text`        : The main text content of the alias.
-    - `foreground`  : `Foreground` color of the alias, specified as either an RGB `tuple` or a `hexadecimal` color code.
+    - `foreground`  : `Foreground` color of the alias, specified as either an RGB `tuple` or a `hexadecimal` color code,
+                      or a complete `Style` (its background is used when `background` is omitted).
     - `background`  : `Background` color of the alias, specified as either an RGB `tuple` or a `hexadecimal` color code.
     - `banner_width`: `Optional` width for the banner. If not provided, the width will be determined by the length of the text.
-    - `style`       : `Optional` text style for the alias, e.g., bold, italics.
+    - `style`       : `Optional` text style for the alias, e.g., bold, italics, as an `ANSI` code or a `Style`.
     - `badge_sign`  : `Optional` character to represent a badge within the alias.
 
 
@@ -22,6 +32,14 @@ class Alias:
     - `Banner`  : Returns the formatted banner with foreground and background colors, text style, and badge.
     - `Bare`    : Returns the formatted alias without foreground and background colors, only including text and style.
     - `Badge`   : Returns the formatted badge with foreground and background colors, text style, and badge.
+    - `codes`   : Returns the resolved `(foreground, background, style)` escape codes of the `Banner` and `Badge` forms.
+
+    `Methods`:
+    - `encode`      : Returns a rendered form as `bytes`, cached like the `str` forms.
+    - `render_into` : Writes a rendered form straight into a `bytearray` or `memoryview`.
+
+    Rendered forms are cached; assigning `text`, `text_style`, `badge_sign`, `banner_width`, `colors`,
+    `foreground` or `background` invalidates them.
 
     `Example`:
     ```
@@ -29,8 +47,11 @@ class Alias:
     ```
     """
 
-    def __init__(self, text:str, foreground:Union[Tuple[int],str], background:Union[Tuple[int],str],
-                banner_width:Optional[int]=None, style:Optional[str]=None, badge_sign:chr=' ') -> None:
+    __slots__ = ('_text', '_text_style', '_badge_sign', '_colors', '_banner_width', '_width',
+                 '_foreground', '_background', '_style', '_banner', '_bare', '_badge', '_encoded', '_generation')
+
+    def __init__(self, text:str, foreground:Union[Tuple[int],str,Style], background:Union[Tuple[int],str,None]=None,
+                banner_width:Optional[int]=None, style:Union[str,Style,None]=None, badge_sign:chr=' ') -> None:
         """
         Initialize an `Alias` instance with the provided parameters.
 
@@ -38,35 +59,190 @@ class Alias:
 
         `Parameters`:
         - `text`            : The main text content of the alias.
-        - `foreground`      : `Foreground` color of the alias, specified as either an RGB `tuple` or a `hexadecimal` color code.
+        - `foreground`      : `Foreground` color of the alias, specified as either an RGB `tuple` or a `hexadecimal` color code,
+                              or a complete `Style`.
         - `background`      : `Background` color of the alias, specified as either an RGB `tuple` or a `hexadecimal` color code.
+                              May only be omitted when `foreground` is a `Style`.
         - `banner_width`    : `Optional` width for the banner. If not provided, the width will be determined by the length of the text.
-        - `style`           : `Optional` text style for the alias, e.g., bold, italics.
+        - `style`           : `Optional` text style for the alias, e.g., bold, italics, as an `ANSI` code or a `Style`.
         - `badge_sign`      : `Optional` character to represent a badge within the alias.
         """
 
-        if not isinstance( foreground, str ) or not foreground.startswith('\033'):
+        self._text        :str = text
+        self._text_style  :Union[str,Style] = style if not style==None else ''
+        self._badge_sign  :chr = badge_sign if len(badge_sign)==1 else badge_sign[0]
+        self._colors      :Tuple[Union[Tuple[int],str],Union[Tuple[int],str]] = (foreground, background)
+        self._banner_width:Optional[int] = banner_width
+        self._width       :int = _inner_width( banner_width )
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Resolve the escape codes for the active `Terminal` mode and drop the cached renderings.
+        Called automatically when the mode or any attribute changes.
+        """
+        foreground, background = self._colors
+        style = self._text_style.code if isinstance( self._text_style, Style ) else self._text_style
+        if isinstance( foreground, Style ):
+            base       = foreground
+            foreground = base.foreground if base.foreground is not None else ''
+            if background is None:
+                background = base.background if base.background is not None else ''
+            style = ANSI.combine( Style( attributes=base.attributes ).code, style )
+        elif background is None:
+            raise ValueError('Alias needs a background color unless foreground is a Style')
+        if not isinstance( foreground, str ) or ( foreground and not foreground.startswith('\033') ):
             foreground:str = Colored.Foreground( foreground )
-        if not isinstance( background, str ) or not background.startswith('\033'):
+        if not isinstance( background, str ) or ( background and not background.startswith('\033') ):
             background:str = Colored.Background( background )
-        
-        self.text        :str = text
-        self.text_style  :str = style if not style==None else ''
-        self.badge_sign  :chr = badge_sign if len(badge_sign)==1 else badge_sign[0]
-        self.foreground  :str = foreground
-        self.background  :str = background
-        self.banner_width:int = banner_width-2 if not banner_width==None else 0
-    
+
+        self._foreground :str = foreground
+        self._background :str = background
+        self._style      :str = style
+        self._banner     :Optional[str] = None
+        self._bare       :Optional[str] = None
+        self._badge      :Optional[str] = None
+        self._encoded    :Dict[Tuple[str,str], bytes] = {}
+        self._generation :int = Terminal.generation
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, text:str) -> None:
+        self._text = text
+        self.refresh()
+
+    @property
+    def text_style(self) -> Union[str,Style]:
+        return self._text_style
+
+    @text_style.setter
+    def text_style(self, style:Union[str,Style,None]) -> None:
+        self._text_style = style if not style==None else ''
+        self.refresh()
+
+    @property
+    def badge_sign(self) -> chr:
+        return self._badge_sign
+
+    @badge_sign.setter
+    def badge_sign(self, badge_sign:chr) -> None:
+        self._badge_sign = badge_sign if len(badge_sign)==1 else badge_sign[0]
+        self.refresh()
+
+    @property
+    def banner_width(self) -> Optional[int]:
+        return self._banner_width
+
+    @banner_width.setter
+    def banner_width(self, banner_width:Optional[int]) -> None:
+        self._banner_width = banner_width
+        self._width        = _inner_width( banner_width )
+        self.refresh()
+
+    @property
+    def colors(self) -> Tuple[Union[Tuple[int],str],Union[Tuple[int],str]]:
+        return self._colors
+
+    @colors.setter
+    def colors(self, colors:Tuple[Union[Tuple[int],str],Union[Tuple[int],str]]) -> None:
+        # Validated by `refresh`, which leaves the previous colors and renderings in place when it raises.
+        previous, self._colors = self._colors, tuple( colors )
+        try:
+            self.refresh()
+        except Exception:
+            self._colors = previous
+            raise
+
+    @property
+    def foreground(self) -> str:
+        if self._generation != Terminal.generation:
+            self.refresh()
+        return self._foreground
+
+    @foreground.setter
+    def foreground(self, foreground:Union[Tuple[int],str,Style]) -> None:
+        base, background = self._colors
+        # Replacing the color of a `Style` keeps the background it provided.
+        if background is None and isinstance( base, Style ) and not isinstance( foreground, Style ):
+            background = base.background
+        self.colors = ( foreground, background )
+
+    @property
+    def background(self) -> str:
+        if self._generation != Terminal.generation:
+            self.refresh()
+        return self._background
+
+    @background.setter
+    def background(self, background:Union[Tuple[int],str]) -> None:
+        self.colors = ( self._colors[0], background )
+
+    @property
+    def codes(self) -> Tuple[str,str,str]:
+        if self._generation != Terminal.generation:
+            self.refresh()
+        return self._foreground, self._background, self._style
+
     @property
     def Banner(self) -> str:
-        return f'{self.foreground}{self.background}{self.text_style}[{ self.text.center( self.banner_width ) }]{ANSI.RESET}'
+        if self._generation != Terminal.generation:
+            self.refresh()
+        if self._banner is None:
+            if Terminal.plain:
+                self._banner = f'[{Width.center( self._text, self._width )}]'
+            else:
+                self._banner = f'{ANSI.combine( self._foreground, self._background, self._style )}[{ Width.center( self._text, self._width ) }]{ANSI.RESET}'
+        return self._banner
     
     @property
     def Bare(self)->str:
-        return f'{self.text_style}[{self.text.center( self.banner_width )}]'
+        if self._generation != Terminal.generation:
+            self.refresh()
+        if self._bare is None:
+            if Terminal.plain:
+                self._bare = f'[{Width.center( self._text, self._width )}]'
+            else:
+                self._bare = f'{self._style}[{Width.center( self._text, self._width )}]'
+        return self._bare
     
     @property
     def Badge(self)->str:
-        return f'{self.foreground}{self.background}{self.text_style}[{self.badge_sign}]{ANSI.RESET}'
+        if self._generation != Terminal.generation:
+            self.refresh()
+        if self._badge is None:
+            if Terminal.plain:
+                self._badge = f'[{self._badge_sign}]'
+            else:
+                self._badge = f'{ANSI.combine( self._foreground, self._background, self._style )}[{self._badge_sign}]{ANSI.RESET}'
+        return self._badge
+
+    def encode(self, form:str='Banner', encoding:str='utf-8') -> bytes:
+        """
+        Return the `Banner`, `Badge` or `Bare` form encoded with `encoding`.
+        """
+        if self._generation != Terminal.generation:
+            self.refresh()
+        encoded = self._encoded.get( ( form, encoding ) )
+        if encoded is None:
+            if form not in ('Banner', 'Badge', 'Bare'):
+                raise ValueError(f"Alias does not support {form!r} form, expected one of ('Banner', 'Badge', 'Bare')")
+            encoded = self._encoded[( form, encoding )] = getattr( self, form ).encode( encoding )
+        return encoded
 
+    def render_into(self, target:Buffer, form:str='Banner', offset:Optional[int]=None, encoding:str='utf-8') -> int:
+        """
+        Write the `Banner`, `Badge` or `Bare` form into a caller-supplied buffer.
 
+        `Parameters`:
+        - `target`  : A `bytearray`, or a writable `memoryview` when `offset` is given.
+        - `form`    : Which rendered form to write.
+        - `offset`  : `Optional` position to write at. When omitted, the output is appended to the `bytearray`.
+        - `encoding`: Encoding of the alias text.
+
+        `Returns`:
+        - The position right after the written bytes, i.e. the next `offset`.
+        """
+        return _into( target, offset, self.encode( form, encoding ) )
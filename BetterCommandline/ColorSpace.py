@@ -0,0 +1,330 @@
+import math
+from numbers import Real
+from typing import Any, Callable, Optional, Sequence, Tuple, Union
+
+from .Colors import _normalize
+from .Gradient import _Scalar, _encode, _linear, _linear_to_oklab, _oklab_to_linear
+
+
+RGB    = Tuple[int,int,int]
+Color  = Union[RGB, str, Tuple[float,float,float]]
+Colors = Union[Color, Sequence[Color], Any]
+
+
+def _luminance(m:Any, r:Any, g:Any, b:Any) -> Any:
+    # WCAG relative luminance of sRGB channels in [0, 1].
+    return 0.2126 * _linear( m, r ) + 0.7152 * _linear( m, g ) + 0.0722 * _linear( m, b )
+
+
+def _hue(m:Any, r:Any, g:Any, b:Any) -> Tuple[Any,Any,Any,Any]:
+    # Hue in degrees shared by HSL and HSV, with the channel maximum, minimum and their difference.
+    high  = m.maximum( m.maximum( r, g ), b )
+    low   = m.minimum( m.minimum( r, g ), b )
+    delta = high - low
+    safe  = delta + ( delta == 0 )
+    hue   = m.where( high == r, ( ( g - b ) / safe ) % 6, m.where( high == g, ( b - r ) / safe + 2, ( r - g ) / safe + 4 ) )
+    return m.where( delta == 0, 0.0, hue * 60.0 ), high, low, delta
+
+
+def _rgb_to_hsl(m:Any, r:Any, g:Any, b:Any) -> Tuple[Any,Any,Any]:
+    hue, high, low, delta = _hue( m, r, g, b )
+    lightness = ( high + low ) / 2
+    scale     = 1 - abs( 2 * lightness - 1 )
+    return hue, m.where( delta == 0, 0.0, delta / ( scale + ( scale == 0 ) ) ), lightness
+
+
+def _hsl_to_rgb(m:Any, h:Any, s:Any, l:Any) -> Tuple[Any,Any,Any]:
+    a = s * m.minimum( l, 1 - l )
+    def channel(n:int) -> Any:
+        k = ( n + h / 30 ) % 12
+        return l - a * m.maximum( m.minimum( m.minimum( k - 3, 9 - k ), 1 ), -1 )
+    return channel(0), channel(8), channel(4)
+
+
+def _rgb_to_hsv(m:Any, r:Any, g:Any, b:Any) -> Tuple[Any,Any,Any]:
+    hue, high, _, delta = _hue( m, r, g, b )
+    return hue, m.where( high == 0, 0.0, delta / ( high + ( high == 0 ) ) ), high
+
+
+def _hsv_to_rgb(m:Any, h:Any, s:Any, v:Any) -> Tuple[Any,Any,Any]:
+    def channel(n:int) -> Any:
+        k = ( n + h / 60 ) % 6
+        return v - v * s * m.maximum( m.minimum( m.minimum( k, 4 - k ), 1 ), 0 )
+    return channel(5), channel(3), channel(1)
+
+
+# CIELAB with the D65 white point, as used by sRGB.
+_WHITE   :Tuple[float,float,float] = ( 0.95047, 1.0, 1.08883 )
+_EPSILON :float = 216 / 24389
+_KAPPA   :float = 24389 / 27
+
+
+def _lab_f(m:Any, t:Any) -> Any:
+    return m.where( t > _EPSILON, m.cbrt( t ), ( _KAPPA * t + 16 ) / 116 )
+
+
+def _lab_f_inverse(m:Any, f:Any) -> Any:
+    cube = f * f * f
+    return m.where( cube > _EPSILON, cube, ( 116 * f - 16 ) / _KAPPA )
+
+
+def _rgb_to_lab(m:Any, r:Any, g:Any, b:Any) -> Tuple[Any,Any,Any]:
+    r, g, b = _linear( m, r ), _linear( m, g ), _linear( m, b )
+    x = _lab_f( m, ( 0.4124564 * r + 0.3575761 * g + 0.1804375 * b ) / _WHITE[0] )
+    y = _lab_f( m, ( 0.2126729 * r + 0.7151522 * g + 0.0721750 * b ) / _WHITE[1] )
+    z = _lab_f( m, ( 0.0193339 * r + 0.1191920 * g + 0.9503041 * b ) / _WHITE[2] )
+    return 116 * y - 16, 500 * ( x - y ), 200 * ( y - z )
+
+
+def _lab_to_rgb(m:Any, L:Any, a:Any, b:Any) -> Tuple[Any,Any,Any]:
+    fy = ( L + 16 ) / 116
+    x  = _lab_f_inverse( m, fy + a / 500 ) * _WHITE[0]
+    y  = _lab_f_inverse( m, fy ) * _WHITE[1]
+    z  = _lab_f_inverse( m, fy - b / 200 ) * _WHITE[2]
+    return ( _encode( m,  3.2404542 * x - 1.5371385 * y - 0.4985314 * z ),
+             _encode( m, -0.9692660 * x + 1.8760108 * y + 0.0415560 * z ),
+             _encode( m,  0.0556434 * x - 0.2040259 * y + 1.0572252 * z ) )
+
+
+def _rgb_to_oklab(m:Any, r:Any, g:Any, b:Any) -> Tuple[Any,Any,Any]:
+    return _linear_to_oklab( m, _linear( m, r ), _linear( m, g ), _linear( m, b ) )
+
+
+def _oklab_to_rgb(m:Any, L:Any, a:Any, b:Any) -> Tuple[Any,Any,Any]:
+    r, g, b = _oklab_to_linear( L, a, b )
+    return _encode( m, r ), _encode( m, g ), _encode( m, b )
+
+
+def _oklab_to_oklch(m:Any, L:Any, a:Any, b:Any) -> Tuple[Any,Any,Any]:
+    return L, m.hypot( a, b ), ( m.arctan2( b, a ) * ( 180 / math.pi ) ) % 360
+
+
+def _oklch_to_oklab(m:Any, L:Any, C:Any, h:Any) -> Tuple[Any,Any,Any]:
+    h = h * ( math.pi / 180 )
+    return L, C * m.cos( h ), C * m.sin( h )
+
+
+def _rgb_to_oklch(m:Any, r:Any, g:Any, b:Any) -> Tuple[Any,Any,Any]:
+    return _oklab_to_oklch( m, *_rgb_to_oklab( m, r, g, b ) )
+
+
+def _oklch_to_rgb(m:Any, L:Any, C:Any, h:Any) -> Tuple[Any,Any,Any]:
+    return _oklab_to_rgb( m, *_oklch_to_oklab( m, L, C, h ) )
+
+
+# Conversions between each space and sRGB channels in [0, 1].
+_FROM_RGB:dict = { 'hsl': _rgb_to_hsl, 'hsv': _rgb_to_hsv, 'lab': _rgb_to_lab, 'oklab': _rgb_to_oklab, 'oklch': _rgb_to_oklch }
+_TO_RGB  :dict = { 'hsl': _hsl_to_rgb, 'hsv': _hsv_to_rgb, 'lab': _lab_to_rgb, 'oklab': _oklab_to_rgb, 'oklch': _oklch_to_rgb }
+
+
+def _convert(m:Any, x:Any, y:Any, z:Any, source:str, target:str) -> Tuple[Any,Any,Any]:
+    # RGB results are floats in [0, 255]; rounding is left to the caller.
+    if source == target:
+        return x, y, z
+    if source == 'oklab' and target == 'oklch':
+        return _oklab_to_oklch( m, x, y, z )
+    if source == 'oklch' and target == 'oklab':
+        return _oklch_to_oklab( m, x, y, z )
+    if source == 'rgb':
+        r, g, b = x / 255, y / 255, z / 255
+    else:
+        r, g, b = _TO_RGB[source]( m, x, y, z )
+    if target == 'rgb':
+        return m.clip( r, 0.0, 1.0 ) * 255, m.clip( g, 0.0, 1.0 ) * 255, m.clip( b, 0.0, 1.0 ) * 255
+    return _FROM_RGB[target]( m, r, g, b )
+
+
+def _numpy() -> Optional[Any]:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _single(colors:Any) -> bool:
+    return isinstance( colors, str ) or ( isinstance( colors, ( tuple, list ) ) and len( colors ) == 3 and isinstance( colors[0], Real ) )
+
+
+def _parse(color:Color, source:str) -> Tuple[float,...]:
+    values = _normalize( color if isinstance( color, str ) else tuple( color ), 'ColorSpace' ) if source == 'rgb' else tuple( color )
+    if len( values ) != 3:
+        raise ValueError(f'ColorSpace expects colors with three channels, got {color!r}')
+    return tuple( map( float, values ) )
+
+
+def _map(colors:Colors, source:str, function:Callable[..., Any], rgb:bool) -> Any:
+    # Apply `function(m, x, y, z)` to one color, a sequence of colors or an `...×3` NumPy array, returning the same
+    # form. Sequences are converted in one vectorized call when NumPy is installed, and color by color otherwise.
+    # RGB results (`rgb=True`) are rounded to integers.
+    if _single( colors ):
+        result = function( _Scalar, *_parse( colors, source ) )
+        if isinstance( result, tuple ):
+            return tuple( int( round( channel ) ) for channel in result ) if rgb else result
+        return result
+
+    numpy  = _numpy()
+    array  = type( colors ).__module__ == 'numpy'
+    if numpy is None:
+        return [ _map( color, source, function, rgb ) for color in colors ]
+
+    values = numpy.asarray( colors, dtype=float ) if array else numpy.array( [ _parse( color, source ) for color in colors ], dtype=float ).reshape( -1, 3 )
+    if values.shape[-1:] != (3,):
+        raise ValueError(f'ColorSpace expects an array of shape (..., 3), got {values.shape}')
+    result = function( numpy, values[..., 0], values[..., 1], values[..., 2] )
+    if isinstance( result, tuple ):
+        result = numpy.stack( numpy.broadcast_arrays( *result ), axis=-1 )
+        if rgb:
+            result = numpy.rint( result ).astype( int )
+    if array:
+        return result
+    return [ tuple( row ) for row in result.tolist() ] if result.ndim > 1 else result.tolist()
+
+
+class ColorSpace:
+    """
+    Color-space conversion and color operations over single colors or whole palettes at once.
+
+    Supported spaces (`ColorSpace.SPACES`):
+    - `rgb`     : sRGB channels in `[0, 255]`; also accepts `hexadecimal` color codes.
+    - `hsl`     : hue in degrees, saturation and lightness in `[0, 1]`.
+    - `hsv`     : hue in degrees, saturation and value in `[0, 1]`.
+    - `lab`     : CIELAB (D65), `L` in `[0, 100]`.
+    - `oklab`   : OKLab, `L` in `[0, 1]`.
+    - `oklch`   : OKLab in polar form: lightness, chroma and hue in degrees.
+
+    Every function takes one color (a `tuple` or a `hexadecimal` code), a sequence of colors or an `...×3` NumPy
+    array, and returns the same form. With NumPy installed a sequence is converted in one vectorized call, so a
+    whole theme or the full `Colors` palette costs about as much as a handful of colors; without NumPy the same
+    formulas run color by color. Conversions to `rgb` are rounded and clamped to the sRGB gamut.
+
+    `Example`:
+    ```
+        ColorSpace.convert( Colors.CADETBLUE1, target='oklch' )              # (0.92, 0.09, 204.5)
+        ColorSpace.convert( (210, 0.8, 0.5), source='hsl', target='rgb' )    # (25, 128, 230)
+        oklch = ColorSpace.convert( list( named_colors().values() ), target='oklch' )
+        ColorSpace.lighten( "#cd2626", 0.1 )                                 # (241, 77, 69)
+        ColorSpace.contrast( Colors.WHITE, Colors.FIREBRICK3 )               # 5.38
+        ColorSpace.readable( Colors.FIREBRICK3 )                             # (255, 232, 224)
+    ```
+    """
+
+    SPACES:Tuple[str,...] = ('rgb', 'hsl', 'hsv', 'lab', 'oklab', 'oklch')
+
+    # Lightness steps tried by `readable`.
+    STEPS:int = 101
+
+    @staticmethod
+    def convert(colors:Colors, source:str='rgb', target:str='oklch') -> Any:
+        """
+        Convert colors from `source` to `target` space.
+        """
+        for space in ( source, target ):
+            if space not in ColorSpace.SPACES:
+                raise ValueError(f'ColorSpace does not support {space!r} space, expected one of {ColorSpace.SPACES}')
+        return _map( colors, source, lambda m, x, y, z: _convert( m, x, y, z, source, target ), target == 'rgb' )
+
+    @staticmethod
+    def lighten(colors:Colors, amount:float=0.1) -> Any:
+        """
+        Raise the OKLCH lightness of RGB colors by `amount` (in `[0, 1]`), keeping hue and chroma.
+        """
+        def function(m:Any, r:Any, g:Any, b:Any) -> Tuple[Any,Any,Any]:
+            L, C, h = _rgb_to_oklch( m, r / 255, g / 255, b / 255 )
+            return _convert( m, m.clip( L + amount, 0.0, 1.0 ), C, h, 'oklch', 'rgb' )
+        return _map( colors, 'rgb', function, True )
+
+    @staticmethod
+    def darken(colors:Colors, amount:float=0.1) -> Any:
+        """
+        Lower the OKLCH lightness of RGB colors by `amount` (in `[0, 1]`), keeping hue and chroma.
+        """
+        return ColorSpace.lighten( colors, -amount )
+
+    @staticmethod
+    def luminance(colors:Colors) -> Any:
+        """
+        Return the WCAG relative luminance of RGB colors, from 0 (black) to 1 (white).
+        """
+        return _map( colors, 'rgb', lambda m, r, g, b: _luminance( m, r / 255, g / 255, b / 255 ), False )
+
+    @staticmethod
+    def contrast(foreground:Colors, background:Colors) -> Any:
+        """
+        Return the WCAG contrast ratio (1 to 21) between RGB colors, pair by pair. Either side may be a single color.
+        `4.5` is the usual minimum for text and `3` for large or bold text.
+        """
+        a, b = ColorSpace.luminance( foreground ), ColorSpace.luminance( background )
+        if isinstance( a, list ) or isinstance( b, list ):
+            if not isinstance( a, list ):
+                a = [a] * len( b )
+            if not isinstance( b, list ):
+                b = [b] * len( a )
+            return [ ( max( x, y ) + 0.05 ) / ( min( x, y ) + 0.05 ) for x, y in zip( a, b ) ]
+        m = _numpy() if type( a ).__module__ == 'numpy' or type( b ).__module__ == 'numpy' else _Scalar
+        return ( m.maximum( a, b ) + 0.05 ) / ( m.minimum( a, b ) + 0.05 )
+
+    @staticmethod
+    def readable(background:Colors, foreground:Optional[Colors]=None, minimum:float=4.5) -> Any:
+        """
+        Return a foreground readable on each background: the color with the OKLCH lightness closest to the wanted
+        foreground among those with a contrast ratio of at least `minimum`, or the most contrasting one if none is.
+
+        `Parameters`:
+        - `background`  : RGB background colors.
+        - `foreground`  : `Optional` wanted foreground colors, one per background or one for all. Defaults to a
+                          muted tint of each background, which gives banner-style pairs.
+        - `minimum`     : Minimum contrast ratio.
+        """
+        numpy = _numpy()
+        if _single( background ) and foreground is not None and not _single( foreground ):
+            background = [background] * len( foreground )
+        if _single( background ) or numpy is None:
+            if not _single( background ):
+                foregrounds = foreground if foreground is not None and not _single( foreground ) else [foreground] * len( background )
+                return [ ColorSpace.readable( color, wanted, minimum ) for color, wanted in zip( background, foregrounds ) ]
+            return _readable( _Scalar, _parse( background, 'rgb' ), None if foreground is None else _parse( foreground, 'rgb' ), minimum )
+
+        array      = type( background ).__module__ == 'numpy'
+        background = numpy.asarray( background, dtype=float ) if array else numpy.array( [ _parse( color, 'rgb' ) for color in background ], dtype=float )
+        if foreground is not None:
+            foreground = numpy.array( _parse( foreground, 'rgb' ) if _single( foreground ) else
+                                      ( foreground if type( foreground ).__module__ == 'numpy' else [ _parse( color, 'rgb' ) for color in foreground ] ),
+                                      dtype=float )
+        result = _readable( numpy, background, foreground, minimum )
+        return result if array else [ tuple( row ) for row in result.tolist() ]
+
+
+def _readable(m:Any, background:Any, foreground:Any, minimum:float) -> Any:
+    # Tries the wanted lightness and `ColorSpace.STEPS` even levels at the wanted hue and chroma, so a foreground
+    # that is already readable is kept. On NumPy arrays the levels form a trailing axis and every background is
+    # searched at once.
+    numpy = m is not _Scalar
+    split = ( lambda rgb: ( rgb[..., 0] / 255, rgb[..., 1] / 255, rgb[..., 2] / 255 ) ) if numpy else ( lambda rgb: tuple( c / 255 for c in rgb ) )
+    back  = split( background )
+    if foreground is None:
+        L, C, h = _rgb_to_oklch( m, *back )
+        C       = C / 3
+    else:
+        L, C, h = _rgb_to_oklch( m, *split( foreground ) )
+    shade = _luminance( m, *back )
+
+    if not numpy:
+        best = None
+        for level in [ L ] + [ step / ( ColorSpace.STEPS - 1 ) for step in range( ColorSpace.STEPS ) ]:
+            rgb   = _oklch_to_rgb( m, level, C, h )
+            light = _luminance( m, *rgb )
+            ratio = ( max( light, shade ) + 0.05 ) / ( min( light, shade ) + 0.05 )
+            cost  = abs( level - L ) if ratio >= minimum else 10 - ratio
+            if best is None or cost < best[0]:
+                best = ( cost, rgb )
+        return tuple( int( round( channel * 255 ) ) for channel in best[1] )
+
+    L, C, h, shade = ( m.asarray( value )[..., m.newaxis] for value in m.broadcast_arrays( L, C, h, shade ) )
+    levels  = m.concatenate( m.broadcast_arrays( L, m.linspace( 0.0, 1.0, ColorSpace.STEPS ) ), axis=-1 )
+    r, g, b = _oklch_to_rgb( m, levels, C, h )
+    light   = _luminance( m, r, g, b )
+    ratio   = ( m.maximum( light, shade ) + 0.05 ) / ( m.minimum( light, shade ) + 0.05 )
+    best    = m.argmin( m.where( ratio >= minimum, abs( levels - L ), 10 - ratio ), axis=-1 )[..., m.newaxis]
+    rgb     = m.stack( [ m.take_along_axis( channel, best, axis=-1 )[..., 0] for channel in m.broadcast_arrays( r, g, b ) ], axis=-1 )
+    return m.rint( rgb * 255 ).astype( int )
@@ -0,0 +1,199 @@
+import sys
+import threading
+import weakref
+from queue import Empty, SimpleQueue
+from typing import Any, Callable, List, Optional, TextIO
+
+
+def _drain(queue:SimpleQueue, batch_size:int, write:Callable[[List[Any]], None]) -> None:
+    # Writer thread loop shared with `BackgroundHandler`: take up to `batch_size` queued items at a time, hand the
+    # records among them to `write` in one call, then wake the waiters (`threading.Event` or `_Waiter`) queued
+    # behind them. `None` stops the loop once the batch holding it is written.
+    while True:
+        batch :List[Any] = [ queue.get() ]
+        try:
+            while len( batch ) < batch_size:
+                batch.append( queue.get_nowait() )
+        except Empty:
+            pass
+
+        records :List[Any] = []
+        stop    :bool = False
+        waiters :List[Any] = []
+        for item in batch:
+            if item is None:
+                stop = True
+            elif isinstance( item, ( threading.Event, _Waiter ) ):
+                waiters.append( item )
+            else:
+                records.append( item )
+
+        if records:
+            write( records )
+        for waiter in waiters:
+            waiter.set()
+        if stop:
+            return
+
+
+def _stop(queue:SimpleQueue, thread:threading.Thread) -> None:
+    # Finalizer of a `Console`: runs on `close`, when an unclosed console is collected, or at interpreter exit.
+    queue.put( None )
+    thread.join()
+
+
+class Console:
+    """
+    Thread- and asyncio-safe console that writes whole records from many producers through one writer thread.
+
+    Producers render their `Text`/`Alias` output themselves and hand the finished record to `write`, which only
+    puts it on a queue: no lock is shared with other producers and terminal I/O never happens on their thread.
+    A single writer drains up to `batch_size` records at a time and writes them with one `write` call, so each
+    record reaches the terminal in one piece and escape sequences from different producers never interleave.
+
+    From asyncio code, `awrite` enqueues in the same way and, when more than `high_water` records are waiting,
+    awaits the writer instead of blocking the event loop. `drain` waits for everything enqueued so far.
+
+    A write error on the writer thread is raised again by the next `flush`, `drain` or `close`; records are
+    dropped until then. The console is closed at interpreter exit, or when it is garbage collected, so pending
+    records are not lost.
+
+    `Parameters`:
+    - `stream`      : Writable text file object. Defaults to `sys.stdout`.
+    - `batch_size`  : Maximum number of records written per `write` call on `stream`.
+    - `high_water`  : Number of pending records above which `awrite` waits for the writer.
+
+    `Example`:
+    ```
+        console = Console()
+        console.write( alias.Badge, Text(Colors.GREEN1)("job done"), f"in {seconds:.1f}s" )
+
+        async def worker(name):
+            await console.awrite( Text(Colors.CADETBLUE1)(name), "started" )
+    ```
+
+    `Attributes`:
+    - `records` : Number of records written to `stream`.
+    - `writes`  : Number of `write` calls made on `stream`.
+    """
+
+    def __init__(self, stream:Optional[TextIO]=None, batch_size:int=512, high_water:int=8192) -> None:
+        self.stream     :TextIO = stream if stream is not None else sys.stdout
+        self.batch_size :int = batch_size
+        self.high_water :int = high_water
+        self._writer    :_Writer = _Writer( self.stream )
+        self._queue     :SimpleQueue = SimpleQueue()
+        self._closed    :bool = False
+        # The thread and the finalizer only hold the queue and the writer, so an unclosed console can be collected.
+        self._thread    = threading.Thread( target=_drain, args=( self._queue, batch_size, self._writer ), name='Console', daemon=True )
+        self._thread.start()
+        self._finalizer = weakref.finalize( self, _stop, self._queue, self._thread )
+
+    @property
+    def records(self) -> int:
+        return self._writer.records
+
+    @property
+    def writes(self) -> int:
+        return self._writer.writes
+
+    def write(self, *parts:str, sep:str=' ', end:str='\n') -> None:
+        """
+        Enqueue one record made of `parts`, like `print`. Returns immediately and never blocks.
+        """
+        if self._closed:
+            raise ValueError('write to closed Console')
+        self._queue.put( sep.join( parts ) + end )
+
+    async def awrite(self, *parts:str, sep:str=' ', end:str='\n') -> None:
+        """
+        Enqueue one record from a coroutine, waiting (without blocking the event loop) while the backlog is large.
+        """
+        self.write( *parts, sep=sep, end=end )
+        if self._queue.qsize() > self.high_water:
+            await self.drain()
+
+    def flush(self) -> None:
+        """
+        Block until every record enqueued so far has been written.
+        """
+        if self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put( done )
+            done.wait()
+        self._raise()
+
+    async def drain(self) -> None:
+        """
+        Wait, without blocking the event loop, until every record enqueued so far has been written.
+        """
+        import asyncio
+        if self._thread.is_alive():
+            loop   = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._queue.put( _Waiter( loop, future ) )
+            await future
+        self._raise()
+
+    def close(self) -> None:
+        """
+        Write the remaining records and stop the writer thread.
+        """
+        if not self._closed:
+            self._closed = True
+            self._finalizer()
+        self._raise()
+
+    def __enter__(self) -> 'Console':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _raise(self) -> None:
+        error, self._writer.error = self._writer.error, None
+        if error is not None:
+            raise error
+
+
+class _Writer:
+    # Writes batches of records on the writer thread and counts them. Kept apart from `Console` for the finalizer.
+
+    __slots__ = ('stream', 'records', 'writes', 'error')
+
+    def __init__(self, stream:TextIO) -> None:
+        self.stream     :TextIO = stream
+        self.records    :int = 0
+        self.writes     :int = 0
+        self.error      :Optional[BaseException] = None
+
+    def __call__(self, records:List[str]) -> None:
+        if self.error is not None:
+            return
+        try:
+            self.stream.write( ''.join( records ) )
+            self.stream.flush()
+            self.records += len( records )
+            self.writes  += 1
+        except Exception as error:
+            self.error = error
+
+
+class _Waiter:
+    # Queue marker that resolves an asyncio future from the writer thread.
+
+    __slots__ = ('loop', 'future')
+
+    def __init__(self, loop:Any, future:Any) -> None:
+        self.loop   = loop
+        self.future = future
+
+    def set(self) -> None:
+        try:
+            self.loop.call_soon_threadsafe( self._resolve )
+        except RuntimeError:
+            pass  # The event loop was closed while waiting.
+
+    def _resolve(self) -> None:
+        if not self.future.done():
+            self.future.set_result( None )
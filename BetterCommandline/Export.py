@@ -0,0 +1,294 @@
+import re
+import sys
+from typing import Dict, Iterable, List, Optional, TextIO
+
+from .Parser import EMPTY, AnsiParser, Span
+from .Style import Style
+from .Width import Width
+
+
+# Characters XML does not allow (C0 controls other than tab and newline), plus carriage returns.
+_CONTROLS = re.compile('[\x00-\x08\x0b-\x1f\x7f]')
+
+
+def _escape(text:str) -> str:
+    # Element text only needs `&`, `<` and `>` escaped; done here so importing the package does not load `html`.
+    return text.replace( '&', '&amp;' ).replace( '<', '&lt;' ).replace( '>', '&gt;' )
+
+
+def _hex(rgb) -> str:
+    return '#%02x%02x%02x' % rgb
+
+
+class _Exporter:
+    # Shared streaming machinery: parse chunks, give each distinct style a CSS class the first time it is seen
+    # and declare that class in a `<style>` element written just before its first use, so nothing is buffered.
+
+    def __init__(self, stream:Optional[TextIO], title:str, foreground:str, background:str, font:str) -> None:
+        self.stream     :TextIO = stream if stream is not None else sys.stdout
+        self.title      :str = title
+        self.foreground :str = foreground
+        self.background :str = background
+        self.font       :str = font
+        self.converted  :int = 0
+        self._parser    = AnsiParser()
+        self._classes   :Dict[Style, str] = {}
+        self._started   :bool = False
+        self._closed    :bool = False
+
+    def write(self, chunk:str) -> int:
+        """
+        Convert the next chunk of styled output. Sequences split across chunks are handled.
+        """
+        if self._closed:
+            raise ValueError('write to closed exporter')
+        output :List[str] = []
+        if not self._started:
+            self._started = True
+            output.append( self._header() )
+        self._render( self._parser.feed( chunk ), output )
+        self.stream.write( ''.join( output ) )
+        self.converted += len( chunk )
+        return len( chunk )
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+    def close(self) -> None:
+        """
+        Convert anything still pending and finish the document.
+        """
+        if self._closed:
+            return
+        output :List[str] = []
+        if not self._started:
+            self._started = True
+            output.append( self._header() )
+        self._render( self._parser.close(), output )
+        output.append( self._footer() )
+        self.stream.write( ''.join( output ) )
+        self._closed = True
+        self.flush()
+
+    def convert(self, chunks:Iterable[str]) -> None:
+        """
+        Convert every chunk of `chunks` (e.g. an open log file) and finish the document.
+        """
+        for chunk in chunks:
+            self.write( chunk )
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _class(self, style:Style, output:List[str]) -> str:
+        name = self._classes.get( style )
+        if name is None:
+            name = self._classes[style] = f's{len( self._classes )}'
+            output.append( self._declare( name, style ) )
+        return name
+
+    def _colors(self, style:Style):
+        foreground = _hex( style.foreground ) if style.foreground is not None else None
+        background = _hex( style.background ) if style.background is not None else None
+        if style.attributes & Style.INVERSE:
+            foreground, background = background or self.background, foreground or self.foreground
+        return foreground, background
+
+    @staticmethod
+    def _font(style:Style) -> List[str]:
+        rules = []
+        if style.attributes & Style.BOLD:
+            rules.append( 'font-weight:bold' )
+        if style.attributes & Style.ITALICS:
+            rules.append( 'font-style:italic' )
+        if style.attributes & Style.UNDERLINED:
+            rules.append( 'text-decoration:underline' )
+        if style.attributes & Style.HIDDEN:
+            rules.append( 'opacity:0' )
+        return rules
+
+
+class HtmlExporter(_Exporter):
+    """
+    Streaming converter from styled console output to a standalone HTML page.
+
+    Output produced with `Text`, `Alias`, `Colored` or any `SGR`-emitting tool is parsed with `AnsiParser` and
+    written as `<span>` runs inside a `<pre>` block. Every distinct style becomes one CSS class, declared right
+    before its first use, so the converter keeps no more than one chunk in memory however long the log is.
+    The exporter is a writable text stream, so a `Console` or `StyledStream` can record straight into it.
+
+    `Parameters`:
+    - `stream`      : Writable text file object for the HTML. Defaults to `sys.stdout`.
+    - `title`       : Page title.
+    - `foreground`  : Default text color.
+    - `background`  : Page background color.
+    - `font`        : CSS `font-family` of the output.
+
+    `Example`:
+    ```
+        with open("build.log") as log, open("build.html", "w") as page:
+            HtmlExporter( page, title="build #812" ).convert( iter( lambda: log.read(1 << 20), '' ) )
+    ```
+    """
+
+    def __init__(self, stream:Optional[TextIO]=None, title:str='Console output', foreground:str='#d4d4d4',
+                 background:str='#1e1e1e', font:str='ui-monospace, Menlo, Consolas, monospace') -> None:
+        super().__init__(stream, title, foreground, background, font)
+
+    def _header(self) -> str:
+        return ( f'<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n<title>{_escape( self.title )}</title>\n'
+                 f'<style>body{{margin:0;background:{self.background}}}'
+                 f'pre{{margin:0;padding:1em;color:{self.foreground};font-family:{self.font};line-height:1.25}}</style>\n'
+                 f'</head>\n<body>\n<pre>' )
+
+    def _footer(self) -> str:
+        return '</pre>\n</body>\n</html>\n'
+
+    def _declare(self, name:str, style:Style) -> str:
+        foreground, background = self._colors( style )
+        rules = self._font( style )
+        if foreground:
+            rules.insert( 0, f'color:{foreground}' )
+        if background:
+            rules.insert( 1 if foreground else 0, f'background-color:{background}' )
+        return f'<style>.{name}{{{";".join( rules )}}}</style>'
+
+    def _render(self, spans:List[Span], output:List[str]) -> None:
+        append = output.append
+        for style, text in spans:
+            text = _escape( _CONTROLS.sub( '', text ) )
+            if style is EMPTY:
+                append( text )
+            else:
+                name = self._class( style, output )
+                append( f'<span class="{name}">{text}</span>' )
+
+
+class SvgExporter(_Exporter):
+    """
+    Streaming converter from styled console output to an SVG image, e.g. for READMEs and CI summaries.
+
+    Each line becomes a `<text>` element with one `<tspan>` per style run; backgrounds are drawn as rectangles
+    behind the run. Styles are deduplicated into CSS classes declared before their first use, and only the
+    current line is held in memory. The image size is only known at the end: on a seekable `stream` the header
+    is patched with the exact size, otherwise the image keeps a width of `columns` and grows downwards.
+
+    `Parameters`:
+    - `stream`      : Writable text file object for the SVG. Defaults to `sys.stdout`.
+    - `title`       : Image title.
+    - `foreground`  : Default text color.
+    - `background`  : Background color.
+    - `font`        : CSS `font-family` of the output.
+    - `font_size`   : Font size in pixels. Cells are `0.6 * font_size` wide and `1.25 * font_size` high.
+    - `columns`     : Width in columns used when the size cannot be patched afterwards.
+
+    `Example`:
+    ```
+        with SvgExporter( open("summary.svg", "w"), title="tests" ) as svg:
+            svg.write( Text(Colors.GREEN1)("124 passed") + "\\n" )
+    ```
+    """
+
+    SIZE_DIGITS:int = 10
+
+    def __init__(self, stream:Optional[TextIO]=None, title:str='Console output', foreground:str='#d4d4d4',
+                 background:str='#1e1e1e', font:str='ui-monospace, Menlo, Consolas, monospace',
+                 font_size:int=14, columns:int=120) -> None:
+        super().__init__(stream, title, foreground, background, font)
+        self.font_size  :int = font_size
+        self.columns    :int = columns
+        self.cell       :float = 0.6 * font_size
+        self.line_height:float = 1.25 * font_size
+        self.rows       :int = 0
+        self.width      :int = 0
+        self._column    :int = 0
+        self._line      :List[str] = []
+        self._rects     :List[str] = []
+        self._size_at   :Optional[int] = None
+
+    def _header(self) -> str:
+        try:
+            self._size_at = self.stream.tell() if self.stream.seekable() else None
+        except ( AttributeError, OSError, ValueError ):
+            self._size_at = None
+        width = f'{self.columns * self.cell + 2 * self.font_size:g}'
+        # The height is only a placeholder when it will be patched in `close`.
+        height = f'{2 * self.font_size:g}' if self._size_at is not None else '100%'
+        return ( self._size( width, height, self._size_at is not None ) +
+                 f'<title>{_escape( self.title )}</title>\n'
+                 f'<style>text{{font-family:{self.font};font-size:{self.font_size}px;fill:{self.foreground};white-space:pre}}</style>\n'
+                 f'<rect width="100%" height="100%" fill="{self.background}"/>\n'
+                 f'<g transform="translate({self.font_size},{self.font_size})">\n' )
+
+    def _footer(self) -> str:
+        output :List[str] = []
+        if self._line or self._rects:
+            self._end_line( output )
+        return ''.join( output ) + '</g>\n</svg>\n'
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        super().close()
+        width  = f'{self.width * self.cell + 2 * self.font_size:g}'
+        height = f'{self.rows * self.line_height + 2 * self.font_size:g}'
+        if self._size_at is not None and max( len( width ), len( height ) ) <= self.SIZE_DIGITS:
+            end = self.stream.tell()
+            self.stream.seek( self._size_at )
+            self.stream.write( self._size( width, height, True ) )
+            self.stream.seek( end )
+            self.stream.flush()
+
+    def _size(self, width:str, height:str, padded:bool) -> str:
+        # Zero-padded to a fixed width (still valid SVG lengths), so the real size can be written over the first one.
+        if padded:
+            width, height = width.zfill( self.SIZE_DIGITS ), height.zfill( self.SIZE_DIGITS )
+        return f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}">\n'
+
+    def _declare(self, name:str, style:Style) -> str:
+        foreground, background = self._colors( style )
+        rules = self._font( style )
+        if foreground:
+            rules.insert( 0, f'fill:{foreground}' )
+        declaration = f'.{name}{{{";".join( rules )}}}'
+        if background:
+            declaration += f'.{name}b{{fill:{background}}}'
+        return f'<style>{declaration}</style>\n'
+
+    def _render(self, spans:List[Span], output:List[str]) -> None:
+        for style, text in spans:
+            text  = text.replace( '\t', '    ' )
+            lines = text.split( '\n' )
+            for index, line in enumerate( lines ):
+                if index:
+                    self._end_line( output )
+                if line:
+                    self._run( style, _CONTROLS.sub( '', line ), output )
+
+    def _run(self, style:Style, text:str, output:List[str]) -> None:
+        width = Width.measure( text )
+        if style is EMPTY:
+            self._line.append( _escape( text ) )
+        else:
+            name = self._class( style, output )
+            if self._colors( style )[1]:
+                self._rects.append( f'<rect class="{name}b" x="{self._column * self.cell:g}" y="{self.rows * self.line_height:g}" '
+                                    f'width="{width * self.cell:g}" height="{self.line_height:g}"/>' )
+            self._line.append( f'<tspan class="{name}">{_escape( text )}</tspan>' )
+        self._column += width
+
+    def _end_line(self, output:List[str]) -> None:
+        output.extend( self._rects )
+        if self._line:
+            output.append( f'<text y="{( self.rows + 0.8 ) * self.line_height:g}">{"".join( self._line )}</text>\n' )
+        elif self._rects:
+            output.append( '\n' )
+        self.width      = max( self.width, self._column )
+        self.rows      += 1
+        self._column    = 0
+        self._line      = []
+        self._rects     = []
@@ -0,0 +1,167 @@
+import math
+from bisect import bisect_right
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from .Colors import ANSI, Colored
+from .Terminal import Terminal
+
+
+RGB   = Tuple[int,int,int]
+Color = Union[RGB, str]
+
+
+def _rgb(color:Color) -> RGB:
+    if isinstance( color, str ):
+        color = color.lstrip('#')
+        return tuple( int( color[i:i+2], 16 ) for i in (0, 2, 4) )
+    return tuple( color )
+
+
+class _Scalar:
+    # The few NumPy functions the color conversions use, for plain floats. The conversions here and in `ColorSpace`
+    # are written once against this interface and run unchanged on floats or on NumPy arrays of any shape.
+    where   = staticmethod( lambda condition, a, b: a if condition else b )
+    minimum = staticmethod( min )
+    maximum = staticmethod( max )
+    clip    = staticmethod( lambda value, low, high: min( max( value, low ), high ) )
+    cbrt    = staticmethod( lambda value: math.copysign( abs( value ) ** ( 1 / 3 ), value ) )
+    hypot   = staticmethod( math.hypot )
+    arctan2 = staticmethod( math.atan2 )
+    cos     = staticmethod( math.cos )
+    sin     = staticmethod( math.sin )
+
+
+def _linear(m:Any, channel:Any) -> Any:
+    # sRGB channel in [0, 1] to linear light.
+    channel = m.clip( channel, 0.0, 1.0 )
+    return m.where( channel <= 0.04045, channel / 12.92, ( ( channel + 0.055 ) / 1.055 ) ** 2.4 )
+
+
+def _encode(m:Any, channel:Any) -> Any:
+    # Linear light to an sRGB channel in [0, 1], clamped to the gamut.
+    channel = m.clip( channel, 0.0, 1.0 )
+    return m.where( channel <= 0.0031308, 12.92 * channel, 1.055 * channel ** ( 1 / 2.4 ) - 0.055 )
+
+
+def _linear_to_oklab(m:Any, r:Any, g:Any, b:Any) -> Tuple[Any,Any,Any]:
+    l = m.cbrt( 0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b )
+    n = m.cbrt( 0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b )
+    s = m.cbrt( 0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b )
+    return ( 0.2104542553 * l + 0.7936177850 * n - 0.0040720468 * s,
+             1.9779984951 * l - 2.4285922050 * n + 0.4505937099 * s,
+             0.0259040371 * l + 0.7827717662 * n - 0.8086757660 * s )
+
+
+def _oklab_to_linear(L:Any, a:Any, b:Any) -> Tuple[Any,Any,Any]:
+    # Works element-wise on floats and on NumPy arrays alike.
+    l = ( L + 0.3963377774 * a + 0.2158037573 * b ) ** 3
+    m = ( L - 0.1055613458 * a - 0.0638541728 * b ) ** 3
+    s = ( L - 0.0894841775 * a - 1.2914855480 * b ) ** 3
+    return (  4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s,
+             -1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s,
+             -0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s )
+
+
+def _oklab(rgb:RGB) -> Tuple[float,float,float]:
+    return _linear_to_oklab( _Scalar, *( _linear( _Scalar, channel / 255 ) for channel in rgb ) )
+
+
+class Gradient:
+    """
+    Linear color gradient over any number of stops, for per-character coloring of banners and lines.
+
+    Colors are interpolated in RGB or in the perceptual OKLab space (`space='oklab'`). When NumPy is installed,
+    the color of every position is computed in one vectorized call; otherwise a pure-Python path gives the same
+    result. Consecutive characters whose escape codes are equal in the active `Terminal` mode share one code.
+
+    `Parameters`:
+    - `stops`       : Two or more colors, each an RGB `tuple` or a `hexadecimal` color code.
+    - `positions`   : `Optional` increasing stop positions in `[0, 1]`. Defaults to evenly spaced stops.
+    - `space`       : `'rgb'` or `'oklab'`.
+    - `style`       : `Optional` text style applied to the whole text, e.g., bold.
+
+    `Example`:
+    ```
+        rainbow = Gradient( [Colors.RED1, Colors.GOLD1, Colors.GREEN1, Colors.DODGERBLUE1], space='oklab' )
+        print( rainbow("BetterCommandline") )
+        heat = Gradient( [Colors.GREEN1, Colors.ORANGE1, Colors.RED1] ).sample( [0.1, 0.7, 0.95] )
+    ```
+    """
+
+    SPACES:Tuple[str,...] = ('rgb', 'oklab')
+
+    def __init__(self, stops:Sequence[Color], positions:Optional[Sequence[float]]=None, space:str='rgb',
+                 style:Optional[str]=None) -> None:
+        if len( stops ) < 2:
+            raise ValueError('Gradient needs at least two stops')
+        if space not in self.SPACES:
+            raise ValueError(f'Gradient does not support {space!r} space, expected one of {self.SPACES}')
+        if positions is None:
+            positions = [ index / ( len( stops ) - 1 ) for index in range( len( stops ) ) ]
+        if len( positions ) != len( stops ) or any( a > b for a, b in zip( positions, positions[1:] ) ):
+            raise ValueError('Gradient positions must be increasing and match the number of stops')
+
+        self.stops      :List[RGB] = [ _rgb( stop ) for stop in stops ]
+        self.positions  :List[float] = list( positions )
+        self.space      :str = space
+        self.style      :str = style if not style==None else ''
+        self._points    :List[Tuple[float,float,float]] = [ _oklab( stop ) if space == 'oklab' else tuple( map( float, stop ) )
+                                                            for stop in self.stops ]
+
+    def sample(self, positions:Sequence[float]) -> List[RGB]:
+        """
+        Return the colors at the given positions in `[0, 1]` (values outside are clamped).
+        """
+        try:
+            import numpy
+        except ImportError:
+            return [ self._sample_one( position ) for position in positions ]
+        return self._sample_array( numpy, numpy.asarray( positions, dtype=float ) )
+
+    def colors(self, count:int) -> List[RGB]:
+        """
+        Return `count` evenly spaced colors from the start to the end of the gradient.
+        """
+        if count <= 1:
+            return self.sample( [0.0] * count )
+        return self.sample( [ index / ( count - 1 ) for index in range( count ) ] )
+
+    def __call__(self, text:str) -> str:
+        """
+        Color `text` character by character along the gradient.
+        """
+        if Terminal.plain or not text:
+            return text
+        # Truecolor codes are formatted directly so gradients do not flood the shared `Colored` cache.
+        foreground = ANSI.FOREGROUND.format if Terminal.mode == Terminal.TRUECOLOR else lambda *rgb: Colored.Foreground( rgb )
+        output      :List[str] = []
+        current     :Optional[str] = None
+        previous    :Optional[RGB] = None
+        for char, rgb in zip( text, self.colors( len( text ) ) ):
+            if rgb != previous:
+                previous, code = rgb, foreground( *rgb )
+                if code != current:
+                    output.append( ANSI.combine( code, self.style ) if current is None else code )
+                    current = code
+            output.append( char )
+        output.append( ANSI.RESET )
+        return ''.join( output )
+
+    def _sample_one(self, position:float) -> RGB:
+        stops    = self.positions
+        position = min( max( position, stops[0] ), stops[-1] )
+        index    = min( bisect_right( stops, position ), len( stops ) - 1 )
+        low, high = stops[index - 1], stops[index]
+        t        = ( position - low ) / ( high - low ) if high > low else 0.0
+        a, b     = self._points[index - 1], self._points[index]
+        point    = [ x + ( y - x ) * t for x, y in zip( a, b ) ]
+        if self.space == 'oklab':
+            return tuple( round( _encode( _Scalar, channel ) * 255 ) for channel in _oklab_to_linear( *point ) )
+        return tuple( min( max( round( channel ), 0 ), 255 ) for channel in point )
+
+    def _sample_array(self, numpy:Any, positions:Any) -> List[RGB]:
+        channels = [ numpy.interp( positions, self.positions, [ point[axis] for point in self._points ] ) for axis in range(3) ]
+        if self.space == 'oklab':
+            channels = [ _encode( numpy, channel ) * 255 for channel in _oklab_to_linear( *channels ) ]
+        values = numpy.clip( numpy.rint( numpy.stack( channels ) ), 0, 255 ).astype( int ).T
+        return [ tuple( row ) for row in values.tolist() ]
@@ -0,0 +1,184 @@
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from .Colors import ANSI
+from .Gradient import Color, Gradient
+from .Terminal import Terminal, _BASIC, _CUBE_INDEX, _CUBE_LEVELS, _GREY_INDEX, _GREY_LEVELS
+
+
+UPPER_HALF:str = '▀'
+
+# `SGR` parameter for the terminal's default background, used below the last row of an odd-height image.
+_DEFAULT_BACKGROUND:str = '49'
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('Heatmap needs NumPy, install it with `pip install numpy`') from None
+    return numpy
+
+
+def _parameters(numpy:Any, colors:Any, background:bool) -> Any:
+    # `SGR` parameters (without `ESC [` and `m`) of packed 0xRRGGBB colors, as an object array of strings.
+    # Built from tables of number strings with element-wise concatenation: nothing is formatted per color.
+    digits  = numpy.array( [ str( value ) for value in range(256) ], dtype=object )
+    r, g, b = colors >> 16 & 255, colors >> 8 & 255, colors & 255
+    if Terminal.mode == Terminal.TRUECOLOR:
+        return ( '48;2;' if background else '38;2;' ) + digits[r] + ';' + digits[g] + ';' + digits[b]
+    if Terminal.mode == Terminal.COLOR256:
+        return ( '48;5;' if background else '38;5;' ) + digits[_to_256( numpy, r, g, b )]
+    index = _to_16( numpy, r, g, b )
+    return digits[numpy.where( index < 8, 30, 82 ) + index + ( 10 if background else 0 )]
+
+
+def _to_256(numpy:Any, r:Any, g:Any, b:Any) -> Any:
+    # `Terminal.to_256` for arrays of channels.
+    levels  = numpy.array( _CUBE_LEVELS )
+    cube    = numpy.array( _CUBE_INDEX )
+    greys   = numpy.array( _GREY_LEVELS )
+    step    = numpy.array( _GREY_INDEX )[( r + g + b ) // 3]
+    grey    = greys[step]
+    cube_r, cube_g, cube_b = cube[r], cube[g], cube[b]
+    to_grey = ( r - grey ) ** 2 + ( g - grey ) ** 2 + ( b - grey ) ** 2
+    to_cube = ( r - levels[cube_r] ) ** 2 + ( g - levels[cube_g] ) ** 2 + ( b - levels[cube_b] ) ** 2
+    return numpy.where( to_grey < to_cube, 232 + step, 16 + 36 * cube_r + 6 * cube_g + cube_b )
+
+
+def _to_16(numpy:Any, r:Any, g:Any, b:Any) -> Any:
+    # `Terminal.to_16` for arrays of channels.
+    basic = numpy.array( _BASIC )
+    rgb   = numpy.stack( ( r, g, b ), axis=-1 )
+    return ( ( rgb[:, numpy.newaxis, :] - basic ) ** 2 ).sum( axis=-1 ).argmin( axis=-1 )
+
+
+class Heatmap:
+    """
+    Truecolor renderer for NumPy images and heatmaps, e.g. latency histograms or per-core load.
+
+    Two pixel rows share one character cell: the upper half block `▀` takes the top pixel as its foreground and
+    the bottom pixel as its background. `H×W×3` arrays are drawn as RGB images; `H×W` and 1-D arrays of values are
+    mapped through the colormap between `vmin` and `vmax` (a 1-D array is a one-row strip, e.g. a sparkline).
+
+    Escape codes are built once per distinct color with vectorized array operations, never per pixel, and runs
+    of identical cells in a row share one code, so a full-screen frame renders in a few milliseconds. In 256 and
+    16-color modes colors are reduced first, which merges runs further; in plain mode only blank cells are output.
+
+    `Parameters`:
+    - `colormap`    : `Gradient`, or colors as RGB `tuple`s or `hexadecimal` codes interpolated in OKLab.
+    - `vmin`        : `Optional` value mapped to the start of the colormap. Defaults to the smallest value.
+    - `vmax`        : `Optional` value mapped to the end of the colormap. Defaults to the largest value.
+    - `levels`      : Number of distinct colors sampled from the colormap.
+
+    `Example`:
+    ```
+        load = numpy.random.rand( 16, 64 )
+        print( Heatmap( [Colors.MIDNIGHTBLUE, Colors.GREEN1, Colors.GOLD1, Colors.RED1], vmin=0, vmax=1 )( load ) )
+        print( Heatmap()( latencies ) )                         # 1-D array: one colored strip
+        print( Heatmap()( frame ) )                             # H×W×3 uint8 image
+    ```
+    """
+
+    # `Colors.MIDNIGHTBLUE`, `DODGERBLUE1`, `SPRINGGREEN1`, `GOLD1` and `RED1`, as codes so the palette is not loaded on import.
+    COLORMAP:Tuple[Color,...] = ( '#191970', '#1e90ff', '#00ee76', '#ffd700', '#ff0000' )
+
+    def __init__(self, colormap:Union[Gradient, Sequence[Color], None]=None, vmin:Optional[float]=None,
+                 vmax:Optional[float]=None, levels:int=256) -> None:
+        if levels < 2:
+            raise ValueError('Heatmap needs at least two levels')
+        if colormap is None:
+            colormap = self.COLORMAP
+        self.gradient   :Gradient = colormap if isinstance( colormap, Gradient ) else Gradient( colormap, space='oklab' )
+        self.vmin       :Optional[float] = vmin
+        self.vmax       :Optional[float] = vmax
+        self.levels     :int = levels
+        self._table     :Any = None
+
+    def __call__(self, data:Any) -> str:
+        """
+        Render `data` as lines of half-block cells, each line ending with a reset. Lines are joined by newlines.
+        """
+        return '\n'.join( self.lines( data ) )
+
+    def lines(self, data:Any) -> List[str]:
+        """
+        Render `data` and return one string per character row.
+        """
+        numpy  = _numpy()
+        colors = self.pack( data )
+        height, width = colors.shape
+        rows   = ( height + 1 ) // 2
+        if Terminal.plain or not width:
+            return [ ' ' * width ] * rows
+
+        top = colors[0::2]
+        if height % 2:
+            bottom = numpy.full( ( rows, width ), -1, dtype=numpy.int64 )
+            bottom[:-1] = colors[1::2]
+        else:
+            bottom = colors[1::2]
+
+        # One code per distinct color; colors that render the same in the active mode share an id.
+        foreground = self._ids( numpy, top, False )
+        background = self._ids( numpy, bottom, True )
+        cells      = ( foreground[0] * len( background[1] ) + background[0] ).ravel()
+
+        # A run starts at the first cell of every row and wherever the cell differs from its left neighbor.
+        starts     = numpy.ones( cells.size, dtype=bool )
+        starts[1:] = cells[1:] != cells[:-1]
+        starts[::width] = True
+        first      = numpy.flatnonzero( starts )
+        lengths    = numpy.diff( numpy.append( first, cells.size ) )
+        runs       = cells[first]
+
+        blocks     = numpy.array( [ UPPER_HALF * count for count in range( width + 1 ) ], dtype=object )
+        pieces     = ( '\033[' + foreground[1][runs // len( background[1] )] + ';'
+                       + background[1][runs % len( background[1] )] + 'm' + blocks[lengths] )
+        row_starts = numpy.searchsorted( first, numpy.arange( rows ) * width ).tolist() + [ len( first ) ]
+        pieces     = pieces.tolist()
+        return [ ''.join( pieces[start:end] ) + ANSI.RESET for start, end in zip( row_starts, row_starts[1:] ) ]
+
+    def pack(self, data:Any) -> Any:
+        """
+        Return the colors of `data` as an `H×W` array of packed `0xRRGGBB` integers.
+        """
+        numpy = _numpy()
+        data  = numpy.asarray( data )
+        if data.ndim == 1:
+            data = data[numpy.newaxis]
+        if data.ndim == 3 and data.shape[2] == 3:
+            rgb = numpy.clip( data, 0, 255 ).astype( numpy.int64 )
+            return rgb[..., 0] << 16 | rgb[..., 1] << 8 | rgb[..., 2]
+        if data.ndim != 2:
+            raise ValueError(f'Heatmap expects an H×W×3 image or an H×W or 1-D array of values, got shape {data.shape}')
+        if not data.size:
+            return numpy.zeros( data.shape, dtype=numpy.int64 )
+
+        values = data.astype( float )
+        finite = values[numpy.isfinite( values )]
+        low    = self.vmin if self.vmin is not None else ( finite.min() if finite.size else 0.0 )
+        high   = self.vmax if self.vmax is not None else ( finite.max() if finite.size else 1.0 )
+        scale  = ( self.levels - 1 ) / ( high - low ) if high > low else 0.0
+        # NaN values are drawn with the first color of the colormap.
+        index  = numpy.nan_to_num( numpy.clip( numpy.rint( ( values - low ) * scale ), 0, self.levels - 1 ) ).astype( numpy.intp )
+        return self._colormap( numpy )[index]
+
+    def _colormap(self, numpy:Any) -> Any:
+        if self._table is None:
+            rgb = numpy.array( self.gradient.colors( self.levels ), dtype=numpy.int64 )
+            self._table = rgb[:, 0] << 16 | rgb[:, 1] << 8 | rgb[:, 2]
+        return self._table
+
+    @staticmethod
+    def _ids(numpy:Any, colors:Any, background:bool) -> Tuple[Any, Any]:
+        # Per-cell ids into an array of distinct `SGR` parameters.
+        unique, inverse = numpy.unique( colors, return_inverse=True )
+        default    = unique.size and unique[0] < 0
+        parameters = _parameters( numpy, unique[1:] if default else unique, background )
+        if default:
+            parameters = numpy.concatenate( ( numpy.array( [_DEFAULT_BACKGROUND], dtype=object ), parameters ) )
+        if Terminal.mode != Terminal.TRUECOLOR:
+            parameters, remap = numpy.unique( parameters.astype( str ), return_inverse=True )
+            parameters = parameters.astype( object )
+            inverse    = remap.reshape( -1 )[inverse]
+        return inverse.reshape( colors.shape ), parameters
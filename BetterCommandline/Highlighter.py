@@ -0,0 +1,251 @@
+import re
+from itertools import islice
+from re import Match, Pattern
+from typing import AnyStr, Dict, Iterable, Iterator, List, Optional, Sequence, Set, TextIO, Tuple, Union
+
+from .Alias import Alias
+from .Terminal import Terminal
+from .Text import Text
+
+# The prefilter reads parsed patterns through the private `re` parser. Without it, rules are matched unfiltered.
+try:
+    from re import _constants as _sre, _parser as _sre_parse
+except ImportError:
+    try:  # Python < 3.11
+        import sre_constants as _sre, sre_parse as _sre_parse
+    except ImportError:
+        _sre = _sre_parse = None
+
+
+Rule = Tuple[Union[str, bytes, Pattern], Union[Text, Alias]]
+
+
+_INLINE_FLAGS:Tuple[Tuple[int, str],...] = ( (re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'), (re.VERBOSE, 'x') )
+
+
+def _source(pattern:Union[str, bytes, Pattern]) -> str:
+    # Compiled patterns keep their own flags as a scoped inline group, e.g. `(?i:...)`.
+    # Bytes patterns are handled as latin-1 text, which maps every byte to one character.
+    flags = ''
+    if isinstance( pattern, re.Pattern ):
+        flags   = ''.join( letter for flag, letter in _INLINE_FLAGS if pattern.flags & flag )
+        pattern = pattern.pattern
+    if isinstance( pattern, bytes ):
+        pattern = pattern.decode('latin-1')
+    return f'(?{flags}:{pattern})' if flags else pattern
+
+
+try:
+    _CATEGORIES:Dict[object, str] = {
+        _sre.CATEGORY_DIGIT : r'\d', _sre.CATEGORY_NOT_DIGIT : r'\D',
+        _sre.CATEGORY_WORD  : r'\w', _sre.CATEGORY_NOT_WORD  : r'\W',
+        _sre.CATEGORY_SPACE : r'\s', _sre.CATEGORY_NOT_SPACE : r'\S',
+    }
+    _REPEATS = { _sre.MAX_REPEAT, _sre.MIN_REPEAT, getattr( _sre, 'POSSESSIVE_REPEAT', _sre.MAX_REPEAT ) }
+except AttributeError:  # No parser, or its constants changed.
+    _sre_parse = None
+
+
+def _first(items) -> Optional[Tuple[Set[str], bool]]:
+    # Character-class items that can start a match of the parsed sequence, and whether it can match empty.
+    # None when the start cannot be described simply; the caller then does without a prefilter.
+    chars :Set[str] = set()
+    for op, av in items:
+        if op is _sre.LITERAL:
+            chars.add( re.escape( chr( av ) ) )
+            return chars, False
+        if op is _sre.IN:
+            for kind, value in av:
+                if kind is _sre.LITERAL:
+                    chars.add( re.escape( chr( value ) ) )
+                elif kind is _sre.RANGE:
+                    chars.add( f'{re.escape( chr( value[0] ) )}-{re.escape( chr( value[1] ) )}' )
+                elif kind is _sre.CATEGORY and value in _CATEGORIES:
+                    chars.add( _CATEGORIES[value] )
+                else:
+                    return None
+            return chars, False
+        if op is _sre.AT:
+            continue
+        if op is _sre.SUBPATTERN:
+            if av[1] & re.IGNORECASE:
+                return None
+            inner = _first( av[-1] )
+        elif op is _sre.BRANCH:
+            inner = ( set(), False )
+            for branch in av[1]:
+                found = _first( branch )
+                if found is None:
+                    return None
+                inner = ( inner[0] | found[0], inner[1] or found[1] )
+        elif op in _REPEATS:
+            inner = _first( av[2] )
+            if inner is not None and av[0] == 0:
+                inner = ( inner[0], True )
+        elif op is getattr( _sre, 'ATOMIC_GROUP', None ):
+            inner = _first( av )
+        else:
+            return None
+        if inner is None:
+            return None
+        chars |= inner[0]
+        if not inner[1]:
+            return chars, False
+    return chars, True
+
+
+def _prefilter(source:str, flags:int) -> str:
+    # A lookahead on the possible first characters lets the scan skip positions where no rule can start,
+    # instead of trying every alternative at every position.
+    if _sre_parse is None:
+        return source
+    try:
+        found = _first( _sre_parse.parse( source, flags ) )
+    except Exception:
+        return source
+    if found is None or found[1] or not found[0]:
+        return source
+    return f'(?=[{"".join( sorted( found[0] ) )}])(?:{source})'
+
+
+class Highlighter:
+    """
+    Multi-pattern highlighter that colors every rule in a single pass per line.
+
+    All rules are compiled into one alternation, `(rule0)|(rule1)|...`, so the cost of a line does not grow
+    with one regex scan per rule. Overlaps are resolved the way the regex engine scans: the match that starts
+    leftmost wins, and among matches starting at the same position the earlier rule wins. Highlighted spans never
+    nest and scanning resumes after the end of each span. Empty matches are left unstyled.
+
+    Rules may use their own groups and named groups, but numbered backreferences (`\\1`) are not supported, since
+    groups are renumbered in the combined pattern. Input lines are expected to be unstyled.
+
+    A `Text` rule wraps each match in its escape codes; an `Alias` rule replaces the match with the alias in the
+    chosen `form`, e.g. to turn a level name into a badge. When the patterns are `bytes`, the highlighter works on
+    `bytes` (or any bytes-like object) and writes escape codes encoded with `encoding`, so raw input never needs
+    decoding.
+
+    When every rule starts with a known set of characters, the combined pattern is guarded by a lookahead on
+    that set, so positions where no rule can start are skipped with a single test.
+
+    `Parameters`:
+    - `rules`   : Sequence of `(pattern, style)` pairs, in priority order. `pattern` is a regex string, `bytes` or
+                  a compiled pattern, `style` a `Text` or an `Alias`. All patterns must be `str` or all `bytes`.
+    - `flags`   : `re` flags applied to the combined pattern. Flags of compiled rule patterns apply to that rule only.
+    - `form`    : `Alias` form used by `Alias` rules: `'Banner'`, `'Badge'` or `'Bare'`.
+    - `encoding`: Encoding of the escape codes for `bytes` patterns.
+
+    `Example`:
+    ```
+        highlight = Highlighter( [ (r'\\b(?:ERROR|FATAL)\\b', Text(Colors.RED1, ANSI.BOLD)),
+                                   (r'\\b\\d{1,3}(?:\\.\\d{1,3}){3}\\b', Text(Colors.CADETBLUE1)),
+                                   (r'\\b\\d+(?:\\.\\d+)?\\b', Text(Colors.GOLD1)) ] )
+        with open("server.log") as log:
+            highlight.write( log, sys.stdout )
+    ```
+    """
+
+    FORMS:Tuple[str,...] = ('Banner', 'Badge', 'Bare')
+
+    def __init__(self, rules:Sequence[Rule], flags:int=0, form:str='Banner', encoding:str='utf-8') -> None:
+        if not rules:
+            raise ValueError('Highlighter needs at least one rule')
+        if form not in self.FORMS:
+            raise ValueError(f'Highlighter does not support {form!r} form, expected one of {self.FORMS}')
+        binary = { isinstance( getattr( pattern, 'pattern', pattern ), bytes ) for pattern, _ in rules }
+        if len( binary ) > 1:
+            raise ValueError('Highlighter patterns must be all str or all bytes')
+
+        self.rules      :List[Rule] = list( rules )
+        self.form       :str = form
+        self.encoding   :str = encoding
+        self.binary     :bool = binary.pop()
+        self._groups    :Dict[int, Union[Text, Alias]] = {}
+        sources         :List[str] = []
+        index           :int = 1
+        for pattern, style in self.rules:
+            source = _source( pattern )
+            try:
+                groups = re.compile( f'({source})'.encode('latin-1') if self.binary else f'({source})', flags ).groups
+            except re.error as error:
+                raise ValueError(f'Invalid highlighter pattern {source!r}: {error} '
+                                 '(use scoped flags such as "(?i:...)" or a compiled pattern)') from None
+            self._groups[index] = style
+            sources.append( f'({source})' )
+            index += groups
+        combined        = _prefilter( '|'.join( sources ), flags )
+        try:
+            self.pattern:Pattern = re.compile( combined.encode('latin-1') if self.binary else combined, flags )
+        except re.error as error:
+            # Every rule compiles alone, so find the first one that clashes with the rules before it.
+            for end, ( pattern, _ ) in enumerate( self.rules, 1 ):
+                joined = '|'.join( sources[:end] )
+                try:
+                    re.compile( joined.encode('latin-1') if self.binary else joined, flags )
+                except re.error:
+                    break
+            raise ValueError(f'Highlighter pattern {_source( pattern )!r} conflicts with an earlier rule: {error} '
+                             '(group names must be unique across all rules)') from None
+        self._codes     :Dict[int, Tuple[AnyStr, Optional[AnyStr]]] = {}
+        self._generation:int = -1
+
+    def refresh(self) -> None:
+        """
+        Resolve the escape codes of every rule for the active `Terminal` mode. Called automatically when the mode changes.
+        """
+        codes = {}
+        for index, style in self._groups.items():
+            prefix, suffix = ( getattr( style, self.form ), None ) if isinstance( style, Alias ) else ( style.prefix, style.suffix )
+            if self.binary:
+                prefix, suffix = prefix.encode( self.encoding ), suffix.encode( self.encoding ) if suffix is not None else None
+            codes[index] = ( prefix, suffix )
+        self._codes      = codes
+        self._generation = Terminal.generation
+
+    def __call__(self, line:AnyStr) -> AnyStr:
+        """
+        Return `line` with every match styled by its rule. `line` may hold several lines.
+        """
+        if Terminal.plain:
+            return line
+        if self._generation != Terminal.generation:
+            self.refresh()
+        return self.pattern.sub( self._replace, line )
+
+    def lines(self, lines:Iterable[str]) -> Iterator[str]:
+        """
+        Lazily highlight every line of `lines`, e.g. an open log file.
+        """
+        if Terminal.plain:
+            return iter( lines )
+        if self._generation != Terminal.generation:
+            self.refresh()
+        sub, replace = self.pattern.sub, self._replace
+        return ( sub( replace, line ) for line in lines )
+
+    def write(self, lines:Iterable[str], stream:TextIO, chunk_size:int=1024) -> int:
+        """
+        Highlight `lines` and write them to `stream`, batching `chunk_size` lines per `write` call. With `bytes`
+        patterns, `stream` must accept `bytes`, e.g. `sys.stdout.buffer`.
+
+        Lines are written as given, so lines read from a file keep their own line endings.
+
+        `Returns`:
+        - The number of lines written.
+        """
+        count       :int = 0
+        highlighted = self.lines( lines )
+        join        = b''.join if self.binary else ''.join
+        while True:
+            chunk = list( islice( highlighted, chunk_size ) )
+            if not chunk:
+                return count
+            stream.write( join( chunk ) )
+            count += len( chunk )
+
+    def _replace(self, match:Match) -> AnyStr:
+        text = match.group()
+        if not text:
+            return text
+        prefix, suffix = self._codes[match.lastindex]
+        return prefix if suffix is None else prefix + text + suffix
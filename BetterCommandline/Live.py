@@ -0,0 +1,275 @@
+import sys
+import threading
+import time
+from typing import List, Optional, Sequence, TextIO, Tuple, Union
+
+from .Colors import ANSI, Colors
+from .Terminal import Terminal
+from .Text import Text
+from .Width import Width
+
+
+Cell = Tuple[str, str]
+
+HIDE_CURSOR :str = '\033[?25l'
+SHOW_CURSOR :str = '\033[?25h'
+CLEAR_LINE  :str = '\033[2K'
+CLEAR_END   :str = '\033[K'
+
+
+def _cells(line:str) -> List[Cell]:
+    # Split a styled line into (sgr_state, char) cells. Only SGR escape sequences are understood.
+    cells :List[Cell] = []
+    state :str = ''
+    index :int = 0
+    while True:
+        start = line.find( '\033', index )
+        chunk = line[index:] if start < 0 else line[index:start]
+        cells.extend( ( state, char ) for char in chunk )
+        if start < 0:
+            return cells
+        end = line.find( 'm', start )
+        if end < 0:
+            cells.extend( ( state, char ) for char in line[start:] )
+            return cells
+        code  = line[start:end + 1]
+        state = '' if code in ( ANSI.RESET, '\033[0m', '\033[0;0m' ) else state + code
+        index = end + 1
+
+
+def _span(cells:Sequence[Cell]) -> str:
+    output  :List[str] = []
+    current :str = ''
+    for state, char in cells:
+        if state != current:
+            output.append( ANSI.combine( ANSI.RESET, state ) if current else state )
+            current = state
+        output.append( char )
+    if current:
+        output.append( ANSI.RESET )
+    return ''.join( output )
+
+
+def _columns(cells:Sequence[Cell]) -> int:
+    return sum( Width.measure( char ) for _, char in cells )
+
+
+class Live:
+    """
+    Rate-limited live region that redraws only what changed.
+
+    `update` only stores the latest frame, so producers never block on terminal writes. A background thread
+    renders at most `fps` frames per second, coalescing intermediate updates, and diffs each frame against the
+    previous one: unchanged lines are skipped and, within a changed line, only the differing cells are rewritten
+    using cursor-movement escapes. Lines may contain `SGR` styling from `Text`, `Alias` or `Colored`.
+
+    In plain `Terminal` mode nothing is redrawn; the final frame is written once when the region stops.
+
+    `Parameters`:
+    - `stream`  : Writable text file object. Defaults to `sys.stdout`.
+    - `fps`     : Maximum number of redraws per second.
+
+    `Example`:
+    ```
+        with Live() as live:
+            for step in range(100):
+                live.update( [ f"step {step}", Text(Colors.GREEN1)("working...") ] )
+    ```
+    """
+
+    def __init__(self, stream:Optional[TextIO]=None, fps:float=10.0) -> None:
+        self.stream     :TextIO = stream if stream is not None else sys.stdout
+        self.interval   :float = 1.0 / fps
+        self.frames     :int = 0
+        self._frame     :Optional[List[str]] = None
+        self._dirty     :bool = False
+        self._shown     :List[List[Cell]] = []
+        self._height    :int = 0
+        self._lock      = threading.Lock()
+        self._wake      = threading.Event()
+        self._stopping  :bool = False
+        self._thread    :Optional[threading.Thread] = None
+
+    def update(self, frame:Union[str, Sequence[str]]) -> None:
+        """
+        Replace the content of the region. Returns immediately; the frame is drawn on the next refresh.
+        """
+        lines = frame.split('\n') if isinstance( frame, str ) else list( frame )
+        with self._lock:
+            self._frame, self._dirty = lines, True
+
+    def start(self) -> 'Live':
+        """
+        Start the refresh thread.
+        """
+        if self._thread is None:
+            self._stopping = False
+            if not Terminal.plain:
+                self._write( HIDE_CURSOR )
+            self._thread = threading.Thread( target=self._run, name='Live', daemon=True )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Draw the final frame, stop the refresh thread and restore the cursor.
+        """
+        if self._thread is not None:
+            self._stopping = True
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        if Terminal.plain:
+            with self._lock:
+                frame, self._dirty = self._frame, False
+            if frame is not None:
+                self._write( '\n'.join( frame ) + '\n' )
+        else:
+            self.refresh()
+            self._write( SHOW_CURSOR )
+
+    def refresh(self) -> None:
+        """
+        Draw the pending frame now, if there is one.
+        """
+        with self._lock:
+            frame, dirty, self._dirty = self._frame, self._dirty, False
+        if dirty and frame is not None and not Terminal.plain:
+            self._write( self.diff( frame ) )
+            self.frames += 1
+
+    def diff(self, frame:Sequence[str]) -> str:
+        """
+        Return the escape sequence that turns the previously drawn frame into `frame`, and record `frame` as drawn.
+
+        The cursor rests at the start of the line below the region between frames.
+        """
+        output  :List[str] = []
+        row     :int = self._height
+        shown   = self._shown
+        for index, line in enumerate( frame ):
+            cells = _cells( line )
+            if index >= self._height:
+                if row != self._height:
+                    output.append( f'\033[{self._height - row}B\r' )
+                output.append( _span( cells ) + '\n' )
+                self._height += 1
+                row = self._height
+                shown.append( cells )
+                continue
+
+            old = shown[index]
+            if cells == old:
+                continue
+            start = 0
+            limit = min( len( old ), len( cells ) )
+            while start < limit and old[start] == cells[start]:
+                start += 1
+            end = 0
+            while end < limit - start and old[-1 - end] == cells[-1 - end]:
+                end += 1
+
+            output.append( f'\033[{row - index}A' if row > index else ( f'\033[{index - row}B' if index > row else '' ) )
+            row = index
+            column = _columns( cells[:start] )
+            output.append( f'\r\033[{column}C' if column else '\r' )
+            middle_old, middle_new = old[start:len( old ) - end], cells[start:len( cells ) - end]
+            if _columns( middle_old ) == _columns( middle_new ):
+                # The tail stays in place, so only the changed cells are rewritten.
+                output.append( _span( middle_new ) )
+            else:
+                output.append( _span( cells[start:] ) + CLEAR_END )
+            shown[index] = cells
+
+        for index in range( len( frame ), self._height ):
+            if shown[index]:
+                output.append( f'\033[{row - index}A' if row > index else ( f'\033[{index - row}B' if index > row else '' ) )
+                output.append( '\r' + CLEAR_LINE )
+                row = index
+                shown[index] = []
+
+        if row != self._height:
+            output.append( f'\033[{self._height - row}B' )
+        output.append( '\r' )
+        return ''.join( output )
+
+    def __enter__(self) -> 'Live':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            started = time.monotonic()
+            self.refresh()
+            remaining = self.interval - ( time.monotonic() - started )
+            if remaining > 0:
+                self._wake.wait( remaining )
+        self._wake.clear()
+
+    def _write(self, text:str) -> None:
+        self.stream.write( text )
+        self.stream.flush()
+
+
+class ProgressBar:
+    """
+    Progress bar drawn in a `Live` region.
+
+    `Parameters`:
+    - `total`       : Number of steps to completion.
+    - `label`       : Text shown before the bar.
+    - `width`       : Bar width in columns.
+    - `complete`    : `Optional` `Text` style for the completed part.
+    - `remaining`   : `Optional` `Text` style for the remaining part.
+    - `live`        : `Optional` `Live` region to draw into. A new one is created otherwise.
+
+    `Example`:
+    ```
+        with ProgressBar( len(files), label="upload" ) as bar:
+            for file in files:
+                upload( file )
+                bar.advance()
+    ```
+    """
+
+    def __init__(self, total:int, label:str='', width:int=40, complete:Optional[Text]=None,
+                 remaining:Optional[Text]=None, live:Optional[Live]=None) -> None:
+        self.total      :int = total
+        self.label      :str = label
+        self.width      :int = width
+        self.completed  :int = 0
+        self.complete   :Text = complete if complete is not None else Text( Colors.GREEN1 )
+        self.remaining  :Text = remaining if remaining is not None else Text( Colors.GRAY30 )
+        self.live       :Live = live if live is not None else Live()
+
+    def render(self) -> str:
+        """
+        Return the bar as a styled line.
+        """
+        ratio  = min( max( self.completed / self.total, 0.0 ), 1.0 ) if self.total else 1.0
+        filled = int( ratio * self.width )
+        prefix = f'{self.label} ' if self.label else ''
+        return f'{prefix}{self.complete( "━" * filled )}{self.remaining( "━" * ( self.width - filled ) )} {ratio * 100:3.0f}%'
+
+    def update(self, completed:int) -> None:
+        """
+        Set the number of completed steps.
+        """
+        self.completed = completed
+        self.live.update( [ self.render() ] )
+
+    def advance(self, steps:int=1) -> None:
+        """
+        Add `steps` completed steps.
+        """
+        self.update( self.completed + steps )
+
+    def __enter__(self) -> 'ProgressBar':
+        self.live.update( [ self.render() ] )
+        self.live.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.live.stop()
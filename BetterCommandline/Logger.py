@@ -0,0 +1,149 @@
+import logging
+import sys
+import threading
+from queue import SimpleQueue
+from typing import Dict, List, Mapping, Optional, TextIO, Tuple, Union
+
+from .Alias import Alias
+from .Colors import ANSI, Colors
+from .Console import _drain
+from .Terminal import Terminal
+from .Text import Text
+
+
+def default_aliases() -> Dict[int, Alias]:
+    """
+    Return the default per-level aliases used by `AliasFormatter`.
+    """
+    return {
+        logging.DEBUG   : Alias('DEBUG',    Colors.GRAY80,  Colors.GRAY20,      banner_width=10),
+        logging.INFO    : Alias('INFO',     Colors.BLACK,   Colors.SEAGREEN3,   banner_width=10),
+        logging.WARNING : Alias('WARNING',  Colors.BLACK,   Colors.ORANGE1,     banner_width=10),
+        logging.ERROR   : Alias('ERROR',    Colors.WHITE,   Colors.FIREBRICK3,  banner_width=10, style=ANSI.BOLD),
+        logging.CRITICAL: Alias('CRITICAL', Colors.WHITE,   Colors.RED1,        banner_width=10, style=ANSI.BOLD),
+    }
+
+
+class AliasFormatter(logging.Formatter):
+    """
+    `logging.Formatter` that prefixes every record with a precompiled per-level `Alias`.
+
+    Level prefixes are rendered once per `Terminal` mode and looked up by level number, so formatting a record
+    costs one dictionary lookup on top of the standard `logging.Formatter`. Levels without an alias use the
+    alias of the closest lower level.
+
+    `Parameters`:
+    - `fmt`, `datefmt`, `style` : Passed to `logging.Formatter`.
+    - `aliases`                 : `Optional` mapping of level numbers to `Alias` instances. Defaults to `default_aliases()`.
+    - `form`                    : Which `Alias` form to use as prefix: `'Banner'`, `'Badge'` or `'Bare'`.
+    - `time_color`              : `Optional` color for the `asctime` field.
+
+    `Example`:
+    ```
+        handler = logging.StreamHandler()
+        handler.setFormatter( AliasFormatter('%(asctime)s %(message)s', time_color=Colors.GRAY60) )
+    ```
+    """
+
+    FORMS:Tuple[str,...] = ('Banner', 'Badge', 'Bare')
+
+    def __init__(self, fmt:Optional[str]=None, datefmt:Optional[str]=None, style:str='%',
+                 aliases:Optional[Mapping[int, Alias]]=None, form:str='Banner',
+                 time_color:Union[Tuple[int,int,int],str,None]=None) -> None:
+        super().__init__(fmt, datefmt, style)
+        if form not in self.FORMS:
+            raise ValueError(f'AliasFormatter does not support {form!r} form, expected one of {self.FORMS}')
+
+        self.aliases    :Dict[int, Alias] = dict( default_aliases() if aliases is None else aliases )
+        self.form       :str = form
+        self.time_text  :Optional[Text] = Text( time_color ) if time_color is not None else None
+        self._prefixes  :Dict[int, str] = {}
+        self._generation:int = Terminal.generation
+
+    def prefix(self, levelno:int) -> str:
+        """
+        Return the rendered prefix (including the trailing space) for a level number.
+        """
+        if self._generation != Terminal.generation:
+            self._prefixes, self._generation = {}, Terminal.generation
+        prefix = self._prefixes.get( levelno )
+        if prefix is None:
+            lower = [ level for level in self.aliases if level <= levelno ]
+            level = max( lower ) if lower else min( self.aliases, default=None )
+            prefix = getattr( self.aliases[level], self.form ) + ' ' if level is not None else ''
+            self._prefixes[levelno] = prefix
+        return prefix
+
+    def formatTime(self, record:logging.LogRecord, datefmt:Optional[str]=None) -> str:
+        asctime = super().formatTime( record, datefmt )
+        return self.time_text( asctime ) if self.time_text is not None else asctime
+
+    def format(self, record:logging.LogRecord) -> str:
+        return self.prefix( record.levelno ) + super().format( record )
+
+
+class BackgroundHandler(logging.Handler):
+    """
+    `logging.Handler` that hands records to a background thread, which formats and writes them in batches.
+
+    `emit` only enqueues the record, so logging calls return quickly even when the terminal is slow. The writer
+    drains up to `batch_size` records at a time and writes them with a single `write` call. Because formatting
+    happens on the writer thread, objects passed as logging arguments should not be mutated after the call.
+
+    `Parameters`:
+    - `stream`      : Writable text file object. Defaults to `sys.stderr`.
+    - `batch_size`  : Maximum number of records written per `write` call.
+    - `level`       : Handler level.
+
+    `Example`:
+    ```
+        handler = BackgroundHandler()
+        handler.setFormatter( AliasFormatter('%(message)s') )
+        logging.getLogger().addHandler( handler )
+    ```
+    """
+
+    def __init__(self, stream:Optional[TextIO]=None, batch_size:int=512, level:int=logging.NOTSET) -> None:
+        super().__init__(level)
+        self.stream     :TextIO = stream if stream is not None else sys.stderr
+        self.batch_size :int = batch_size
+        self._queue     :SimpleQueue = SimpleQueue()
+        self._closed    :bool = False
+        self._thread    = threading.Thread( target=_drain, args=( self._queue, batch_size, self._write ), name='BackgroundHandler', daemon=True )
+        self._thread.start()
+
+    def emit(self, record:logging.LogRecord) -> None:
+        self._queue.put( record )
+
+    def flush(self) -> None:
+        """
+        Block until every record enqueued so far has been written.
+        """
+        if self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put( done )
+            done.wait()
+
+    def close(self) -> None:
+        """
+        Write the remaining records and stop the writer thread.
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put( None )
+            self._thread.join()
+        super().close()
+
+    def _write(self, records:List[logging.LogRecord]) -> None:
+        lines :List[str] = []
+        for record in records:
+            try:
+                lines.append( self.format( record ) + '\n' )
+            except Exception:
+                self.handleError( record )
+        if lines:
+            try:
+                self.stream.write( ''.join( lines ) )
+                self.stream.flush()
+            except Exception:
+                self.handleError( records[-1] )
@@ -0,0 +1,202 @@
+import keyword
+import re
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .Colors import ANSI, Colored
+from .Palette import Palette
+from .Terminal import Terminal
+
+
+STYLES:Dict[str, str] = {
+    'bold'      : ANSI.BOLD,
+    'italics'   : ANSI.ITALICS,
+    'italic'    : ANSI.ITALICS,
+    'underlined': ANSI.UNDERLINED,
+    'underline' : ANSI.UNDERLINED,
+    'inverse'   : ANSI.INVERSE,
+    'blink'     : ANSI.BLINK,
+    'hidden'    : ANSI.HIDDEN,
+}
+
+Template = Callable[..., str]
+
+_SPEC = re.compile(r'[\w<>=^+\- #,.%]*')
+
+
+class Markup:
+    """
+    Markup mini-language compiled to cached render templates.
+
+    `Syntax`:
+    - `[tokens]text[/]`  : Style `text`. Tags nest; `[/]` closes the innermost tag, `[/tokens]` must match it.
+    - Tokens             : Style names (`bold`, `italics`, `underlined`, `inverse`, `blink`, `hidden`),
+                           `#RRGGBB` colors or `Colors` names (`red1`, `cadet_blue_3`). `on <color>` sets the background.
+    - `[[`               : A literal `[`.
+    - `{name}`, `{}`     : Slots filled when rendering, with `str.format` semantics (`{{` for a literal brace).
+
+    A compiled template is a plain function whose escape codes are baked into a single f-string, so rendering
+    is only slot substitution. Templates are kept in a bounded LRU cache keyed on the markup string and the
+    `Terminal` mode, and recompile themselves after the mode changes.
+
+    `Example`:
+    ```
+        warn = Markup.compile("[bold #ff8800]WARN[/] {msg}")
+        print( warn(msg="disk almost full") )
+        print( Markup.render("[white on red1] {} [/]", "FAILED") )
+    ```
+    """
+
+    CACHE_SIZE:int = 512
+
+    @staticmethod
+    def compile(markup:str) -> Template:
+        """
+        Return the compiled template for `markup`, from the cache when possible.
+        """
+        return _compile( markup, Terminal.generation )
+
+    @staticmethod
+    def render(markup:str, *args:Any, **kwargs:Any) -> str:
+        """
+        Compile `markup` (cached) and fill its slots.
+        """
+        return _compile( markup, Terminal.generation )( *args, **kwargs )
+
+    @staticmethod
+    def cache_info() -> Any:
+        """
+        Return the hit/miss statistics of the template cache.
+        """
+        return _compile.cache_info()
+
+    @staticmethod
+    def parse(markup:str) -> str:
+        """
+        Translate `markup` into a format string with the escape codes for the active `Terminal` mode.
+        """
+        output :List[str] = []
+        stack  :List[Tuple[str, str]] = []
+        index  :int = 0
+        while True:
+            start = markup.find( '[', index )
+            if start < 0:
+                output.append( markup[index:] )
+                break
+            output.append( markup[index:start] )
+            if markup.startswith( '[[', start ):
+                output.append( '[' )
+                index = start + 2
+                continue
+            end = markup.find( ']', start )
+            if end < 0:
+                raise ValueError(f'Unclosed markup tag at position {start} in {markup!r}')
+            tag, index = markup[start + 1:end].strip(), end + 1
+
+            if tag.startswith( '/' ):
+                if not stack:
+                    raise ValueError(f'Markup closing tag [{tag}] has no matching opening tag in {markup!r}')
+                opened, _ = stack.pop()
+                if tag != '/' and tag[1:].strip() != opened:
+                    raise ValueError(f'Markup closing tag [{tag}] does not match [{opened}] in {markup!r}')
+                if not Terminal.plain:
+                    output.append( ANSI.combine( ANSI.RESET, *( code for _, code in stack ) ) )
+            else:
+                code = _tag_code( tag )
+                stack.append( ( tag, code ) )
+                if not Terminal.plain:
+                    output.append( code )
+
+        if stack and not Terminal.plain:
+            output.append( ANSI.RESET )
+        return ''.join( output )
+
+
+def _color(token:str, tag:str) -> Union[Tuple[int,int,int],str]:
+    if token.startswith( '#' ):
+        if len( token ) != 7:
+            raise ValueError(f'Markup color {token!r} in [{tag}] must be #RRGGBB')
+        return token
+    rgb = Palette.default().get( token )
+    if rgb is None:
+        raise ValueError(f'Unknown markup style or color {token!r} in [{tag}]')
+    return rgb
+
+
+def _tag_code(tag:str) -> str:
+    codes  :List[str] = []
+    tokens :List[str] = tag.split()
+    index  :int = 0
+    while index < len( tokens ):
+        token = tokens[index].lower()
+        if token in STYLES:
+            codes.append( STYLES[token] )
+        elif token == 'on':
+            if index + 1 == len( tokens ):
+                raise ValueError(f'Markup tag [{tag}] is missing a color after "on"')
+            index += 1
+            codes.append( Colored.Background( _color( tokens[index], tag ) ) )
+        else:
+            codes.append( Colored.Foreground( _color( token, tag ) ) )
+        index += 1
+    return ANSI.combine( *codes )
+
+
+def _fstring(compiled:str) -> Optional[Tuple[str, List[str], List[str]]]:
+    # Turn the format string into f-string source, or None when it uses fields an f-string cannot express simply.
+    source      :List[str] = []
+    positional  :List[str] = []
+    named       :List[str] = []
+    auto        :int = 0
+    manual      :bool = False
+    for literal, field, spec, conversion in Formatter().parse( compiled ):
+        source.append( literal.replace( '{', '{{' ).replace( '}', '}}' ) )
+        if field is None:
+            continue
+        if conversion not in ( None, 's', 'r', 'a' ):
+            raise ValueError(f'Markup slot {{{field}!{conversion}}} has an unknown conversion, expected !s, !r or !a')
+        if field == '' or field.isdigit():
+            position = auto if field == '' else int( field )
+            auto    += field == ''
+            manual   = manual or field != ''
+            if auto and manual:
+                return None
+            while len( positional ) <= position:
+                positional.append( f'_markup_{len( positional )}' )
+            name = positional[position]
+        elif field.isidentifier() and not keyword.iskeyword( field ) and not field.startswith( '_markup_' ):
+            name = field
+            if name not in named:
+                named.append( name )
+        else:
+            return None
+        if not _SPEC.fullmatch( spec or '' ):
+            return None
+        source.append( '{' + name + ( f'!{conversion}' if conversion else '' ) + ( f':{spec}' if spec else '' ) + '}' )
+    return 'f' + repr( ''.join( source ) ), positional, named
+
+
+@lru_cache(maxsize=Markup.CACHE_SIZE)
+def _compile(markup:str, generation:int) -> Template:
+    compiled = Markup.parse( markup )
+    parsed   = _fstring( compiled )
+    if parsed is None:
+        render = compiled.format
+
+        def template(*args:Any, **kwargs:Any) -> str:
+            if Terminal.generation != generation:
+                return Markup.compile( markup )( *args, **kwargs )
+            return render( *args, **kwargs )
+        return template
+
+    source, positional, named = parsed
+    parameters  = ', '.join( positional + [ '*_markup_args' ] + named + [ '**_markup_kwargs' ] )
+    forward     = ', '.join( positional + [ '*_markup_args' ] + [ f'{name}={name}' for name in named ] + [ '**_markup_kwargs' ] )
+    code        = ( f'def template({parameters}):\n'
+                    f'    if _markup_terminal.generation != {generation}:\n'
+                    f'        return _markup_compile(_markup_source)({forward})\n'
+                    f'    return {source}\n' )
+    namespace   = { '_markup_terminal': Terminal, '_markup_compile': Markup.compile, '_markup_source': markup }
+    exec( code, namespace )
+    return namespace['template']
@@ -0,0 +1,179 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from .Colors import ANSI
+from .Style import Style
+from .Terminal import Terminal, _BASIC
+
+
+# One pattern for every escape sequence: SGR codes capture their parameters, anything else (cursor movement,
+# OSC titles and links, two-character escapes) matches without a group and is dropped. `[` and `]` are left out
+# of the two-character form so that a CSI or OSC sequence cut off at the end of a chunk is seen as incomplete.
+_TOKENS = re.compile(r'\033(?:\[([0-9;]*)m|\[[0-?]*[ -/]*[@-~]|\][^\007\033]*(?:\007|\033\\)|[@-Z\\^_])')
+
+_ON :Dict[int, int] = { 1: Style.BOLD, 3: Style.ITALICS, 4: Style.UNDERLINED, 5: Style.BLINK, 7: Style.INVERSE, 8: Style.HIDDEN }
+_OFF:Dict[int, int] = { 22: Style.BOLD, 23: Style.ITALICS, 24: Style.UNDERLINED, 25: Style.BLINK, 27: Style.INVERSE, 28: Style.HIDDEN }
+
+EMPTY:Style = Style()
+
+
+class Span(NamedTuple):
+    style   :Style
+    text    :str
+
+
+@lru_cache(maxsize=4096)
+def _apply(state:Style, parameters:str) -> Style:
+    # The style after applying one SGR parameter list to `state`. Styles are interned, so they make cheap cache keys.
+    foreground, background, attributes = state.foreground, state.background, state.attributes
+    values = parameters.split(';')
+    index  = 0
+    while index < len( values ):
+        code = int( values[index] ) if values[index] else 0
+        if code == 0:
+            foreground, background, attributes = None, None, 0
+        elif code in _ON:
+            attributes |= _ON[code]
+        elif code in _OFF:
+            attributes &= ~_OFF[code]
+        elif 30 <= code <= 37 or 90 <= code <= 97:
+            foreground = _BASIC[code - 30 if code < 90 else code - 82]
+        elif 40 <= code <= 47 or 100 <= code <= 107:
+            background = _BASIC[code - 40 if code < 100 else code - 92]
+        elif code == 39:
+            foreground = None
+        elif code == 49:
+            background = None
+        elif code in (38, 48):
+            kind = values[index + 1] if index + 1 < len( values ) else ''
+            if kind == '5' and index + 2 < len( values ) and values[index + 2]:
+                rgb    = Terminal.from_256( min( int( values[index + 2] ), 255 ) )
+                index += 2
+            elif kind == '2' and index + 4 < len( values ):
+                rgb    = tuple( min( int( value or 0 ), 255 ) for value in values[index + 2:index + 5] )
+                index += 4
+            else:
+                break
+            if code == 38:
+                foreground = rgb
+            else:
+                background = rgb
+        index += 1
+    return Style( foreground, background, attributes )
+
+
+class AnsiParser:
+    """
+    Tokenizer that turns styled text into `(style, text)` spans.
+
+    Every escape sequence is found by a single compiled regex (one `re.split` call per chunk), and each distinct
+    `SGR` parameter list is decoded once per style it applies to. Styles are interned `Style` objects, so they can
+    be compared with `is`, used as keys, or rendered again in any `Terminal` mode. Everything `ANSI`, `Colored`,
+    `Text` and `Alias` emit is understood: 24-bit, 256 and 16 colors, default colors, attributes and resets.
+    Other escape sequences are dropped; consecutive text in the same style is merged into one span.
+
+    Feed chunks of a stream with `feed`; a sequence split across chunks is held back until it is complete.
+
+    `Example`:
+    ```
+        AnsiParser.parse( Text( Colors.RED1, ANSI.BOLD )("disk full") + " ok" )
+        # [Span(style=Style(foreground=(255, 0, 0), background=None, attributes=BOLD), text='disk full'),
+        #  Span(style=Style(foreground=None, background=None, attributes=0), text=' ok')]
+
+        parser = AnsiParser()
+        for chunk in iter( lambda: pipe.read(65536), '' ):
+            spans = parser.feed( chunk )
+        spans = parser.close()
+    ```
+    """
+
+    MAX_PENDING:int = 4096
+
+    def __init__(self) -> None:
+        self.state      :Style = EMPTY
+        self._pending   :str = ''
+
+    def feed(self, chunk:str) -> List[Span]:
+        """
+        Tokenize the next chunk of a stream, continuing from the style state left by the previous chunk.
+        """
+        text, self._pending = self._pending + chunk, ''
+        escape = text.rfind( '\033' )
+        if escape >= 0 and not _TOKENS.match( text, escape ):
+            # The escape may be the first half of the `ESC \` terminator of an OSC sequence still open.
+            osc = text.rfind( '\033]', 0, escape )
+            if osc >= 0 and not _TOKENS.match( text, osc ):
+                escape = osc
+            if len( text ) - escape < self.MAX_PENDING:
+                text, self._pending = text[:escape], text[escape:]
+        spans, self.state = _spans( text, self.state )
+        return spans
+
+    def close(self) -> List[Span]:
+        """
+        Return the spans for an incomplete sequence still held back (kept as text) and reset the parser.
+        """
+        pending, self._pending = self._pending, ''
+        spans = [ Span( self.state, pending ) ] if pending else []
+        self.state = EMPTY
+        return spans
+
+    @staticmethod
+    def parse(text:str) -> List[Span]:
+        """
+        Tokenize a complete string, starting from the unstyled state.
+        """
+        return _spans( text, EMPTY )[0]
+
+    @staticmethod
+    def stream(chunks:Iterable[str]) -> Iterator[Span]:
+        """
+        Lazily tokenize an iterable of chunks, e.g. an open file.
+        """
+        parser = AnsiParser()
+        for chunk in chunks:
+            yield from parser.feed( chunk )
+        yield from parser.close()
+
+    @staticmethod
+    def render(spans:Iterable[Span]) -> str:
+        """
+        Render spans in the active `Terminal` mode, emitting a code only where the style changes.
+        """
+        if Terminal.plain:
+            return ''.join( span.text for span in spans )
+        output  :List[str] = []
+        current :Style = EMPTY
+        for style, text in spans:
+            if style is not current:
+                output.append( ANSI.combine( ANSI.RESET, style.code ) if current is not EMPTY else style.code )
+                current = style
+            output.append( text )
+        if current is not EMPTY:
+            output.append( ANSI.RESET )
+        return ''.join( output )
+
+
+def _spans(text:str, state:Style) -> Tuple[List[Span], Style]:
+    if '\033' not in text:
+        return ( [ Span( state, text ) ] if text else [] ), state
+    # `split` alternates text and captured SGR parameters (None for other escapes).
+    parts   = _TOKENS.split( text )
+    spans   :List[Span] = []
+    append  = spans.append
+    apply   = _apply
+    new     = tuple.__new__
+    pending :str = parts[0]
+    for parameters, text in zip( parts[1::2], parts[2::2] ):
+        if parameters is not None:
+            after = apply( state, parameters )
+            if after is not state:
+                if pending:
+                    append( new( Span, ( state, pending ) ) )
+                pending, state = text, after
+                continue
+        pending += text
+    if pending:
+        append( Span( state, pending ) )
+    return spans, state
@@ -0,0 +1,150 @@
+import sys
+from typing import List, Optional, TextIO, Tuple, Union
+
+from .Colors import ANSI, Colored
+from .Terminal import Terminal
+from .Style import Style
+from .Width import Width
+from .Text import Text
+from .Alias import Alias, _inner_width
+
+
+State = Tuple[str, str, str]
+PLAIN:State = ('', '', '')
+
+
+class StyledStream:
+    """
+    Buffered writer that tracks the terminal `SGR` state and only emits the escape codes that change between fragments.
+
+    Consecutive fragments sharing a style are written without any escape codes in between, and `ANSI.RESET`
+    is only emitted when an attribute has to be switched off. In plain `Terminal` mode only the text is written.
+
+    `Parameters`:
+    - `stream`      : Writable text file object. Defaults to `sys.stdout`.
+    - `buffer_size` : Number of characters buffered before they are written to `stream` in a single call.
+
+    `Example`:
+    ```
+        with StyledStream() as out:
+            out.write("Error: ", Colors.RED1, style=ANSI.BOLD)
+            out.text(Highlighter, "disk full")
+            out.write("\\n")
+    ```
+
+    `Attributes`:
+    - `writes`          : Number of `write` calls made on the underlying stream.
+    - `chars_written`   : Number of characters written to the underlying stream.
+    """
+
+    def __init__(self, stream:Optional[TextIO]=None, buffer_size:int=8192) -> None:
+        self.stream         :TextIO    = stream if stream is not None else sys.stdout
+        self.buffer_size    :int       = buffer_size
+        self.writes         :int       = 0
+        self.chars_written  :int       = 0
+        self._state         :State     = PLAIN
+        self._buffer        :List[str] = []
+        self._buffered      :int       = 0
+
+    def write(self, text:str, foreground:Union[Tuple[int,int,int],str,Style,None]=None,
+              background:Union[Tuple[int,int,int],str,None]=None, style:Union[str,Style,None]=None) -> None:
+        """
+        Write `text` with the given colors and style, emitting only the escape codes needed to reach that state.
+
+        `Parameters`:
+        - `text`        : Text to write.
+        - `foreground`  : `Optional` foreground color, as an RGB `tuple`, a `hexadecimal` color code or an `ANSI` escape code,
+                          or a complete `Style` (its background is used when `background` is omitted).
+        - `background`  : `Optional` background color, as an RGB `tuple`, a `hexadecimal` color code or an `ANSI` escape code.
+        - `style`       : `Optional` text style, e.g., bold, italics, as an `ANSI` code or a `Style`. Colors of a `Style`
+                          apply where `foreground` or `background` are omitted.
+        """
+        if isinstance( style, Style ):
+            foreground = foreground if foreground is not None else style.foreground
+            background = background if background is not None else style.background
+            style      = Style( attributes=style.attributes ).code
+        if isinstance( foreground, Style ):
+            background = background if background is not None else foreground.background
+            style      = ANSI.combine( Style( attributes=foreground.attributes ).code, style or '' )
+            foreground = foreground.foreground
+        if foreground is not None and ( not isinstance( foreground, str ) or not foreground.startswith('\033') ):
+            foreground = Colored.Foreground( foreground )
+        if background is not None and ( not isinstance( background, str ) or not background.startswith('\033') ):
+            background = Colored.Background( background )
+        self._emit( (foreground or '', background or '', style or ''), text )
+
+    def text(self, styler:Text, *parts:str, sep:str=' ') -> None:
+        """
+        Write `parts` styled with a `Text` instance.
+        """
+        self._emit( styler.codes, sep.join( parts ) )
+
+    def banner(self, alias:Alias) -> None:
+        """
+        Write the `Banner` form of an `Alias`.
+        """
+        self._emit( alias.codes, f'[{Width.center( alias.text, _inner_width( alias.banner_width ) )}]' )
+
+    def badge(self, alias:Alias) -> None:
+        """
+        Write the `Badge` form of an `Alias`.
+        """
+        self._emit( alias.codes, f'[{alias.badge_sign}]' )
+
+    def reset(self) -> None:
+        """
+        Return the terminal to its default state if any attribute is currently set.
+        """
+        self._emit( PLAIN, '' )
+
+    def flush(self) -> None:
+        """
+        Write the buffered output to the underlying stream and flush it.
+        """
+        self._drain()
+        self.stream.flush()
+
+    def close(self) -> None:
+        """
+        Reset the terminal state and flush. The underlying stream is left open.
+        """
+        self.reset()
+        self.flush()
+
+    def __enter__(self) -> 'StyledStream':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _emit(self, state:State, text:str) -> None:
+        if Terminal.plain:
+            state = PLAIN
+        current = self._state
+        if state != current:
+            self._push( self._transition( current, state ) )
+            self._state = state
+        if text:
+            self._push( text )
+
+    @staticmethod
+    def _transition(current:State, state:State) -> str:
+        # An attribute that is set now but absent (or different, for styles) in the target can only be cleared by a reset.
+        if ( current[0] and not state[0] ) or ( current[1] and not state[1] ) or ( current[2] and current[2] != state[2] ):
+            return ANSI.combine( ANSI.RESET, *state )
+        return ANSI.combine( *( new for old, new in zip( current, state ) if new != old ) )
+
+    def _push(self, text:str) -> None:
+        self._buffer.append( text )
+        self._buffered += len( text )
+        if self._buffered >= self.buffer_size:
+            self._drain()
+
+    def _drain(self) -> None:
+        if self._buffer:
+            data = ''.join( self._buffer )
+            self.stream.write( data )
+            self.writes         += 1
+            self.chars_written  += len( data )
+            self._buffer.clear()
+            self._buffered = 0
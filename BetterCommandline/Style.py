@@ -0,0 +1,133 @@
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple, Union
+from weakref import WeakValueDictionary
+
+from .Colors import ANSI, Colored, _normalize
+from .Terminal import Terminal
+
+
+RGB   = Tuple[int,int,int]
+Color = Union[RGB, str, None]
+
+_SGR:Dict[str, int] = { '1': 1, '3': 2, '4': 4, '7': 8, '5': 16, '8': 32 }
+
+
+def _attributes(value:Union[int, str, None]) -> int:
+    # Attribute flags from an int, or from `ANSI` style codes such as `ANSI.BOLD` or `ANSI.combine(ANSI.BOLD, ANSI.ITALICS)`.
+    if value is None:
+        return 0
+    if isinstance( value, int ):
+        if not 0 <= value < 64:
+            raise ValueError(f'Style attributes must be a combination of Style flags, got {value}')
+        return value
+    if value and not value.startswith('\033['):
+        raise ValueError(f'Style attributes must be flags or ANSI style codes, got {value!r}')
+    flags = 0
+    for chunk in value.split('\033[')[1:]:
+        for parameter in chunk.rstrip('m').split(';'):
+            if parameter not in _SGR:
+                raise ValueError(f'Style does not support the {value!r} escape code, only text attributes such as ANSI.BOLD')
+            flags |= _SGR[parameter]
+    return flags
+
+
+class Style:
+    """
+    Immutable, interned text style: foreground, background and attribute flags.
+
+    Equal styles are the same object, so thousands of identical combinations share one instance and one escape
+    code, computed once per `Terminal` mode. Styles are hashable and compose with `+`: colors from the right side
+    win when set, and attributes are merged. `Text` and `Alias` accept a `Style` wherever they accept a style.
+
+    `Parameters`:
+    - `foreground`  : `Optional` foreground color, as an RGB `tuple` or a `hexadecimal` color code.
+    - `background`  : `Optional` background color, as an RGB `tuple` or a `hexadecimal` color code.
+    - `attributes`  : `Optional` flags (`Style.BOLD | Style.ITALICS`) or `ANSI` style codes (`ANSI.BOLD`).
+
+    `Example`:
+    ```
+        error   = Style( Colors.RED1 ) + ANSI.BOLD
+        heading = error + Style( attributes=Style.UNDERLINED )
+        print( error("failed"), Text( heading )("Summary") )
+        assert Style( Colors.RED1, attributes=Style.BOLD ) is error
+    ```
+    """
+
+    BOLD        :int = 1
+    ITALICS     :int = 2
+    UNDERLINED  :int = 4
+    INVERSE     :int = 8
+    BLINK       :int = 16
+    HIDDEN      :int = 32
+
+    CODES:Tuple[Tuple[int, str],...] = ( (1, ANSI.BOLD), (2, ANSI.ITALICS), (4, ANSI.UNDERLINED),
+                                         (8, ANSI.INVERSE), (16, ANSI.BLINK), (32, ANSI.HIDDEN) )
+
+    __slots__ = ('foreground', 'background', 'attributes', '_code', '_generation', '__weakref__')
+
+    _interned   :'WeakValueDictionary[Tuple[Any,...], Style]' = WeakValueDictionary()
+    _lock       = Lock()
+
+    def __new__(cls, foreground:Color=None, background:Color=None, attributes:Union[int, str, None]=None) -> 'Style':
+        key = ( _normalize( foreground, 'Style' ) if foreground is not None else None,
+                _normalize( background, 'Style' ) if background is not None else None,
+                _attributes( attributes ) )
+        style = cls._interned.get( key )
+        if style is None:
+            with cls._lock:
+                style = cls._interned.get( key )
+                if style is None:
+                    style = object.__new__( cls )
+                    for name, value in zip( ('foreground', 'background', 'attributes'), key ):
+                        object.__setattr__( style, name, value )
+                    object.__setattr__( style, '_code', '' )
+                    object.__setattr__( style, '_generation', -1 )
+                    cls._interned[key] = style
+        return style
+
+    @property
+    def code(self) -> str:
+        """
+        The combined `ANSI` escape code of the style in the active `Terminal` mode.
+        """
+        if self._generation != Terminal.generation:
+            codes = [ code for flag, code in self.CODES if self.attributes & flag ]
+            if self.foreground is not None:
+                codes.insert( 0, Colored.Foreground( self.foreground ) )
+            if self.background is not None:
+                codes.insert( 1 if self.foreground is not None else 0, Colored.Background( self.background ) )
+            object.__setattr__( self, '_code', ANSI.combine( *codes ) )
+            object.__setattr__( self, '_generation', Terminal.generation )
+        return self._code
+
+    def __call__(self, *parts:str, sep:str=' ') -> str:
+        """
+        Return the parts joined by `sep` in this style, like `Text`.
+        """
+        if Terminal.plain:
+            return sep.join( parts )
+        return f'{self.code}{sep.join( parts )}{ANSI.RESET}'
+
+    def __add__(self, other:Union['Style', str, int]) -> 'Style':
+        if not isinstance( other, Style ):
+            try:
+                other = Style( attributes=other )
+            except ( ValueError, TypeError ):
+                return NotImplemented
+        return Style( other.foreground if other.foreground is not None else self.foreground,
+                      other.background if other.background is not None else self.background,
+                      self.attributes | other.attributes )
+
+    def __str__(self) -> str:
+        return self.code
+
+    def __repr__(self) -> str:
+        names = [ name for name in ('BOLD', 'ITALICS', 'UNDERLINED', 'INVERSE', 'BLINK', 'HIDDEN')
+                  if self.attributes & getattr( Style, name ) ]
+        return f'Style(foreground={self.foreground}, background={self.background}, attributes={"|".join( names ) or 0})'
+
+    def __setattr__(self, name:str, value:Any) -> None:
+        raise AttributeError('Style is immutable')
+
+    def __reduce__(self) -> Tuple[Any,...]:
+        return ( Style, ( self.foreground, self.background, self.attributes ) )
@@ -0,0 +1,157 @@
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+
+from .Text import Text
+from .Width import Width
+
+
+class Column:
+    """
+    Column of a `Table`.
+
+    `Parameters`:
+    - `header`  : Column title.
+    - `style`   : `Optional` `Text` used to style the cells of this column.
+    - `align`   : `'left'`, `'right'` or `'center'`.
+    - `width`   : `Optional` fixed width. When omitted, the width is measured from the rows (see `Table`).
+    - `max_width`: `Optional` upper bound for a measured width.
+    """
+
+    ALIGNMENTS:Tuple[str,...] = ('left', 'right', 'center')
+
+    __slots__ = ('header', 'style', 'align', 'width', 'max_width')
+
+    def __init__(self, header:str, style:Optional[Text]=None, align:str='left',
+                 width:Optional[int]=None, max_width:Optional[int]=None) -> None:
+        if align not in self.ALIGNMENTS:
+            raise ValueError(f'Column does not support {align!r} alignment, expected one of {self.ALIGNMENTS}')
+        self.header     :str = header
+        self.style      :Optional[Text] = style
+        self.align      :str = align
+        self.width      :Optional[int] = width
+        self.max_width  :Optional[int] = max_width
+
+
+class Table:
+    """
+    Streaming table renderer for large row iterators.
+
+    Column widths come either from the first `sample` rows (which are buffered and then streamed with the rest)
+    or, when `sample` is `None`, from a full first pass over a re-iterable source such as a list or a
+    `Sequence`. Rows are then rendered one at a time, so memory stays bounded by the sample window. Cells wider
+    than their column are truncated with `'…'`. Styled, padded cells are cached per distinct value, up to
+    `cache_size` values per column.
+
+    `Parameters`:
+    - `columns`     : `Column` instances or plain header strings.
+    - `sep`         : Separator between cells.
+    - `header_style`: `Optional` `Text` used to style the header row. `None` omits the header row.
+    - `sample`      : Number of rows used to measure column widths, or `None` for a full first pass.
+    - `cache_size`  : Maximum number of cached cells per column.
+
+    `Example`:
+    ```
+        table = Table( [ Column("job", Text(Colors.CADETBLUE1)), Column("seconds", align='right') ],
+                       header_style=Text(Colors.WHITE, ANSI.BOLD) )
+        table.write( ( (job.name, job.seconds) for job in jobs ), sys.stdout )
+    ```
+    """
+
+    def __init__(self, columns:Sequence[Union[Column, str]], sep:str='  ', header_style:Optional[Text]=None,
+                 sample:Optional[int]=1000, cache_size:int=4096) -> None:
+        self.columns      :List[Column] = [ column if isinstance( column, Column ) else Column( column ) for column in columns ]
+        self.sep          :str = sep
+        self.header_style :Optional[Text] = header_style
+        self.sample       :Optional[int] = sample
+        self.cache_size   :int = cache_size
+
+    def widths(self, rows:Iterable[Sequence[Any]]) -> List[int]:
+        """
+        Measure the column widths over `rows`, honoring fixed and maximum widths.
+        """
+        widths = [ Width.measure( column.header ) if self.header_style is not None else 0 for column in self.columns ]
+        for row in rows:
+            for index, value in enumerate( row[:len( widths )] ):
+                width = Width.measure( str( value ) )
+                if width > widths[index]:
+                    widths[index] = width
+        for index, column in enumerate( self.columns ):
+            if column.width is not None:
+                widths[index] = column.width
+            elif column.max_width is not None:
+                widths[index] = min( widths[index], column.max_width )
+        return widths
+
+    def rows(self, rows:Iterable[Sequence[Any]]) -> Iterator[str]:
+        """
+        Render `rows` lazily, yielding one line (without newline) per row, preceded by the header row if enabled.
+        """
+        if self.sample is None:
+            if iter( rows ) is rows:
+                raise ValueError('Table with sample=None needs a re-iterable source, not an iterator')
+            widths, source = self.widths( rows ), rows
+        else:
+            iterator = iter( rows )
+            window   = list( islice( iterator, self.sample ) )
+            widths, source = self.widths( window ), chain( window, iterator )
+
+        if self.header_style is not None:
+            yield self.sep.join( self._cell( column, column.header, width, self.header_style )
+                                 for column, width in zip( self.columns, widths ) )
+
+        caches  :List[Dict[Tuple[type, Any], str]] = [ {} for _ in self.columns ]
+        blanks  :List[str] = [ ' ' * width for width in widths ]
+        columns = list( zip( self.columns, widths, caches ) )
+        join    = self.sep.join
+        for row in source:
+            cells = []
+            for ( column, width, cache ), value in zip( columns, row ):
+                # Keyed on the type too: `1`, `True` and `1.0` are equal dict keys but render differently.
+                key = ( value.__class__, value )
+                try:
+                    cell = cache.get( key )
+                except TypeError:
+                    cell = self._cell( column, str( value ), width, column.style )
+                if cell is None:
+                    cell = self._cell( column, str( value ), width, column.style )
+                    if len( cache ) >= self.cache_size:
+                        cache.clear()
+                    cache[key] = cell
+                cells.append( cell )
+            if len( cells ) < len( columns ):
+                cells.extend( blanks[len( cells ):] )
+            yield join( cells )
+
+    def write(self, rows:Iterable[Sequence[Any]], stream:TextIO, chunk_size:int=1024) -> int:
+        """
+        Render `rows` into `stream`, writing `chunk_size` lines per `write` call.
+
+        `Returns`:
+        - The number of lines written, header included.
+        """
+        count :int = 0
+        lines = self.rows( rows )
+        while True:
+            chunk = list( islice( lines, chunk_size ) )
+            if not chunk:
+                return count
+            stream.write( '\n'.join( chunk ) + '\n' )
+            count += len( chunk )
+
+    @staticmethod
+    def _cell(column:Column, text:str, width:int, style:Optional[Text]) -> str:
+        measured = Width.measure( text )
+        if measured > width:
+            text     = Width.truncate( text, width )
+            measured = Width.measure( text )
+        pad = width - measured
+        if style is not None:
+            text = style( text )
+        if pad <= 0:
+            return text
+        if column.align == 'right':
+            return ' ' * pad + text
+        if column.align == 'center':
+            left = pad // 2 + ( pad & width & 1 )
+            return ' ' * left + text + ' ' * ( pad - left )
+        return text + ' ' * pad
@@ -0,0 +1,152 @@
+import os
+import sys
+from typing import List, Mapping, Optional, TextIO, Tuple
+
+
+# xterm 256-color cube levels and the 16 standard colors, as rendered by xterm.
+_CUBE_LEVELS:Tuple[int,...] = (0, 95, 135, 175, 215, 255)
+_BASIC:Tuple[Tuple[int,int,int],...] = (
+    (  0,   0,   0), (205,   0,   0), (  0, 205,   0), (205, 205,   0),
+    (  0,   0, 238), (205,   0, 205), (  0, 205, 205), (229, 229, 229),
+    (127, 127, 127), (255,   0,   0), (  0, 255,   0), (255, 255,   0),
+    ( 92,  92, 255), (255,   0, 255), (  0, 255, 255), (255, 255, 255),
+)
+
+
+def _level_table(levels:Tuple[int,...]) -> List[int]:
+    # Index of the nearest level for every channel value, walking the sorted levels once.
+    table :List[int] = []
+    index :int       = 0
+    for value in range(256):
+        while index + 1 < len( levels ) and levels[index + 1] - value < value - levels[index]:
+            index += 1
+        table.append( index )
+    return table
+
+
+# Per-channel lookup tables, so mapping a color only costs a few indexing operations. They are built in plain
+# Python on purpose: building them takes well under a millisecond, and so does mapping the whole `Colors`
+# palette through them, while importing NumPy would add about 100 ms to every start-up. `Heatmap`, which needs
+# NumPy anyway, indexes the same tables with arrays to map whole images at once.
+_CUBE_INDEX :List[int] = _level_table( _CUBE_LEVELS )
+_GREY_LEVELS:Tuple[int,...] = tuple( 8 + 10 * step for step in range(24) )
+_GREY_INDEX :List[int] = _level_table( _GREY_LEVELS )
+
+
+def _distance(a:Tuple[int,int,int], b:Tuple[int,int,int]) -> int:
+    return (a[0]-b[0])**2 + (a[1]-b[1])**2 + (a[2]-b[2])**2
+
+
+class Terminal:
+    """
+    Color capability of the output terminal, shared by `Colored`, `Text` and `Alias`.
+
+    `Modes`:
+    - `TRUECOLOR`   : 24-bit colors (`ANSI.FOREGROUND`/`ANSI.BACKGROUND`).
+    - `COLOR256`    : xterm 256-color palette.
+    - `COLOR16`     : the 16 standard `ANSI` colors.
+    - `NONE`        : plain output. `Text`, `Alias` and `Utility.date` return the bare text without any formatting.
+
+    The mode is detected from the environment at import time: `NO_COLOR` or a non-tty `stdout` select `NONE`
+    unless `FORCE_COLOR` is set. Call `set_mode` to override it; objects created earlier pick up the new mode
+    on their next render.
+
+    In 256 and 16-color modes, colors are mapped to the nearest palette entry through per-channel lookup tables
+    built at import, without NumPy, so each mapping is O(1) and the package does not depend on NumPy.
+
+    `Example`:
+    ```
+        Terminal.set_mode(Terminal.COLOR256)
+        Terminal.set_mode()                     # detect again from the environment
+    ```
+    """
+
+    TRUECOLOR   :str = 'truecolor'
+    COLOR256    :str = '256'
+    COLOR16     :str = '16'
+    NONE        :str = 'none'
+    MODES       :Tuple[str,...] = (TRUECOLOR, COLOR256, COLOR16, NONE)
+
+    mode        :str  = TRUECOLOR
+    plain       :bool = False
+    generation  :int  = 0
+
+    @staticmethod
+    def detect(environ:Optional[Mapping[str,str]]=None, stream:Optional[TextIO]=None) -> str:
+        """
+        Detect the color capability from `NO_COLOR`, `FORCE_COLOR`, `COLORTERM`, `TERM` and whether `stream` is a terminal.
+
+        `Parameters`:
+        - `environ`: `Optional` mapping to inspect instead of `os.environ`.
+        - `stream` : `Optional` output stream to inspect instead of `sys.stdout`.
+
+        `Returns`:
+        - One of `Terminal.MODES`. Terminals that do not advertise themselves keep the 24-bit default.
+        """
+        environ     = os.environ if environ is None else environ
+        term  :str  = environ.get('TERM', '').lower()
+        colorterm   = environ.get('COLORTERM', '').lower()
+        stream      = sys.stdout if stream is None else stream
+
+        if environ.get('NO_COLOR'):
+            return Terminal.NONE
+        if not environ.get('FORCE_COLOR'):
+            isatty = getattr( stream, 'isatty', None )
+            if term == 'dumb' or isatty is None or not isatty():
+                return Terminal.NONE
+        if colorterm in ('truecolor', '24bit') or term.endswith('-direct') or 'WT_SESSION' in environ:
+            return Terminal.TRUECOLOR
+        if '256color' in term:
+            return Terminal.COLOR256
+        if term:
+            return Terminal.COLOR16
+        return Terminal.TRUECOLOR
+
+    @staticmethod
+    def set_mode(mode:Optional[str]=None) -> None:
+        """
+        Set the active color mode, or detect it again from the environment when `mode` is `None`.
+        """
+        if mode is None:
+            mode = Terminal.detect()
+        if mode not in Terminal.MODES:
+            raise ValueError(f'Terminal does not support {mode!r} mode, expected one of {Terminal.MODES}')
+        Terminal.mode   = mode
+        Terminal.plain  = mode == Terminal.NONE
+        Terminal.generation += 1
+
+    @staticmethod
+    def to_256(rgb:Tuple[int,int,int]) -> int:
+        """
+        Return the xterm 256-color index closest to an RGB triple.
+        """
+        r, g, b = rgb
+        cube    = ( _CUBE_LEVELS[_CUBE_INDEX[r]], _CUBE_LEVELS[_CUBE_INDEX[g]], _CUBE_LEVELS[_CUBE_INDEX[b]] )
+        step    = _GREY_INDEX[ (r + g + b) // 3 ]
+        grey    = ( _GREY_LEVELS[step], ) * 3
+        if _distance( rgb, grey ) < _distance( rgb, cube ):
+            return 232 + step
+        return 16 + 36 * _CUBE_INDEX[r] + 6 * _CUBE_INDEX[g] + _CUBE_INDEX[b]
+
+    @staticmethod
+    def from_256(index:int) -> Tuple[int,int,int]:
+        """
+        Return the RGB triple xterm renders for a 256-color index, the inverse of `to_256`.
+        """
+        if index < 16:
+            return _BASIC[index]
+        if index >= 232:
+            return ( _GREY_LEVELS[index - 232], ) * 3
+        index -= 16
+        return ( _CUBE_LEVELS[index // 36], _CUBE_LEVELS[index // 6 % 6], _CUBE_LEVELS[index % 6] )
+
+    @staticmethod
+    def to_16(rgb:Tuple[int,int,int]) -> int:
+        """
+        Return the index (0-15) of the standard `ANSI` color closest to an RGB triple.
+        """
+        return min( range(16), key=lambda index: _distance( rgb, _BASIC[index] ) )
+
+
+Terminal.mode  = Terminal.detect()
+Terminal.plain = Terminal.mode == Terminal.NONE
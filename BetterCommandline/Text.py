@@ -1,7 +1,9 @@
 
-from typing import Any, Optional, Tuple, Union
+from typing import Any, Iterable, Iterator, Optional, TextIO, Tuple, Union
 
-from .Colors import ANSI, Colored, Colors
+from .Colors import ANSI, Buffer, Colored, Colors, _encoded, _into
+from .Style import Style
+from .Terminal import Terminal
 
 
 class Text:
@@ -9,8 +11,9 @@ class Text:
     Class representing styled text with customizable foreground color and style.
 
     `Parameters`:
-    - `foreground`: `Foreground` color of the text, specified as either an RGB `tuple` or a `hexadecimal` color code.
-    - `style`: `Optional` text style for the text, e.g., bold, italics.
+    - `foreground`: `Foreground` color of the text, specified as either an RGB `tuple` or a `hexadecimal` color code,
+                    or a complete `Style`.
+    - `style`: `Optional` text style for the text, e.g., bold, italics, as an `ANSI` code or a `Style`.
 
     `Example`:
     ```
@@ -19,29 +22,123 @@ class Text:
     ```
 
     `Methods`:
-    - `__call__`: Format and return the styled text by concatenating multiple parts with an optional separator.
+    - `__call__`    : Format and return the styled text by concatenating multiple parts with an optional separator.
+    - `render_many` : Lazily style every item of an iterable.
+    - `write_many`  : Style every item of an iterable and write it to a file object in large chunks.
+    - `encode`      : Like `__call__`, but return `bytes`.
+    - `render_into` : Write the styled form of `str` or bytes-like data straight into a `bytearray` or `memoryview`.
 
     `Attributes`:
-    - `foreground`: The formatted `ANSI` escape code for the foreground color.
+    - `color`: The foreground color as given.
+    - `foreground`: The formatted `ANSI` escape code for the foreground color in the active `Terminal` mode.
     - `style`: The formatted `ANSI` escape code for the text style.
+    - `codes`: The resolved `(foreground, background, style)` escape codes; `prefix` combines them.
+    - `prefix`, `suffix`: The cached escape codes written before and after the text.
+    - `prefix_bytes`, `suffix_bytes`: The same escape codes, encoded once as `bytes`.
+
+    Assigning `color`, `foreground` or `style` recomputes the cached escape codes.
     """
 
-    def __init__(self, foreground:Union[Tuple[int],str], style:Optional[str]=None) -> None:
+    __slots__ = ('_color', '_style', '_foreground', '_codes', '_prefix', '_suffix', '_prefix_bytes', '_suffix_bytes', '_generation')
+
+    def __init__(self, foreground:Union[Tuple[int],str,Style], style:Union[str,Style,None]=None) -> None:
         """
         Initialize a `Text` instance with the provided foreground color and style.
 
         If the provided foreground is not an ANSI escape code, it uses the `Colored` class to generate one.
 
         `Parameters`:
-        - `foreground`: `Foreground` color of the text, specified as either an RGB `tuple` or a `hexadecimal` color code.
-        - `style`: `Optional` text style for the text, e.g., bold, italics.
+        - `foreground`: `Foreground` color of the text, specified as either an RGB `tuple` or a `hexadecimal` color code,
+                        or a complete `Style`.
+        - `style`: `Optional` text style for the text, e.g., bold, italics, as an `ANSI` code or a `Style`.
+        """
+
+        self._color     :Union[Tuple[int],str,Style] = foreground
+        self._style     :Union[str,Style] = style if not style==None else ''
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Resolve the escape codes for the active `Terminal` mode. Called automatically when the mode changes.
         """
+        foreground = self._color
+        style      = self._style.code if isinstance( self._style, Style ) else self._style
+        background = ''
+        if isinstance( foreground, Style ):
+            prefix     = ANSI.combine( foreground.code, style )
+            background = Colored.Background( foreground.background ) if foreground.background is not None else ''
+            style      = ANSI.combine( Style( attributes=foreground.attributes ).code, style )
+            foreground = Colored.Foreground( foreground.foreground ) if foreground.foreground is not None else ''
+        else:
+            if not isinstance( foreground, str ) or not foreground.startswith('\033'):
+                foreground:str = Colored.Foreground( foreground )
+            prefix = ANSI.combine( foreground, style )
+
+        self._foreground :str = foreground
+        self._codes      :Tuple[str,str,str] = ( foreground, background, style )
+        self._prefix     :str = prefix
+        self._suffix     :str = ANSI.RESET
+        self._prefix_bytes :bytes = _encoded( self._prefix )
+        self._suffix_bytes :bytes = _encoded( self._suffix )
+        self._generation :int = Terminal.generation
+
+    @property
+    def color(self) -> Union[Tuple[int],str,Style]:
+        return self._color
+
+    @color.setter
+    def color(self, color:Union[Tuple[int],str,Style]) -> None:
+        self._color = color
+        self.refresh()
+
+    @property
+    def style(self) -> Union[str,Style]:
+        return self._style
+
+    @style.setter
+    def style(self, style:Union[str,Style,None]) -> None:
+        self._style = style if not style==None else ''
+        self.refresh()
 
-        if not isinstance( foreground, str ) or not foreground.startswith('\033'):
-            foreground:str = Colored.Foreground( foreground )
+    @property
+    def foreground(self) -> str:
+        if self._generation != Terminal.generation:
+            self.refresh()
+        return self._foreground
 
-        self.foreground :str = foreground
-        self.style      :str = style if not style==None else ''
+    @foreground.setter
+    def foreground(self, foreground:Union[Tuple[int],str]) -> None:
+        self.color = foreground
+
+    @property
+    def codes(self) -> Tuple[str,str,str]:
+        if self._generation != Terminal.generation:
+            self.refresh()
+        return self._codes
+
+    @property
+    def prefix(self) -> str:
+        if self._generation != Terminal.generation:
+            self.refresh()
+        return self._prefix
+
+    @property
+    def suffix(self) -> str:
+        if self._generation != Terminal.generation:
+            self.refresh()
+        return self._suffix
+
+    @property
+    def prefix_bytes(self) -> bytes:
+        if self._generation != Terminal.generation:
+            self.refresh()
+        return self._prefix_bytes
+
+    @property
+    def suffix_bytes(self) -> bytes:
+        if self._generation != Terminal.generation:
+            self.refresh()
+        return self._suffix_bytes
     
     def __call__(self, *parts: str, sep=' ') -> str:
         """
@@ -54,4 +151,106 @@ class Text:
         `Returns`:
         - The formatted styled text.
         """
-        return f'{self.foreground}{self.style}{sep.join( parts )}{ANSI.RESET}'
+        if Terminal.plain:
+            return sep.join( parts )
+        if self._generation != Terminal.generation:
+            self.refresh()
+        return f'{self._prefix}{sep.join( parts )}{self._suffix}'
+
+    def render_many(self, items:Iterable[str]) -> Iterator[str]:
+        """
+        Lazily style every item of `items`, reusing the precomputed prefix and suffix.
+
+        `Parameters`:
+        - `items`: Iterable of strings, e.g. the lines of a file.
+
+        `Returns`:
+        - A generator yielding the styled form of each item.
+        """
+        if Terminal.plain:
+            return iter( items )
+        if self._generation != Terminal.generation:
+            self.refresh()
+        prefix, suffix = self._prefix, self._suffix
+        return ( prefix + item + suffix for item in items )
+
+    def write_many(self, items:Iterable[str], stream:TextIO, end:str='\n', chunk_size:int=1024) -> int:
+        """
+        Style every item of `items` and write it to `stream`, batching `chunk_size` items per `write` call.
+
+        `Parameters`:
+        - `items`       : Iterable of strings, e.g. the lines of a file.
+        - `stream`      : Writable text file object.
+        - `end`         : String appended after every styled item. Defaults to a newline.
+        - `chunk_size`  : Number of items rendered into one `write` call.
+
+        `Returns`:
+        - The number of items written.
+        """
+        if Terminal.plain:
+            prefix, joiner, suffix = '', end, ''
+        else:
+            if self._generation != Terminal.generation:
+                self.refresh()
+            prefix, joiner, suffix = self._prefix, self._suffix + end + self._prefix, self._suffix
+        write  = stream.write
+        chunk  :list = []
+        count  :int  = 0
+        for item in items:
+            chunk.append( item )
+            if len( chunk ) >= chunk_size:
+                write( prefix + joiner.join( chunk ) + suffix + end )
+                count += len( chunk )
+                chunk.clear()
+        if chunk:
+            write( prefix + joiner.join( chunk ) + suffix + end )
+            count += len( chunk )
+        return count
+
+    def encode(self, *parts:str, sep:str=' ', encoding:str='utf-8') -> bytes:
+        """
+        Format the styled text like `__call__` and return it encoded with `encoding`.
+        """
+        text = sep.join( parts ).encode( encoding )
+        if Terminal.plain:
+            return text
+        if self._generation != Terminal.generation:
+            self.refresh()
+        return self._prefix_bytes + text + self._suffix_bytes
+
+    def render_into(self, target:Buffer, data:Union[str, bytes, bytearray, memoryview], offset:Optional[int]=None,
+                    encoding:str='utf-8') -> int:
+        """
+        Write the styled form of `data` into a caller-supplied buffer, without building an intermediate `str`.
+
+        `Parameters`:
+        - `target`  : A `bytearray`, or a writable `memoryview` when `offset` is given.
+        - `data`    : Text to style. `str` is encoded with `encoding`; bytes-like data is copied as is.
+        - `offset`  : `Optional` position to write at. When omitted, the output is appended to the `bytearray`.
+        - `encoding`: Encoding used for `str` data.
+
+        `Returns`:
+        - The position right after the written bytes, i.e. the next `offset`.
+
+        `Example`:
+        ```
+            label   = Text( Colors.CADETBLUE1 )
+            payload = bytearray()
+            for host in hosts:
+                label.render_into( payload, host.name )
+                payload += b'\n'
+            sock.sendall( payload )
+        ```
+        """
+        if isinstance( data, str ):
+            data = data.encode( encoding )
+        if Terminal.plain:
+            return _into( target, offset, data )
+        if self._generation != Terminal.generation:
+            self.refresh()
+        if offset is None and isinstance( target, bytearray ):
+            target += self._prefix_bytes
+            target += data
+            target += self._suffix_bytes
+            return len( target )
+        return _into( target, offset, self._prefix_bytes, data, self._suffix_bytes )
@@ -0,0 +1,175 @@
+import os
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, Union
+
+from .Alias import Alias
+from .ColorSpace import ColorSpace
+from .Colors import _normalize
+from .Style import Style
+from .Text import Text
+
+
+RGB   = Tuple[int,int,int]
+Color = Union[RGB, str]
+
+
+@lru_cache(maxsize=32)
+def _generate(accents:Tuple[Tuple[str, RGB],...], background:RGB, minimum:float) -> Tuple[Dict[str, Tuple[RGB, RGB]], Dict[str, RGB]]:
+    colors  = [ rgb for _, rgb in accents ]
+    labels  = ColorSpace.readable( colors, minimum=minimum )
+    texts   = ColorSpace.readable( background, colors, minimum=minimum )
+    return ( { name: ( label, rgb ) for ( name, rgb ), label in zip( accents, labels ) },
+             { name: text for ( name, _ ), text in zip( accents, texts ) } )
+
+
+class Theme:
+    """
+    Readable color pairs generated from a few accent colors, for `Alias` banners and `Text`.
+
+    For every accent the theme holds a banner pair (the accent as background, with a foreground tinted from it
+    and lightened or darkened until it reaches the `minimum` WCAG contrast) and a text color (the accent moved in
+    OKLCH lightness until it is readable on the theme `background`). Each kind is computed for all accents in one
+    vectorized `ColorSpace.readable` call, and `generate` remembers recent results.
+
+    A theme is plain data: `to_dict`/`from_dict` and `save`/`load` round-trip it through JSON, and `cached` only
+    builds it when the saved file is missing or was made from other inputs, so start-up just reads a few colors.
+
+    `Parameters`:
+    - `banners`     : Mapping of names to `(foreground, background)` RGB pairs.
+    - `texts`       : Mapping of names to RGB text colors.
+    - `background`  : RGB background the text colors are meant for.
+    - `minimum`     : Contrast ratio the colors were generated for.
+
+    `Example`:
+    ```
+        theme = Theme.cached( "~/.cache/myapp/theme.json", { "INFO": Colors.SEAGREEN3, "ERROR": Colors.FIREBRICK3 } )
+        print( theme.alias( "ERROR", banner_width=10, style=ANSI.BOLD ).Banner, theme.text( "ERROR" )("disk full") )
+    ```
+    """
+
+    VERSION:int = 1
+
+    def __init__(self, banners:Mapping[str, Tuple[Color, Color]], texts:Mapping[str, Color], background:Color='#1e1e1e',
+                 minimum:float=4.5) -> None:
+        self.banners    :Dict[str, Tuple[RGB, RGB]] = { name: ( _rgb( fg ), _rgb( bg ) ) for name, ( fg, bg ) in banners.items() }
+        self.texts      :Dict[str, RGB] = { name: _rgb( color ) for name, color in texts.items() }
+        self.background :RGB = _rgb( background )
+        self.minimum    :float = minimum
+
+    @staticmethod
+    def generate(accents:Mapping[str, Color], background:Color='#1e1e1e', minimum:float=4.5) -> 'Theme':
+        """
+        Build a theme from named accent colors.
+
+        `Parameters`:
+        - `accents`     : Mapping of names (e.g. log levels) to RGB `tuple`s or `hexadecimal` color codes.
+        - `background`  : Terminal background the text colors must be readable on.
+        - `minimum`     : Minimum WCAG contrast ratio of every pair.
+        """
+        if not accents:
+            raise ValueError('Theme needs at least one accent color')
+        banners, texts = _generate( tuple( ( name, _rgb( color ) ) for name, color in accents.items() ), _rgb( background ), minimum )
+        return Theme( banners, texts, background, minimum )
+
+    @staticmethod
+    def cached(path:str, accents:Mapping[str, Color], background:Color='#1e1e1e', minimum:float=4.5) -> 'Theme':
+        """
+        Load the theme saved at `path`, or generate it and save it there when the file is missing, unreadable or
+        was generated from other accents, background or contrast.
+        """
+        import json
+        path = os.path.expanduser( path )
+        wanted = { 'accents': { name: list( _rgb( color ) ) for name, color in accents.items() },
+                   'background': list( _rgb( background ) ), 'minimum': minimum }
+        try:
+            with open( path, encoding='utf-8' ) as file:
+                data = json.load( file )
+            if data.get('version') == Theme.VERSION and all( data.get( key ) == value for key, value in wanted.items() ):
+                return Theme.from_dict( data )
+        except ( OSError, ValueError, KeyError, TypeError ):
+            pass
+        theme = Theme.generate( accents, background, minimum )
+        try:
+            directory = os.path.dirname( path )
+            if directory:
+                os.makedirs( directory, exist_ok=True )
+            theme.save( path, accents=wanted['accents'] )
+        except OSError:
+            pass  # A cache that cannot be written is generated again next time.
+        return theme
+
+    def alias(self, name:str, text:Optional[str]=None, **options:Any) -> Alias:
+        """
+        Return an `Alias` with the banner pair of `name`; `options` are passed on, e.g. `banner_width` or `style`.
+        """
+        foreground, background = self._banner( name )
+        return Alias( name if text is None else text, foreground, background, **options )
+
+    def text(self, name:str, style:Union[str, Style, None]=None) -> Text:
+        """
+        Return a `Text` in the text color of `name`.
+        """
+        try:
+            return Text( self.texts[name], style )
+        except KeyError:
+            raise KeyError(f'Theme has no color named {name!r}') from None
+
+    def __contains__(self, name:object) -> bool:
+        return name in self.banners
+
+    def __iter__(self) -> Iterator[str]:
+        return iter( self.banners )
+
+    def __len__(self) -> int:
+        return len( self.banners )
+
+    def __repr__(self) -> str:
+        return f'Theme({", ".join( self.banners )}, background={self.background}, minimum={self.minimum})'
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the theme as JSON-compatible data.
+        """
+        return { 'version'   : self.VERSION,
+                 'background': list( self.background ),
+                 'minimum'   : self.minimum,
+                 'banners'   : { name: [ list( fg ), list( bg ) ] for name, ( fg, bg ) in self.banners.items() },
+                 'texts'     : { name: list( color ) for name, color in self.texts.items() } }
+
+    @staticmethod
+    def from_dict(data:Mapping[str, Any]) -> 'Theme':
+        """
+        Rebuild a theme from `to_dict` data. No color is converted.
+        """
+        if data.get('version') != Theme.VERSION:
+            raise ValueError(f'Theme data has version {data.get("version")!r}, expected {Theme.VERSION}')
+        return Theme( { name: ( tuple( fg ), tuple( bg ) ) for name, ( fg, bg ) in data['banners'].items() },
+                      { name: tuple( color ) for name, color in data['texts'].items() },
+                      tuple( data['background'] ), data['minimum'] )
+
+    def save(self, path:str, **extra:Any) -> None:
+        """
+        Write the theme to `path` as JSON. `extra` entries are stored alongside it.
+        """
+        import json
+        with open( os.path.expanduser( path ), 'w', encoding='utf-8' ) as file:
+            json.dump( { **self.to_dict(), **extra }, file, indent=2 )
+
+    @staticmethod
+    def load(path:str) -> 'Theme':
+        """
+        Read a theme written by `save`.
+        """
+        import json
+        with open( os.path.expanduser( path ), encoding='utf-8' ) as file:
+            return Theme.from_dict( json.load( file ) )
+
+    def _banner(self, name:str) -> Tuple[RGB, RGB]:
+        try:
+            return self.banners[name]
+        except KeyError:
+            raise KeyError(f'Theme has no color named {name!r}') from None
+
+
+def _rgb(color:Color) -> RGB:
+    return tuple( int( channel ) for channel in _normalize( color if isinstance( color, str ) else tuple( color ), 'Theme' ) )
@@ -1,10 +1,99 @@
 from .Text import Text
+from .Terminal import Terminal
 
-from typing import Tuple
+import time
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 from datetime import datetime
 
+
+@lru_cache(maxsize=64)
+def _text(color:Union[Tuple[int],str]) -> Text:
+    return Text( foreground=color )
+
+
 class Utility:
 
     def date( date:datetime, color:Tuple[int] ) ->str:
-        return Text( foreground=color )( str(date) )
-    
\ No newline at end of file
+        if Terminal.plain:
+            return str(date)
+        return _text( color )( str(date) )
+
+
+class Timestamp:
+    """
+    Reusable colored timestamp renderer.
+
+    The formatted, colored part of the timestamp is cached for the current second, so rendering another timestamp
+    within the same second only formats the sub-second digits.
+
+    `Parameters`:
+    - `color`       : Color of the timestamp, specified as either an RGB `tuple` or a `hexadecimal` color code.
+    - `fmt`         : `strftime` format for the whole-second part.
+    - `precision`   : Number of sub-second digits (0-6) appended after a `'.'`. `0` omits the fraction.
+    - `utc`         : Render epoch timestamps in UTC instead of local time.
+
+    `Example`:
+    ```
+        stamp = Timestamp( Colors.GRAY60, precision=3 )
+        print( stamp( time.time() ), "request done" )
+        print( stamp( datetime.now() ) )
+    ```
+    """
+
+    __slots__ = ('fmt', 'precision', 'utc', '_text', '_divisor', '_high', '_low', '_cache')
+
+    def __init__(self, color:Union[Tuple[int],str], fmt:str='%Y-%m-%d %H:%M:%S', precision:int=6, utc:bool=False) -> None:
+        if not 0 <= precision <= 6:
+            raise ValueError(f'Timestamp precision must be between 0 and 6, got {precision}')
+
+        self.fmt        :str  = fmt
+        self.precision  :int  = precision
+        self.utc        :bool = utc
+        self._text      :Text = Text( color )
+        self._divisor   :int  = 10 ** ( 6 - precision )
+        # Zero-padded digit strings, so the fraction is built from at most two list lookups.
+        self._low       :List[str] = [ str(value).zfill( min( precision, 3 ) ) for value in range( 10 ** min( precision, 3 ) ) ] if precision else []
+        self._high      :List[str] = [ str(value).zfill( precision - 3 ) for value in range( 10 ** ( precision - 3 ) ) ] if precision > 3 else []
+        self._cache     :Tuple[object, int, str, str] = ( None, -1, '', '' )
+
+    def __call__(self, when:Union[datetime, float, None]=None) -> str:
+        """
+        Render `when` (a `datetime`, an epoch `float`, or `None` for now) as a colored timestamp.
+        """
+        if when is None:
+            when = time.time()
+        if isinstance( when, datetime ):
+            key   = ( when.year, when.month, when.day, when.hour, when.minute, when.second, when.tzinfo )
+            micro = when.microsecond
+        else:
+            key = int( when )
+            if when < key:
+                key -= 1
+            # Rounded, not truncated: `.998` is stored as `.99799990...`.
+            micro = round( ( when - key ) * 1e6 )
+            if micro == 1_000_000:
+                key, micro = key + 1, 0
+
+        cached_key, generation, head, suffix = self._cache
+        if cached_key != key or generation != Terminal.generation:
+            head, suffix = self._head( when, key )
+            self._cache = ( key, Terminal.generation, head, suffix )
+
+        if self._high:
+            digits = micro // self._divisor
+            return head + self._high[digits // 1000] + self._low[digits % 1000] + suffix
+        if self._low:
+            return head + self._low[micro // self._divisor] + suffix
+        return head + suffix
+
+    def _head(self, when:Union[datetime, float], key:Union[tuple, int]) -> Tuple[str, str]:
+        if isinstance( when, datetime ):
+            formatted = when.strftime( self.fmt )
+        else:
+            formatted = time.strftime( self.fmt, time.gmtime( key ) if self.utc else time.localtime( key ) )
+        if self.precision:
+            formatted += '.'
+        if Terminal.plain:
+            return formatted, ''
+        return self._text.prefix + formatted, self._text.suffix
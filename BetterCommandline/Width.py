@@ -0,0 +1,113 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+
+class _CharWidths(dict):
+    # Per-character width table: ASCII is seeded up front (controls and DEL as zero), everything else is resolved
+    # once from `unicodedata`.
+
+    def __missing__(self, char:str) -> int:
+        category = unicodedata.category( char )
+        if category in ('Mn', 'Me', 'Cc') or ( category == 'Cf' and char != '\u00ad' ) or '\u1160' <= char <= '\u11ff':
+            width = 0
+        elif unicodedata.east_asian_width( char ) in ('W', 'F'):
+            width = 2
+        else:
+            width = 1
+        self[char] = width
+        return width
+
+_WIDTHS:_CharWidths = _CharWidths( ( chr( code ), 1 if 32 <= code < 127 else 0 ) for code in range( 128 ) )
+_ESCAPES = re.compile(r'\033(?:\[[0-?]*[ -/]*[@-~]|\][^\007\033]*(?:\007|\033\\)|[@-Z\\-_])')
+
+@lru_cache(maxsize=4096)
+def _measure(text:str) -> int:
+    text = Width.strip( text )
+    if text.isascii() and text.isprintable():
+        return len( text )
+    return sum( map( _WIDTHS.__getitem__, text ) )
+
+class Width:
+    """
+    Display-width measurement for styled and wide-character text.
+
+    Widths skip `ANSI` escape sequences, count East Asian wide and fullwidth characters as two columns and
+    combining marks, format characters and controls as zero. Plain ASCII text takes a `len` fast path; other
+    strings are measured through a per-character table, and the result is cached per string.
+
+    `Example`:
+    ```
+        Width.measure( Text( Colors.RED1 )( "日本語" ) )   # 6
+        Width.center( "日本", 8 )                         # '  日本  '
+    ```
+    """
+
+    @staticmethod
+    def strip(text:str) -> str:
+        """
+        Remove `ANSI` escape sequences (CSI, OSC and two-character escapes) from `text`.
+        """
+        if '\033' not in text:
+            return text
+        return _ESCAPES.sub( '', text )
+
+    @staticmethod
+    def measure(text:str) -> int:
+        """
+        Return the number of terminal columns `text` occupies.
+        """
+        # Printable ASCII excludes escapes and controls, so its width is its length.
+        if text.isascii() and text.isprintable():
+            return len( text )
+        return _measure( text )
+
+    @staticmethod
+    def center(text:str, width:int, fillchar:str=' ') -> str:
+        """
+        Center `text` in `width` columns, like `str.center` but by display width.
+        """
+        pad = width - Width.measure( text )
+        if pad <= 0:
+            return text
+        # Same split as `str.center`, so ASCII text pads identically.
+        left = pad // 2 + ( pad & width & 1 )
+        return fillchar * left + text + fillchar * ( pad - left )
+
+    @staticmethod
+    def ljust(text:str, width:int, fillchar:str=' ') -> str:
+        """
+        Left-justify `text` in `width` columns, like `str.ljust` but by display width.
+        """
+        pad = width - Width.measure( text )
+        return text + fillchar * pad if pad > 0 else text
+
+    @staticmethod
+    def rjust(text:str, width:int, fillchar:str=' ') -> str:
+        """
+        Right-justify `text` in `width` columns, like `str.rjust` but by display width.
+        """
+        pad = width - Width.measure( text )
+        return fillchar * pad + text if pad > 0 else text
+
+    @staticmethod
+    def truncate(text:str, width:int, ellipsis:str='…') -> str:
+        """
+        Shorten plain `text` to at most `width` columns, ending it with `ellipsis` when anything was cut.
+        """
+        if Width.measure( text ) <= width:
+            return text
+        if width <= 0:
+            return ''
+        budget = width - Width.measure( ellipsis )
+        if budget < 0:
+            return ellipsis[:width]
+        if text.isascii() and text.isprintable():
+            return text[:budget] + ellipsis
+        used, end = 0, 0
+        for char in text:
+            used += _WIDTHS[char]
+            if used > budget:
+                break
+            end += 1
+        return text[:end] + ellipsis
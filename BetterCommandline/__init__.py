@@ -1,5 +1,65 @@
-
-from .Colors import ANSI, Colors, Colored
+from .Colors import ANSI, Colors, Colored, ColorCache
+from .Terminal import Terminal
 from .Alias import Alias
 from .Text import Text
-from .Utilities import Utility
\ No newline at end of file
+from .Utilities import Utility, Timestamp
+from .Palette import Palette
+from .Width import Width
+from .Style import Style
+
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Dict, List
+
+
+# Feature modules are imported on first access, so `import BetterCommandline` only loads the core above.
+_LAZY:Dict[str, str] = {
+    'StyledStream'      : 'Stream',
+    'AliasFormatter'    : 'Logger',
+    'BackgroundHandler' : 'Logger',
+    'Markup'            : 'Markup',
+    'Column'            : 'Table',
+    'Table'             : 'Table',
+    'Live'              : 'Live',
+    'ProgressBar'       : 'Live',
+    'Gradient'          : 'Gradient',
+    'Highlighter'       : 'Highlighter',
+    'Console'           : 'Console',
+    'AnsiParser'        : 'Parser',
+    'Span'              : 'Parser',
+    'HtmlExporter'      : 'Export',
+    'SvgExporter'       : 'Export',
+    'Heatmap'           : 'Heatmap',
+    'ColorSpace'        : 'ColorSpace',
+    'Theme'             : 'Theme',
+}
+
+__all__:List[str] = [ 'ANSI', 'Colors', 'Colored', 'ColorCache', 'Terminal', 'Alias', 'Text', 'Utility', 'Timestamp',
+                      'Palette', 'Width', 'Style', *_LAZY ]
+
+
+def __getattr__(name:str) -> Any:
+    module = _LAZY.get( name )
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr( import_module( f'.{module}', __name__ ), name )
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted( set( globals() ) | set( _LAZY ) )
+
+
+class _Package(ModuleType):
+    # Importing a submodule binds it on the package under its own name, e.g. `BetterCommandline.Theme`, which
+    # would hide the class of the same name. Keep the class instead.
+
+    def __setattr__(self, name:str, value:Any) -> None:
+        if isinstance( value, ModuleType ) and value.__name__ == f'{__name__}.{name}' and hasattr( value, name ):
+            value = getattr( value, name )
+        super().__setattr__( name, value )
+
+
+sys.modules[__name__].__class__ = _Package
\ No newline at end of file
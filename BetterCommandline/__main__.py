@@ -0,0 +1,167 @@
+"""
+Colorize a log stream from stdin to stdout.
+
+Usage:
+    tail -f server.log | python -m BetterCommandline [--config rules.json] [--color auto]
+
+Level names become `Alias` banners (or badges) and rule matches are styled with `Text`. Input is processed as raw
+bytes: blocks are read with `readinto`, only complete lines are highlighted, one `re.sub` runs over each block and
+the result is written with one `write` call, so lines without matches are never decoded or copied line by line.
+
+The config file is JSON:
+```
+    {
+        "form"  : "Banner",
+        "levels": { "ERROR": { "foreground": "white", "background": "firebrick3", "style": "bold" } },
+        "rules" : [ { "pattern": "\\b\\d{1,3}(?:\\.\\d{1,3}){3}\\b", "color": "cadet_blue_1" } ]
+    }
+```
+Colors are `#RRGGBB` codes, `[r, g, b]` lists or `Colors` names; styles are `Markup` style names separated by
+spaces. Rule patterns are matched against UTF-8 bytes with `re.MULTILINE`, so `^` and `$` anchor at line ends;
+they should not match across newlines. Levels are matched as whole words and take priority over rules.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from typing import Any, BinaryIO, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .Alias import Alias
+from .Colors import ANSI
+from .Highlighter import Highlighter
+from .Logger import default_aliases
+from .Markup import STYLES
+from .Palette import Palette
+from .Terminal import Terminal
+from .Text import Text
+
+
+DEFAULT_RULES:List[Dict[str, Any]] = [
+    { 'pattern': r'\b\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?\b', 'color': 'gray_50' },
+    { 'pattern': r'\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b', 'color': 'cadet_blue_1' },
+    { 'pattern': r'https?://[^\s"\'<>]+', 'color': 'steel_blue_1', 'style': 'underlined' },
+    { 'pattern': r'\b\d+(?:\.\d+)?\b', 'color': 'gold_1' },
+]
+
+BUFFER_SIZE:int = 1 << 20
+
+
+def _color(value:Union[str, Sequence[int]]) -> Union[Tuple[int,int,int], str]:
+    if not isinstance( value, str ):
+        return tuple( value )
+    if value.startswith('#'):
+        return value
+    rgb = Palette.default().get( value )
+    if rgb is None:
+        raise ValueError(f'Unknown color {value!r} in colorizer config')
+    return rgb
+
+
+def _style(value:Optional[str]) -> Optional[str]:
+    if not value:
+        return None
+    try:
+        return ANSI.combine( *( STYLES[name.lower()] for name in value.split() ) )
+    except KeyError as error:
+        raise ValueError(f'Unknown style {error.args[0]!r} in colorizer config') from None
+
+
+def highlighter(config:Mapping[str, Any]) -> Highlighter:
+    """
+    Build the bytes `Highlighter` described by a config mapping (see the module documentation).
+    Levels default to the `AliasFormatter` aliases and rules to timestamps, IP addresses, URLs and numbers.
+    """
+    if 'levels' in config:
+        aliases = [ Alias( name, _color( level.get( 'foreground', 'white' ) ), _color( level.get( 'background', 'gray_30' ) ),
+                           banner_width=level.get( 'width', 10 ), style=_style( level.get('style') ), badge_sign=level.get( 'sign', ' ' ) )
+                    for name, level in config['levels'].items() ]
+    else:
+        aliases = list( default_aliases().values() )
+        aliases.append( Alias( 'WARN',  *aliases[2].colors, banner_width=10 ) )
+        aliases.append( Alias( 'FATAL', *aliases[4].colors, banner_width=10, style=ANSI.BOLD ) )
+
+    rules :List[Tuple[bytes, Union[Text, Alias]]] = [ ( rb'\b' + re.escape( alias.text.encode() ) + rb'\b', alias ) for alias in aliases ]
+    for rule in config.get( 'rules', DEFAULT_RULES ):
+        pattern = rule['pattern'].encode() if isinstance( rule['pattern'], str ) else rule['pattern']
+        rules.append( ( pattern, Text( _color( rule.get( 'color', 'white' ) ), _style( rule.get('style') ) ) ) )
+    return Highlighter( rules, flags=re.MULTILINE, form=config.get( 'form', 'Banner' ) )
+
+
+def colorize(source:BinaryIO, target:BinaryIO, highlight:Highlighter, buffer_size:int=BUFFER_SIZE) -> int:
+    """
+    Copy `source` to `target`, highlighting complete lines as soon as they arrive.
+
+    Every read returns whatever is available (up to `buffer_size` bytes), so `tail -f` output is colored without
+    waiting for a full buffer. A partial last line is held back until its newline arrives, unless it grows past
+    `buffer_size`.
+
+    `Returns`:
+    - The number of bytes read.
+    """
+    buffer  = bytearray( buffer_size )
+    view    = memoryview( buffer )
+    read    = getattr( source, 'readinto1', source.readinto )
+    write   = target.write
+    pending :bytes = b''
+    total   :int = 0
+    while True:
+        count = read( view )
+        if not count:
+            break
+        total += count
+        end = buffer.rfind( b'\n', 0, count ) + 1
+        if not end:
+            pending += view[:count]
+            if len( pending ) < buffer_size:
+                continue
+            block, pending = pending, b''
+        elif pending:
+            block, pending = pending + view[:end], bytes( view[end:count] )
+        else:
+            block, pending = view[:end], bytes( view[end:count] )
+        write( highlight( block ) )
+        target.flush()
+    if pending:
+        write( highlight( pending ) )
+        target.flush()
+    return total
+
+
+def main(argv:Optional[Sequence[str]]=None) -> int:
+    parser = argparse.ArgumentParser( prog='python -m BetterCommandline', description='Colorize a log stream from stdin to stdout.' )
+    parser.add_argument( '-c', '--config', help='JSON file with "levels", "rules" and "form" (see the module documentation)' )
+    parser.add_argument( '--color', default='auto', choices=( 'auto', 'always' ) + Terminal.MODES,
+                         help='"auto" follows the terminal and NO_COLOR/FORCE_COLOR, "always" colors even when piped' )
+    parser.add_argument( '--buffer-size', type=int, default=BUFFER_SIZE, help='maximum bytes read at once' )
+    arguments = parser.parse_args( argv )
+
+    if arguments.color == 'always':
+        environ = { key: value for key, value in os.environ.items() if key != 'NO_COLOR' }
+        Terminal.set_mode( Terminal.detect( { **environ, 'FORCE_COLOR': '1' } ) )
+    elif arguments.color != 'auto':
+        Terminal.set_mode( arguments.color )
+
+    try:
+        config = {}
+        if arguments.config:
+            with open( arguments.config, encoding='utf-8' ) as file:
+                config = json.load( file )
+        highlight = highlighter( config )
+    except ( OSError, ValueError ) as error:
+        parser.error( str( error ) )
+
+    try:
+        colorize( sys.stdin.buffer, sys.stdout.buffer, highlight, arguments.buffer_size )
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        # Downstream closed (e.g. `| head`); silence the error Python would print at exit.
+        os.dup2( os.open( os.devnull, os.O_WRONLY ), sys.stdout.fileno() )
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit( main() )
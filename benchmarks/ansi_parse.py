@@ -0,0 +1,77 @@
+"""
+Measure `AnsiParser` throughput on a large styled log.
+
+Usage:
+    python benchmarks/ansi_parse.py [megabytes]
+
+The log is produced the way captured output looks in practice: synthetic server lines highlighted with
+`Highlighter` (levels, timestamps, addresses, numbers) in 24-bit and in 16-color mode. Each run tokenizes the
+log in 64 KiB chunks, so sequences split across chunk boundaries are exercised, and is compared with a
+character-by-character state machine and with stripping escapes only (`Width.strip`).
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from BetterCommandline import AnsiParser, Highlighter, Terminal, Width
+from highlight_throughput import log_lines, rules
+
+
+CHUNK = 65536
+
+
+def chunks(text:str) -> list:
+    return [ text[index:index + CHUNK] for index in range( 0, len( text ), CHUNK ) ]
+
+
+def per_character(parts:list) -> list:
+    # Reference tokenizer: walks every character and collects SGR parameters by hand.
+    spans, state, text, escape = [], '', [], None
+    for part in parts:
+        for char in part:
+            if escape is not None:
+                escape.append( char )
+                if char.isalpha():
+                    if char == 'm':
+                        if text:
+                            spans.append( ( state, ''.join( text ) ) )
+                            text = []
+                        code  = ''.join( escape[1:-1] )
+                        state = '' if code in ( '', '0' ) else state + ';' + code
+                    escape = None
+            elif char == '\033':
+                escape = []
+            else:
+                text.append( char )
+    if text:
+        spans.append( ( state, ''.join( text ) ) )
+    return spans
+
+
+def throughput(function, parts:list, size:int) -> float:
+    start = time.perf_counter()
+    function( parts )
+    return size / ( time.perf_counter() - start ) / 1e6
+
+
+def main() -> None:
+    megabytes = float( sys.argv[1] ) if len( sys.argv ) > 1 else 4
+    lines     = log_lines( int( megabytes * 1e6 ) )
+    for mode in ( 'truecolor', '16' ):
+        Terminal.set_mode( mode )
+        styled = ''.join( Highlighter( rules( 0 ) ).lines( lines ) )
+        parts  = chunks( styled )
+        size   = len( styled.encode() )
+        parsed = list( AnsiParser.stream( parts ) )
+        assert ''.join( span.text for span in parsed ) == Width.strip( styled )
+        print(f'{mode:>9}: {size / 1e6:.1f} MB, {len( parsed )} spans')
+        print(f'    AnsiParser.stream   : {throughput( lambda parts: list( AnsiParser.stream( parts ) ), parts, size ):6.1f} MB/s')
+        print(f'    per-character       : {throughput( per_character, parts, size ):6.1f} MB/s')
+        print(f'    Width.strip only    : {throughput( lambda parts: [ Width.strip( part ) for part in parts ], parts, size ):6.1f} MB/s')
+
+
+if __name__ == '__main__':
+    main()
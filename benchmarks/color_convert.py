@@ -0,0 +1,57 @@
+"""
+Measure `ColorSpace` conversion and `Theme` generation over the full `Colors` palette.
+
+Usage:
+    python benchmarks/color_convert.py [repeat]
+
+Each operation is timed once as one vectorized call over the whole palette (with NumPy installed) and once
+color by color through the same formulas on plain floats, the path used without NumPy. Loading a saved theme
+is timed against generating it, which is what `Theme.cached` saves at start-up.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from BetterCommandline import ColorSpace, Theme
+from BetterCommandline.Palette import named_colors
+from BetterCommandline.Theme import _generate
+
+
+def milliseconds(function, repeat:int) -> float:
+    function()
+    start = time.perf_counter()
+    for _ in range( repeat ):
+        function()
+    return ( time.perf_counter() - start ) / repeat * 1e3
+
+
+def _uncached(accents:dict) -> tuple:
+    # `Theme.generate` memoizes recent inputs, so time the generation itself.
+    return _generate.__wrapped__( tuple( accents.items() ), ( 30, 30, 30 ), 4.5 )
+
+
+def main() -> None:
+    repeat  = int( sys.argv[1] ) if len( sys.argv ) > 1 else 10
+    palette = list( named_colors().values() )
+    accents = dict( list( named_colors().items() )[::40] )
+    print(f'{len( palette )} palette colors, {len( accents )} theme accents')
+    for name, function in ( ( 'rgb -> oklch', lambda colors: ColorSpace.convert( colors, target='oklch' ) ),
+                            ( 'rgb -> lab -> rgb', lambda colors: ColorSpace.convert( ColorSpace.convert( colors, target='lab' ), 'lab', 'rgb' ) ),
+                            ( 'lighten', lambda colors: ColorSpace.lighten( colors, 0.1 ) ),
+                            ( 'readable', lambda colors: ColorSpace.readable( colors ) ) ):
+        vectorized = milliseconds( lambda: function( palette ), repeat )
+        per_color  = milliseconds( lambda: [ function( color ) for color in palette ], max( 1, repeat // 10 ) )
+        print(f'    {name:<18}: vectorized {vectorized:8.2f} ms, per color {per_color:8.2f} ms')
+
+    path = os.path.join( tempfile.mkdtemp(), 'theme.json' )
+    Theme.generate( accents ).save( path )
+    print(f'    Theme generation  : {milliseconds( lambda: Theme( *_uncached( accents ) ), repeat ):8.2f} ms')
+    print(f'    Theme.load        : {milliseconds( lambda: Theme.load( path ), repeat ):8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
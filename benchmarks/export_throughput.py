@@ -0,0 +1,69 @@
+"""
+Measure `HtmlExporter` and `SvgExporter` throughput and memory on a large styled log.
+
+Usage:
+    python benchmarks/export_throughput.py [megabytes]
+
+The log is highlighted with `Highlighter` in 24-bit mode and converted in 64 KiB chunks into a null stream, so
+only conversion is timed. Peak memory (`tracemalloc`) is reported next to the log size: it stays at a few chunks
+however large the log is, since nothing but the class table and the current line is kept between chunks.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from BetterCommandline import Highlighter, HtmlExporter, SvgExporter, Terminal
+from highlight_throughput import log_lines, rules
+
+
+CHUNK = 65536
+
+
+class Null:
+    # Text sink that only counts what is written.
+
+    def __init__(self) -> None:
+        self.size = 0
+
+    def write(self, text:str) -> int:
+        self.size += len( text )
+        return len( text )
+
+    def flush(self) -> None:
+        pass
+
+    def seekable(self) -> bool:
+        return False
+
+
+def convert(exporter, styled:str) -> None:
+    for index in range( 0, len( styled ), CHUNK ):
+        exporter.write( styled[index:index + CHUNK] )
+    exporter.close()
+
+
+def main() -> None:
+    megabytes = float( sys.argv[1] ) if len( sys.argv ) > 1 else 4
+    Terminal.set_mode( 'truecolor' )
+    styled = ''.join( Highlighter( rules( 0 ) ).lines( log_lines( int( megabytes * 1e6 ) ) ) )
+    size   = len( styled.encode() )
+    print(f'log: {size / 1e6:.1f} MB')
+    for exporter in ( HtmlExporter, SvgExporter ):
+        sink  = Null()
+        start = time.perf_counter()
+        convert( exporter( sink ), styled )
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        convert( exporter( Null() ), styled )
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f'    {exporter.__name__:<13}: {size / elapsed / 1e6:6.1f} MB/s, {sink.size / 1e6:6.1f} MB out, peak {peak / 1e6:.2f} MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Measure `Gradient` against coloring a line with one `Text` call per character.
+
+Usage:
+    python benchmarks/gradient_render.py [width]
+
+Both the NumPy path and the pure-Python path of `Gradient` are timed; the pure path is forced by hiding NumPy,
+so the script also runs, with that path only, where NumPy is not installed. The per-character reference gets
+its colors from the same path and formats one escape code per character. Output sizes are reported as well,
+since `Gradient` shares one code between neighboring characters of equal color.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from BetterCommandline import Colors, Gradient, Terminal, Text
+
+
+def per_character(gradient:Gradient, text:str) -> str:
+    return ''.join( Text( rgb )( char ) for char, rgb in zip( text, gradient.colors( len( text ) ) ) )
+
+
+def microseconds(function, repeat:int=200) -> float:
+    function()
+    best = float('inf')
+    for _ in range( 5 ):
+        start = time.perf_counter()
+        for _ in range( repeat ):
+            function()
+        best = min( best, ( time.perf_counter() - start ) / repeat )
+    return best * 1e6
+
+
+def run(label:str, gradients:list, text:str) -> None:
+    print(label)
+    for name, gradient in gradients:
+        fast, slow = gradient( text ), per_character( gradient, text )
+        print(f'    {name:<6}: Gradient {microseconds( lambda: gradient( text ) ):7.0f} us ({len( fast ):5d} chars)'
+              f'   per-character Text {microseconds( lambda: per_character( gradient, text ) ):7.0f} us ({len( slow ):5d} chars)')
+
+
+def main() -> None:
+    width = int( sys.argv[1] ) if len( sys.argv ) > 1 else 180
+    Terminal.set_mode( Terminal.TRUECOLOR )
+    text      = ( 'BetterCommandline gradient header ' * ( width // 34 + 1 ) )[:width]
+    stops     = [ Colors.RED1, Colors.GOLD1, Colors.GREEN1, Colors.DODGERBLUE1 ]
+    gradients = [ ( 'rgb', Gradient( stops ) ), ( 'oklab', Gradient( stops, space='oklab' ) ) ]
+    print(f'{width}-character line, best of 5')
+
+    try:
+        import numpy
+    except ImportError:
+        print('NumPy is not installed')
+    else:
+        run( f'NumPy {numpy.__version__}', gradients, text )
+
+    # `Gradient.sample` falls back to pure Python when `import numpy` fails, which a `None` entry causes.
+    saved = sys.modules.get( 'numpy' )
+    sys.modules['numpy'] = None
+    try:
+        run( 'pure Python', gradients, text )
+    finally:
+        if saved is None:
+            del sys.modules['numpy']
+        else:
+            sys.modules['numpy'] = saved
+
+
+if __name__ == '__main__':
+    main()
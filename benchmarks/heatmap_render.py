@@ -0,0 +1,58 @@
+"""
+Measure `Heatmap` render time for terminal-sized frames. Needs NumPy.
+
+Usage:
+    python benchmarks/heatmap_render.py [columns] [rows]
+
+A smooth heatmap (long runs of equal cells) and random RGB noise (no runs at all) are rendered in 24-bit and
+256-color mode and compared with formatting two escape codes for every cell in a Python loop.
+"""
+
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from BetterCommandline import ANSI, Colored, Heatmap, Terminal
+
+
+def per_cell(heatmap:Heatmap, data) -> str:
+    # Reference renderer: one foreground and one background code per cell.
+    colors = heatmap.pack( data ).tolist()
+    lines  = []
+    for top, bottom in zip( colors[0::2], colors[1::2] ):
+        cells = [ Colored.Foreground( ( a >> 16 & 255, a >> 8 & 255, a & 255 ) ) + Colored.Background( ( b >> 16 & 255, b >> 8 & 255, b & 255 ) ) + '▀'
+                  for a, b in zip( top, bottom ) ]
+        lines.append( ''.join( cells ) + ANSI.RESET )
+    return '\n'.join( lines )
+
+
+def milliseconds(function, repeat:int=20) -> float:
+    function()
+    start = time.perf_counter()
+    for _ in range( repeat ):
+        function()
+    return ( time.perf_counter() - start ) / repeat * 1e3
+
+
+def main() -> None:
+    columns = int( sys.argv[1] ) if len( sys.argv ) > 1 else 200
+    rows    = int( sys.argv[2] ) if len( sys.argv ) > 2 else 50
+    x, y    = numpy.meshgrid( numpy.linspace( 0, 6, columns ), numpy.linspace( 0, 3, 2 * rows ) )
+    frames  = { 'smooth heatmap': numpy.sin( x ) * numpy.cos( y ),
+                'random RGB'    : numpy.random.default_rng( 0 ).integers( 0, 256, ( 2 * rows, columns, 3 ) ) }
+    heatmap = Heatmap()
+    print(f'{columns}x{rows} cells')
+    for mode in ( 'truecolor', '256' ):
+        Terminal.set_mode( mode )
+        for name, data in frames.items():
+            size = len( heatmap( data ).encode() )
+            print(f'{mode:>9} {name:<15}: Heatmap {milliseconds( lambda: heatmap( data ) ):6.1f} ms ({size / 1e3:.0f} kB), '
+                  f'per cell {milliseconds( lambda: per_cell( heatmap, data ), 5 ):6.1f} ms ({len( per_cell( heatmap, data ).encode() ) / 1e3:.0f} kB)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Measure `Highlighter` throughput against applying one regex per rule.
+
+Usage:
+    python benchmarks/highlight_throughput.py [megabytes] [extra_rules]
+
+Both approaches produce the same output: the per-rule baseline collects the matches of every rule separately and
+keeps the leftmost, highest-priority ones, which is the overlap policy `Highlighter` gets from a single scan.
+`extra_rules` adds keyword rules to show how each approach scales with the number of rules.
+"""
+
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from BetterCommandline import ANSI, Colors, Highlighter, Terminal, Text
+
+
+LEVELS = ['DEBUG', 'INFO', 'INFO', 'INFO', 'WARNING', 'ERROR']
+WORDS  = 'request served user cache miss upstream timeout retry connection pool worker started finished'.split()
+
+
+def log_lines(size:int) -> list:
+    random.seed( 7 )
+    lines, total = [], 0
+    while total < size:
+        line = ( f'2024-05-{random.randint( 1, 28 ):02d} 12:{random.randint( 0, 59 ):02d}:{random.randint( 0, 59 ):02d} '
+                 f'{random.choice( LEVELS )} [worker-{random.randint( 1, 16 )}] '
+                 f'{" ".join( random.choices( WORDS, k=random.randint( 4, 10 ) ) )} '
+                 f'from 10.{random.randint( 0, 255 )}.{random.randint( 0, 255 )}.{random.randint( 1, 254 )} '
+                 f'in {random.random() * 900:.1f} ms status={random.choice( [200, 200, 304, 404, 500] )}\n' )
+        lines.append( line )
+        total += len( line )
+    return lines
+
+
+def rules(extra:int) -> list:
+    base = [ (r'\b(?:ERROR|FATAL)\b', Text( Colors.RED1, ANSI.BOLD )),
+             (r'\bWARNING\b', Text( Colors.ORANGE1 )),
+             (r'\b(?:INFO|DEBUG)\b', Text( Colors.GREEN1 )),
+             (r'\b\d{1,3}(?:\.\d{1,3}){3}\b', Text( Colors.CADETBLUE1 )),
+             (r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', Text( Colors.GRAY50 )),
+             (r'\b\d+(?:\.\d+)?\b', Text( Colors.GOLD1 )) ]
+    keywords = [ (rf'\bkeyword{index}\b', Text( Colors.MAGENTA )) for index in range( extra ) ]
+    return base[:-1] + keywords + base[-1:]
+
+
+def per_rule(compiled:list):
+    def highlight(line:str) -> str:
+        spans = []
+        for priority, ( pattern, style ) in enumerate( compiled ):
+            spans.extend( ( match.start(), priority, match.end(), style ) for match in pattern.finditer( line ) if match.end() > match.start() )
+        if not spans:
+            return line
+        spans.sort()
+        output, last = [], 0
+        for start, _, end, style in spans:
+            if start >= last:
+                output.append( line[last:start] )
+                output.append( style( line[start:end] ) )
+                last = end
+        output.append( line[last:] )
+        return ''.join( output )
+    return highlight
+
+
+def throughput(function, lines:list, size:int) -> float:
+    start = time.perf_counter()
+    for line in lines:
+        function( line )
+    return size / ( time.perf_counter() - start ) / 1e6
+
+
+def main() -> None:
+    megabytes = float( sys.argv[1] ) if len( sys.argv ) > 1 else 4
+    Terminal.set_mode('truecolor')
+    lines = log_lines( int( megabytes * 1e6 ) )
+    size  = sum( map( len, lines ) )
+    print(f'{len( lines )} lines, {size / 1e6:.1f} MB')
+    for extra in ( [int( sys.argv[2] )] if len( sys.argv ) > 2 else [0, 20] ):
+        table       = rules( extra )
+        highlighter = Highlighter( table )
+        baseline    = per_rule( [ ( re.compile( pattern ), style ) for pattern, style in table ] )
+        assert all( highlighter( line ) == baseline( line ) for line in lines[:2000] )
+        print(f'{len( table ):3d} rules   single pass: {throughput( highlighter, lines, size ):6.1f} MB/s'
+              f'   one regex per rule: {throughput( baseline, lines, size ):6.1f} MB/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Measure how long `import BetterCommandline` takes in a fresh interpreter.
+
+Usage:
+    python benchmarks/import_time.py [runs]
+
+Each run starts a new interpreter, so the figure includes the package and everything it imports,
+minus the cost of starting Python itself.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from statistics import median
+
+
+ROOT = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+
+
+def timed(code:str, runs:int) -> float:
+    samples = []
+    for _ in range( runs ):
+        start = time.perf_counter()
+        subprocess.run( [sys.executable, '-c', code], cwd=ROOT, check=True )
+        samples.append( time.perf_counter() - start )
+    return median( samples )
+
+
+def main() -> None:
+    runs     = int( sys.argv[1] ) if len( sys.argv ) > 1 else 30
+    baseline = timed( 'pass', runs )
+    imported = timed( 'import BetterCommandline', runs )
+    palette  = timed( 'import BetterCommandline; BetterCommandline.Colors.RED1', runs )
+    print(f'interpreter startup         : {baseline * 1e3:7.2f} ms')
+    print(f'import BetterCommandline    : {( imported - baseline ) * 1e3:7.2f} ms')
+    print(f'  + first Colors access     : {( palette - baseline ) * 1e3:7.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Measure compiled `Markup` templates against the equivalent hand-nested `Text` calls.
+
+Usage:
+    python benchmarks/markup_render.py [calls]
+
+Each case renders the same line both ways, once with one styled field and a slot and once with three styled
+slots. Nested calls are timed with the `Text` objects built inline, as they usually are written, and built
+once up front. Templates are compiled once, then only their slots are filled.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from BetterCommandline import ANSI, Colors, Markup, Terminal, Text
+
+
+def per_call(function, calls:int) -> float:
+    # Best of seven runs, in nanoseconds per call.
+    return min( timeit.repeat( function, number=calls, repeat=7 ) ) / calls * 1e9
+
+
+def main() -> None:
+    calls = int( sys.argv[1] ) if len( sys.argv ) > 1 else 200_000
+    Terminal.set_mode( Terminal.TRUECOLOR )
+    msg, when, level = 'disk almost full', '12:00:01', 'ERROR'
+
+    warn     = Text( '#ff8800', ANSI.BOLD )
+    one      = Markup.compile( '[#ff8800 bold]WARN[/] {msg}' )
+    assert one( msg=msg ) == f'{warn("WARN")} {msg}'
+
+    grey, red, cadet = Text( Colors.GRAY50 ), Text( Colors.RED1, ANSI.BOLD ), Text( Colors.CADETBLUE1 )
+    three    = Markup.compile( '[gray50]{when}[/] [red1 bold]{level}[/] [cadet_blue_1]{msg}[/]' )
+    assert three( when=when, level=level, msg=msg ) == f'{grey(when)} {red(level)} {cadet(msg)}'
+
+    cases = [
+        ( 'one field, Text inline',      lambda: f'{Text( "#ff8800", ANSI.BOLD )( "WARN" )} {msg}' ),
+        ( 'one field, Text prebuilt',    lambda: f'{warn( "WARN" )} {msg}' ),
+        ( 'one field, template',         lambda: one( msg=msg ) ),
+        ( 'three slots, Text inline',    lambda: f'{Text( Colors.GRAY50 )( when )} {Text( Colors.RED1, ANSI.BOLD )( level )} '
+                                                 f'{Text( Colors.CADETBLUE1 )( msg )}' ),
+        ( 'three slots, Text prebuilt',  lambda: f'{grey( when )} {red( level )} {cadet( msg )}' ),
+        ( 'three slots, template',       lambda: three( when=when, level=level, msg=msg ) ),
+    ]
+    print(f'{calls} renders, ns per call (best of 7)')
+    for name, function in cases:
+        print(f'    {name:<28}: {per_call( function, calls ):7.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Measure `Palette.nearest` (k-d tree) against a linear scan over the full `Colors` palette.
+
+Usage:
+    python benchmarks/palette_nearest.py [queries]
+
+Random colors are matched both ways; the scan keeps the first color at the smallest squared RGB distance, and
+every tree result is checked to be at that same distance (ties may pick a different name).
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from BetterCommandline import Palette
+
+
+def linear(items:list, rgb:tuple) -> tuple:
+    r, g, b = rgb
+    best, best_distance = None, float('inf')
+    for name, ( pr, pg, pb ) in items:
+        distance = (pr-r)**2 + (pg-g)**2 + (pb-b)**2
+        if distance < best_distance:
+            best, best_distance = ( name, ( pr, pg, pb ) ), distance
+    return best
+
+
+def distance(a:tuple, b:tuple) -> int:
+    return sum( ( x - y ) ** 2 for x, y in zip( a, b ) )
+
+
+def microseconds(function, queries:list) -> float:
+    best = float('inf')
+    for _ in range( 5 ):
+        start = time.perf_counter()
+        for rgb in queries:
+            function( rgb )
+        best = min( best, ( time.perf_counter() - start ) / len( queries ) )
+    return best * 1e6
+
+
+def main() -> None:
+    count   = int( sys.argv[1] ) if len( sys.argv ) > 1 else 2000
+    random.seed( 3 )
+    queries = [ tuple( random.randrange( 256 ) for _ in range( 3 ) ) for _ in range( count ) ]
+    palette = Palette.default()
+    items   = list( palette.items() )
+    palette.nearest( queries[0] )   # Builds the tree, outside of the timing.
+
+    assert all( distance( palette.nearest( rgb )[1], rgb ) == distance( linear( items, rgb )[1], rgb ) for rgb in queries )
+    print(f'{len( palette )} palette colors, {count} random queries, us per query (best of 5)')
+    print(f'    linear scan : {microseconds( lambda rgb: linear( items, rgb ), queries ):7.1f}')
+    print(f'    k-d tree    : {microseconds( palette.nearest, queries ):7.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Measure plain-mode `Text`, `Alias` and `Utility.date` calls against `str.join`.
+
+Usage:
+    python benchmarks/plain_output.py [calls]
+
+In plain mode (`NO_COLOR`, non-tty output or `Terminal.set_mode('none')`) styled calls return the bare text
+after a single flag check. The floor for any such call is a Python function taking `*parts` and joining them,
+shown next to `' '.join` itself; truecolor timings show what plain mode saves.
+"""
+
+import os
+import sys
+import timeit
+from datetime import datetime
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from BetterCommandline import ANSI, Alias, Colors, Terminal, Text, Utility
+
+
+def per_call(function, calls:int) -> float:
+    # Best of five runs, in nanoseconds per call.
+    return min( timeit.repeat( function, number=calls, repeat=5 ) ) / calls * 1e9
+
+
+def joined(*parts:str, sep:str=' ') -> str:
+    return sep.join( parts )
+
+
+def main() -> None:
+    calls = int( sys.argv[1] ) if len( sys.argv ) > 1 else 1_000_000
+    parts = ( 'request', 'served' )
+    text  = Text( Colors.CADETBLUE1, ANSI.BOLD )
+    alias = Alias( 'INFO', Colors.WHITE, Colors.SEAGREEN3, banner_width=8 )
+    now   = datetime( 2024, 5, 1, 12, 0, 0, 123456 )
+
+    print(f'{calls} calls with two parts, ns per call (best of 5)')
+    print(f'    {"str.join":<26}: {per_call( lambda: " ".join( parts ), calls ):6.0f}')
+    print(f'    {"function + join (floor)":<26}: {per_call( lambda: joined( *parts ), calls ):6.0f}')
+    for mode in ( Terminal.NONE, Terminal.TRUECOLOR ):
+        Terminal.set_mode( mode )
+        print(f'    {"Text, " + mode:<26}: {per_call( lambda: text( *parts ), calls ):6.0f}')
+        print(f'    {"Alias.Banner, " + mode:<26}: {per_call( lambda: alias.Banner, calls ):6.0f}')
+        print(f'    {"Utility.date, " + mode:<26}: {per_call( lambda: Utility.date( now, Colors.GRAY60 ), calls // 10 ):6.0f}')
+
+if __name__ == '__main__':
+    main()
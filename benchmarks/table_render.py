@@ -0,0 +1,88 @@
+"""
+Measure `Table` rendering time and memory at 10k and 1M rows.
+
+Usage:
+    python benchmarks/table_render.py [rows ...]
+
+Job-status rows (name, state, attempts, seconds) are generated lazily and rendered into a null stream, so only
+rendering is timed. `Table` is compared with hand-rolled padding around `Text` over a materialized list, the way
+job tables were printed before. Peak memory (`tracemalloc`) shows that the table stays bounded by its sample window.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from BetterCommandline import ANSI, Colors, Column, Table, Terminal, Text
+
+
+STATES = ('queued', 'running', 'running', 'done', 'done', 'done', 'failed')
+
+
+class Null:
+    # Text sink that only counts what is written.
+
+    def __init__(self) -> None:
+        self.size = 0
+
+    def write(self, text:str) -> int:
+        self.size += len( text )
+        return len( text )
+
+    def flush(self) -> None:
+        pass
+
+
+def jobs(count:int):
+    for index in range( count ):
+        yield ( f'job-{index % 5000:05d}', STATES[index % len( STATES )], index % 4, round( ( index * 7919 % 10007 ) / 100, 2 ) )
+
+
+def table() -> Table:
+    return Table( [ Column( 'job', Text( Colors.CADETBLUE1 ) ), Column( 'state', Text( Colors.GOLD1 ) ),
+                    Column( 'attempts', align='right' ), Column( 'seconds', Text( Colors.GRAY70 ), align='right' ) ],
+                  header_style=Text( Colors.WHITE, ANSI.BOLD ) )
+
+
+def hand_rolled(count:int, stream) -> None:
+    # Reference: materialize every row, measure, then pad and style each cell.
+    rows   = list( jobs( count ) )
+    widths = [ max( len( str( row[index] ) ) for row in rows ) for index in range( 4 ) ]
+    styles = [ Text( Colors.CADETBLUE1 ), Text( Colors.GOLD1 ), None, Text( Colors.GRAY70 ) ]
+    lines  = []
+    for row in rows:
+        cells = []
+        for index, value in enumerate( row ):
+            cell = str( value ).ljust( widths[index] ) if index < 2 else str( value ).rjust( widths[index] )
+            cells.append( styles[index]( cell ) if styles[index] else cell )
+        lines.append( '  '.join( cells ) )
+    stream.write( '\n'.join( lines ) + '\n' )
+
+
+def measure(function) -> tuple:
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    counts = [ int( count ) for count in sys.argv[1:] ] or [ 10_000, 1_000_000 ]
+    Terminal.set_mode( 'truecolor' )
+    for count in counts:
+        print(f'{count} rows')
+        for name, function in ( ( 'Table.write', lambda: table().write( jobs( count ), Null() ) ),
+                                ( 'hand-rolled', lambda: hand_rolled( count, Null() ) ) ):
+            elapsed, peak = measure( function )
+            print(f'    {name:<12}: {elapsed * 1e3:9.1f} ms, {count / elapsed / 1e3:7.0f} k rows/s, peak {peak / 1e6:7.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Measure `Timestamp` against `Utility.date` per rendered timestamp.
+
+Usage:
+    python benchmarks/timestamp.py [calls]
+
+`Utility.date` formats the whole `datetime` and styles it on every call; `Timestamp` only formats the
+sub-second digits while the second is unchanged. A new `Text` per call shows what `Utility.date` cost before it
+kept one `Text` per color. Timestamps advance by 1 ms per call, so every thousandth call renders a new second.
+"""
+
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from BetterCommandline import Colors, Terminal, Text, Timestamp, Utility
+
+
+def per_call(function, values:list) -> float:
+    # Best of five passes over `values`, in nanoseconds per call.
+    return min( timeit.repeat( lambda: [ function( value ) for value in values ], number=1, repeat=5 ) ) / len( values ) * 1e9
+
+
+def main() -> None:
+    calls  = int( sys.argv[1] ) if len( sys.argv ) > 1 else 200_000
+    Terminal.set_mode( Terminal.TRUECOLOR )
+    color  = Colors.GRAY60
+    start  = datetime( 2024, 5, 1, 12, 0, 0, 1 )
+    dates  = [ start + timedelta( milliseconds=index ) for index in range( calls ) ]
+    epochs = [ value.timestamp() for value in dates ]
+    stamp  = Timestamp( color )
+
+    # Same text as `Utility.date` whenever the microseconds are non-zero, which `start` ensures.
+    assert all( stamp( value ) == Utility.date( value, color ) for value in dates[:5000] )
+    assert all( stamp( epoch ) == stamp( value ) for epoch, value in zip( epochs[:5000], dates ) )
+
+    print(f'{calls} timestamps, ns per call (best of 5)')
+    print(f'    new Text per call          : {per_call( lambda value: Text( foreground=color )( str( value ) ), dates ):7.0f}')
+    print(f'    Utility.date               : {per_call( lambda value: Utility.date( value, color ), dates ):7.0f}')
+    print(f'    Timestamp(datetime)        : {per_call( stamp, dates ):7.0f}')
+    print(f'    Timestamp(epoch float)     : {per_call( stamp, epochs ):7.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,12 @@
+import pytest
+
+from BetterCommandline import Terminal
+
+
+@pytest.fixture(autouse=True)
+def truecolor():
+    # Tests run with stdout captured, which `Terminal.detect` would turn into plain mode.
+    mode = Terminal.mode
+    Terminal.set_mode( Terminal.TRUECOLOR )
+    yield
+    Terminal.set_mode( mode )
@@ -0,0 +1,57 @@
+import pytest
+
+from BetterCommandline import Alias, Style, Terminal
+
+
+RED  = (255, 0, 0)
+BLUE = (0, 0, 255)
+
+
+def plain(alias:Alias) -> str:
+    Terminal.set_mode( Terminal.NONE )
+    return alias.Banner
+
+
+def test_banner_width_setter_matches_constructor():
+    alias = Alias( 'OK', RED, BLUE )
+    assert plain( alias ) == '[OK]'
+    alias.banner_width = 10
+    assert alias.Banner == plain( Alias( 'OK', RED, BLUE, banner_width=10 ) ) == '[   OK   ]'
+    assert alias.banner_width == 10
+    alias.banner_width = None
+    assert alias.Banner == '[OK]'
+
+
+def test_setters_invalidate_cached_forms():
+    alias  = Alias( 'OK', RED, BLUE, banner_width=6 )
+    banner = alias.Banner
+    assert alias.Banner is banner
+    alias.text = 'NO'
+    assert 'NO' in alias.Banner and alias.Banner is not banner
+    alias.background = RED
+    assert alias.Banner.startswith( '\x1b[38;2;255;0;0;48;2;255;0;0' )
+    alias.badge_sign = '!'
+    assert alias.Badge.endswith( '[!]\x1b[m' )
+
+
+def test_mode_change_invalidates_cached_forms():
+    alias = Alias( 'OK', RED, BLUE )
+    assert alias.Banner != plain( alias )
+
+
+def test_failed_color_assignment_keeps_previous_colors():
+    alias = Alias( 'A', RED, BLUE )
+    with pytest.raises( ValueError ):
+        alias.colors = ( RED, None )
+    assert alias.colors == ( RED, BLUE )
+    Terminal.set_mode( Terminal.COLOR256 )
+    assert alias.Banner.startswith( '\x1b[38;5;196;48;5;21' )
+
+
+def test_replacing_style_foreground_keeps_its_background():
+    alias = Alias( 'A', Style( RED, BLUE ) )
+    alias.foreground = (1, 2, 3)
+    assert alias.colors == ( (1, 2, 3), BLUE )
+    assert alias.codes[:2] == ( '\x1b[38;2;1;2;3m', '\x1b[48;2;0;0;255m' )
+    Terminal.set_mode( Terminal.COLOR256 )
+    assert alias.Badge
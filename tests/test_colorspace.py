@@ -0,0 +1,16 @@
+from BetterCommandline import ColorSpace, Gradient
+
+
+STOPS = [ (255, 0, 0), (0, 128, 255) ]
+
+
+def test_gradient_and_colorspace_share_oklab():
+    # The OKLab midpoint of a gradient is the average of its stops converted by `ColorSpace`.
+    start, end = ( ColorSpace.convert( stop, 'rgb', 'oklab' ) for stop in STOPS )
+    middle     = tuple( ( x + y ) / 2 for x, y in zip( start, end ) )
+    assert Gradient( STOPS, space='oklab' ).sample( [0.5] )[0] == ColorSpace.convert( middle, 'oklab', 'rgb' )
+
+
+def test_round_trips():
+    for space in ColorSpace.SPACES:
+        assert ColorSpace.convert( ColorSpace.convert( (12, 200, 99), 'rgb', space ), space, 'rgb' ) == (12, 200, 99)
@@ -0,0 +1,60 @@
+import asyncio
+import gc
+import io
+import logging
+import weakref
+
+from BetterCommandline import BackgroundHandler, Console
+
+
+def test_console_writes_records_in_order():
+    output = io.StringIO()
+    with Console( output ) as console:
+        for index in range( 100 ):
+            console.write( 'record', str( index ) )
+        console.flush()
+        assert console.records == 100
+    assert output.getvalue() == ''.join( f'record {index}\n' for index in range( 100 ) )
+
+
+def test_console_drain():
+    output  = io.StringIO()
+    console = Console( output )
+
+    async def main():
+        await console.awrite( 'a' )
+        await console.drain()
+
+    asyncio.run( main() )
+    assert output.getvalue() == 'a\n'
+    console.close()
+
+
+def test_unclosed_console_is_collected_and_flushed():
+    output  = io.StringIO()
+    console = Console( output )
+    console.write( 'pending' )
+    thread  = console._thread
+    ref     = weakref.ref( console )
+    del console
+    gc.collect()
+    assert ref() is None
+    assert not thread.is_alive()
+    assert output.getvalue() == 'pending\n'
+
+
+def test_background_handler():
+    output  = io.StringIO()
+    handler = BackgroundHandler( output )
+    handler.setFormatter( logging.Formatter( '%(levelname)s %(message)s' ) )
+    logger  = logging.getLogger( 'tests.background' )
+    logger.addHandler( handler )
+    logger.propagate = False
+    try:
+        for index in range( 10 ):
+            logger.warning( 'line %d', index )
+        handler.flush()
+        assert output.getvalue() == ''.join( f'WARNING line {index}\n' for index in range( 10 ) )
+    finally:
+        logger.removeHandler( handler )
+        handler.close()
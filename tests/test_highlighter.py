@@ -0,0 +1,41 @@
+import importlib
+import io
+
+import pytest
+
+from BetterCommandline import Highlighter, Text
+
+
+RED = (255, 0, 0)
+
+
+def test_bytes_lines():
+    highlight = Highlighter( [ ( rb'ERROR', Text( RED ) ) ] )
+    assert list( highlight.lines( [ b'an ERROR\n', b'ok\n' ] ) ) == [ b'an \x1b[38;2;255;0;0mERROR\x1b[m\n', b'ok\n' ]
+
+
+def test_bytes_write():
+    highlight = Highlighter( [ ( rb'ERROR', Text( RED ) ) ] )
+    output    = io.BytesIO()
+    assert highlight.write( [ b'an ERROR\n', b'ok\n', b'ERROR\n' ], output, chunk_size=2 ) == 3
+    assert output.getvalue() == b'an \x1b[38;2;255;0;0mERROR\x1b[m\nok\n\x1b[38;2;255;0;0mERROR\x1b[m\n'
+
+
+def test_str_write():
+    highlight = Highlighter( [ ( r'\d+', Text( RED ) ) ] )
+    output    = io.StringIO()
+    assert highlight.write( [ 'took 12 ms\n' ], output ) == 1
+    assert output.getvalue() == 'took \x1b[38;2;255;0;0m12\x1b[m ms\n'
+
+
+def test_duplicate_group_names_name_the_rule():
+    with pytest.raises( ValueError, match=r"'\(\?P<n>b\)' conflicts with an earlier rule" ):
+        Highlighter( [ ( r'(?P<n>a)', Text( RED ) ), ( r'x', Text( RED ) ), ( r'(?P<n>b)', Text( RED ) ) ] )
+
+
+def test_without_parser_rules_are_matched_unfiltered(monkeypatch):
+    # The package exports the class under the module's name.
+    monkeypatch.setattr( importlib.import_module( 'BetterCommandline.Highlighter' ), '_sre_parse', None )
+    highlight = Highlighter( [ ( r'\d+', Text( RED ) ) ] )
+    assert highlight.pattern.pattern == r'(\d+)'
+    assert highlight( 'a 1' ) == 'a \x1b[38;2;255;0;0m1\x1b[m'
@@ -0,0 +1,135 @@
+import io
+import random
+import re
+
+from BetterCommandline import ANSI, Live, Text, Width
+
+
+_ESCAPE = re.compile(r'\033\[([0-9;?]*)([A-Za-z])')
+
+
+class Screen:
+    # Minimal terminal emulator for what `Live` emits: text (wide characters take two columns), `\r`, `\n`,
+    # cursor up/down/forward, line clearing and `SGR` colors and attributes.
+
+    def __init__(self) -> None:
+        self.rows   = []
+        self.row    = 0
+        self.column = 0
+        self.style  = ( None, None, frozenset() )
+
+    def feed(self, data:str) -> None:
+        index = 0
+        for match in _ESCAPE.finditer( data ):
+            self._text( data[index:match.start()] )
+            self._escape( match.group(1), match.group(2) )
+            index = match.end()
+        self._text( data[index:] )
+
+    def lines(self) -> list:
+        # Each row as (char, style) cells, without trailing unstyled blanks.
+        blank  = ( ' ', ( None, None, frozenset() ) )
+        result = []
+        for row in self.rows:
+            cells = [ row.get( column, blank ) for column in range( max( row, default=-1 ) + 1 ) ]
+            while cells and cells[-1] == blank:
+                cells.pop()
+            result.append( cells )
+        return result
+
+    def _line(self) -> dict:
+        while len( self.rows ) <= self.row:
+            self.rows.append( {} )
+        return self.rows[self.row]
+
+    def _text(self, text:str) -> None:
+        for char in text:
+            if char == '\n':
+                self.row, self.column = self.row + 1, 0
+                self._line()
+            elif char == '\r':
+                self.column = 0
+            else:
+                line = self._line()
+                line[self.column] = ( char, self.style )
+                if Width.measure( char ) == 2:
+                    line[self.column + 1] = ( '', self.style )
+                self.column += Width.measure( char )
+
+    def _escape(self, parameters:str, command:str) -> None:
+        count = int( parameters ) if parameters.isdigit() else 1
+        if command == 'A':
+            self.row = max( self.row - count, 0 )
+        elif command == 'B':
+            self.row += count
+        elif command == 'C':
+            self.column += count
+        elif command == 'K':
+            line = self._line()
+            for column in [ column for column in line if parameters == '2' or column >= self.column ]:
+                del line[column]
+        elif command == 'm':
+            self._sgr( [ int( value ) if value else 0 for value in parameters.split(';') ] )
+
+    def _sgr(self, values:list) -> None:
+        foreground, background, attributes = self.style
+        index = 0
+        while index < len( values ):
+            value = values[index]
+            if value == 0:
+                foreground, background, attributes = None, None, frozenset()
+            elif value in ( 38, 48 ):
+                size  = 3 if values[index + 1] == 5 else 5
+                color = tuple( values[index + 1:index + size] )
+                foreground, background = ( color, background ) if value == 38 else ( foreground, color )
+                index += size - 1
+            else:
+                attributes = attributes | { value }
+            index += 1
+        self.style = ( foreground, background, attributes )
+
+
+def expected(frame:list) -> list:
+    screen = Screen()
+    for line in frame:
+        screen.feed( line + ANSI.RESET + '\n' )
+    return screen.lines()[:len( frame )]
+
+
+def random_line(rng:random.Random) -> str:
+    parts = []
+    for _ in range( rng.randint( 0, 4 ) ):
+        text = ''.join( rng.choice( 'ab xyz日本' ) for _ in range( rng.randint( 1, 6 ) ) )
+        if rng.random() < 0.3:
+            parts.append( text )
+        else:
+            color = rng.choice( [ (255, 0, 0), (0, 128, 255), (10, 200, 10) ] )
+            parts.append( Text( color, rng.choice( [ None, ANSI.BOLD ] ) )( text ) )
+    return ''.join( parts )
+
+
+def test_diff_reproduces_every_frame():
+    rng = random.Random( 5 )
+    for _ in range( 300 ):
+        live, screen = Live( io.StringIO() ), Screen()
+        frame = []
+        for _ in range( rng.randint( 1, 6 ) ):
+            if frame and rng.random() < 0.5:
+                # Mostly small edits, which exercise the partial line rewrites.
+                frame = list( frame )
+                index = rng.randrange( len( frame ) )
+                frame[index] = random_line( rng ) if rng.random() < 0.5 else frame[index] + random_line( rng )
+            else:
+                frame = [ random_line( rng ) for _ in range( rng.randint( 0, 4 ) ) ]
+            screen.feed( live.diff( frame ) )
+            lines = screen.lines()
+            assert lines[:len( frame )] == expected( frame )
+            assert all( not line for line in lines[len( frame ):] )
+            assert ( screen.row, screen.column ) == ( live._height, 0 )
+
+
+def test_unchanged_frame_writes_no_text():
+    live  = Live( io.StringIO() )
+    frame = [ Text( (255, 0, 0) )( 'status' ), 'line two' ]
+    live.diff( frame )
+    assert live.diff( frame ) == '\r'
@@ -0,0 +1,13 @@
+import pytest
+
+from BetterCommandline import Markup
+
+
+def test_unknown_conversion_is_a_value_error():
+    with pytest.raises( ValueError, match='unknown conversion' ):
+        Markup.compile( '[bold]{a!x}[/]' )
+
+
+def test_slots_with_conversion_and_spec():
+    template = Markup.compile( '[bold]{0!r:>5}[/] {name:.2f}' )
+    assert template( 'x', name=1.5 ) == "\x1b[1m  'x'\x1b[m 1.50"
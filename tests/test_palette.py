@@ -0,0 +1,26 @@
+import random
+
+from BetterCommandline import Palette
+
+
+def linear(palette:Palette, rgb:tuple) -> int:
+    return min( sum( ( a - b ) ** 2 for a, b in zip( value, rgb ) ) for _, value in palette.items() )
+
+
+def test_nearest_matches_a_linear_scan():
+    palette = Palette.default()
+    random.seed( 11 )
+    queries = [ tuple( random.randrange( 256 ) for _ in range( 3 ) ) for _ in range( 300 ) ]
+    queries += [ (0, 0, 0), (255, 255, 255), (128, 128, 128) ]
+    for rgb in queries:
+        name, value = palette.nearest( rgb )
+        assert palette[name] == value
+        assert sum( ( a - b ) ** 2 for a, b in zip( value, rgb ) ) == linear( palette, rgb )
+
+
+def test_small_palette():
+    palette = Palette( { 'black': (0, 0, 0), 'white': (255, 255, 255), 'dark red': (139, 0, 0) } )
+    assert palette.nearest( (200, 10, 10) ) == ( 'DARKRED', (139, 0, 0) )
+    assert palette.nearest( (250, 250, 240) ) == ( 'WHITE', (255, 255, 255) )
+    assert palette.name_of( (0, 0, 0) ) == 'BLACK'
+    assert palette['Dark-Red'] == (139, 0, 0)
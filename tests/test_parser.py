@@ -0,0 +1,51 @@
+from BetterCommandline import ANSI, AnsiParser, Span, Style, Text
+
+
+def sample() -> str:
+    # Built per test, once the fixture has switched to truecolor.
+    return ( 'plain ' + Text( (255, 0, 0), ANSI.BOLD )( 'red bold' ) + ' \033[38;5;33mblue\033[49;44m on\033[0m '
+             + '\033]8;;https://example.com\033\\link\033]8;;\033\\ \033]0;title\007\033[2K\033[3Acursor \033Mx'
+             + '\033[1;3;4mstyled\033[22m\033[m\033[97;100mbright\033[39;49m日本\033[m end' )
+
+
+def merged(spans:list) -> list:
+    # Chunk boundaries may split a span in two; only the styled text matters.
+    result = []
+    for style, text in spans:
+        if result and result[-1][0] is style:
+            result[-1] = Span( style, result[-1][1] + text )
+        elif text:
+            result.append( Span( style, text ) )
+    return result
+
+
+def fed(chunks:list) -> list:
+    parser = AnsiParser()
+    spans  = []
+    for chunk in chunks:
+        spans.extend( parser.feed( chunk ) )
+    return merged( spans + parser.close() )
+
+
+def test_every_split_point_matches_a_single_parse():
+    text  = sample()
+    whole = merged( AnsiParser.parse( text ) )
+    for index in range( len( text ) + 1 ):
+        assert fed( [ text[:index], text[index:] ] ) == whole, index
+
+
+def test_one_character_chunks_match_a_single_parse():
+    text = sample()
+    assert fed( list( text ) ) == merged( AnsiParser.parse( text ) )
+
+
+def test_escapes_are_dropped_and_styles_decoded():
+    spans = merged( AnsiParser.parse( sample() ) )
+    assert ''.join( text for _, text in spans ) == 'plain red bold blue on link cursor xstyledbright日本 end'
+    assert spans[1] == Span( Style( (255, 0, 0), attributes=Style.BOLD ), 'red bold' )
+
+
+def test_close_returns_an_unfinished_sequence_as_text():
+    parser = AnsiParser()
+    assert parser.feed( 'abc\033[38;2;1' ) == [ Span( Style(), 'abc' ) ]
+    assert parser.close() == [ Span( Style(), '\033[38;2;1' ) ]
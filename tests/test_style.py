@@ -0,0 +1,50 @@
+import io
+
+from BetterCommandline import ANSI, Alias, Style, StyledStream, Text
+
+
+RED  = (255, 0, 0)
+BLUE = (0, 0, 255)
+
+
+def written(*calls) -> str:
+    output = io.StringIO()
+    stream = StyledStream( output )
+    for method, *arguments in calls:
+        getattr( stream, method )( *arguments )
+    stream.flush()
+    return output.getvalue()
+
+
+def test_text_with_style_foreground_keeps_background_and_attributes():
+    styler = Text( Style( RED, BLUE, Style.BOLD ) )
+    assert written( ('text', styler, 'x') ) == '\x1b[38;2;255;0;0;48;2;0;0;255;1mx'
+    assert styler.prefix == ANSI.combine( *styler.codes )
+
+
+def test_text_with_style_style():
+    styler = Text( RED, Style( attributes=Style.ITALICS ) )
+    assert written( ('text', styler, 'x') ) == '\x1b[38;2;255;0;0;3mx'
+
+
+def test_alias_with_style_foreground():
+    alias = Alias( 'A', Style( RED, BLUE, Style.BOLD ) )
+    assert alias.Banner == '\x1b[38;2;255;0;0;48;2;0;0;255;1m[A]\x1b[m'
+    assert written( ('banner', alias) ) == '\x1b[38;2;255;0;0;48;2;0;0;255;1m[A]'
+    assert written( ('badge', alias) ) == '\x1b[38;2;255;0;0;48;2;0;0;255;1m[ ]'
+
+
+def test_alias_with_style_style():
+    alias = Alias( 'A', RED, BLUE, style=Style( attributes=Style.UNDERLINED ) )
+    assert written( ('banner', alias) ) == '\x1b[38;2;255;0;0;48;2;0;0;255;4m[A]'
+
+
+def test_stream_elides_unchanged_codes_between_styles():
+    styler = Text( Style( RED, attributes=Style.BOLD ) )
+    assert written( ('text', styler, 'a'), ('text', styler, 'b') ) == '\x1b[38;2;255;0;0;1mab'
+
+
+def test_write_accepts_styles():
+    assert written( ('write', 'x', None, None, Style( attributes=Style.BOLD )) ) == '\x1b[1mx'
+    assert written( ('write', 'x', Style( RED, BLUE, Style.BOLD )) ) == '\x1b[38;2;255;0;0;48;2;0;0;255;1mx'
+    assert written( ('write', 'x', None, None, Style( RED, attributes=Style.ITALICS )) ) == '\x1b[38;2;255;0;0;3mx'
@@ -0,0 +1,12 @@
+from BetterCommandline import Column, Table
+
+
+def test_equal_values_of_different_types_render_distinctly():
+    table = Table( [ Column( 'value' ) ] )
+    lines = list( table.rows( [ (1,), (True,), (1.0,), (0,), (False,) ] ) )
+    assert [ line.rstrip() for line in lines ] == [ '1', 'True', '1.0', '0', 'False' ]
+
+
+def test_unhashable_values_are_rendered():
+    table = Table( [ 'a', 'b' ] )
+    assert [ line.rstrip() for line in table.rows( [ ( [1], 'x' ), ( [1], 'y' ) ] ) ] == [ '[1]  x', '[1]  y' ]
@@ -0,0 +1,13 @@
+from BetterCommandline import Terminal
+
+
+def test_to_256_matches_a_full_search():
+    # The lookup tables must pick the same entry as comparing against all 240 cube and grey colors.
+    for rgb in [ (0, 0, 0), (255, 255, 255), (95, 135, 0), (118, 118, 118), (130, 40, 200), (8, 8, 9), (250, 5, 47) ]:
+        best = min( range( 16, 256 ), key=lambda index: sum( ( a - b ) ** 2 for a, b in zip( rgb, Terminal.from_256( index ) ) ) )
+        assert Terminal.from_256( Terminal.to_256( rgb ) ) == Terminal.from_256( best )
+
+
+def test_to_16():
+    assert Terminal.to_16( (250, 10, 10) ) == 9
+    assert Terminal.to_16( (0, 0, 0) ) == 0
@@ -0,0 +1,15 @@
+from BetterCommandline import Terminal, Timestamp
+
+
+def plain(stamp:Timestamp, when:float) -> str:
+    Terminal.set_mode( Terminal.NONE )
+    return stamp( when )
+
+
+def test_epoch_fraction_is_rounded():
+    assert plain( Timestamp( '#ffffff', fmt='%S', precision=3, utc=True ), 1700000000.998 ) == '20.998'
+    assert plain( Timestamp( '#ffffff', fmt='%S', precision=6, utc=True ), 1.000001 ) == '01.000001'
+
+
+def test_rounding_carries_into_the_next_second():
+    assert plain( Timestamp( '#ffffff', fmt='%S', precision=6, utc=True ), 1.9999999 ) == '02.000000'
@@ -0,0 +1,15 @@
+from BetterCommandline import Width
+
+
+def test_controls_are_zero_width():
+    assert Width.measure( 'a\x00b' ) == 2
+    assert Width.measure( 'a\x7fb\x1b' ) == 2
+    assert Width.measure( '\x1b[31ma\tb\x1b[m' ) == 2
+    assert Width.ljust( 'a\x07', 3 ) == 'a\x07  '
+
+
+def test_wide_and_styled_text():
+    assert Width.measure( '日本語' ) == 6
+    assert Width.measure( '\x1b[38;2;255;0;0m日本\x1b[m' ) == 4
+    assert Width.strip( '\x1b]8;;http://x\x1b\\link\x1b]8;;\x1b\\' ) == 'link'
+    assert Width.measure( 'plain' ) == 5